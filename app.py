@@ -3,15 +3,18 @@ PyHomework - Main application window and navigation
 Manages the root Tkinter window and view switching
 """
 
+import importlib
 import tkinter as tk
 from tkinter import ttk
-from db.database import initialize_database
+import startup_trace
+from db.database import initialize_database, close_connections
+from db.profiler import query_profiler
 from models.settings import Settings
+from logic.notifications import NotificationScheduler
 from ui.theme import ThemeManager
-from ui.dashboard import DashboardFrame
-from ui.course_form import CourseFormFrame
-from ui.assignment_form import AssignmentFormFrame
-from ui.settings_form import SettingsFormFrame
+from ui.background import BackgroundLoader
+from ui.change_watcher import ChangeWatcher
+from ui.profiler import ui_profiler
 
 
 class PyHomeworkApp:
@@ -22,123 +25,174 @@ class PyHomeworkApp:
         self.root = tk.Tk()
         self.root.title("PyHomework - Spring 2026 Assignment Tracker")
         self.root.geometry("900x700")
-        
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
+        ui_profiler.start(self.root)  # Event-loop lag probe, when enabled
+        startup_trace.mark("create window")
+
         # Initialize database on startup
         initialize_database()
+        startup_trace.mark("open database")
 
         # Initialize theme manager
         current_theme = Settings.get('theme_mode', 'light')
         self.theme_manager = ThemeManager(self.root, current_theme)
 
+        # Worker threads for model queries, so views never block the event loop
+        self.loader = BackgroundLoader(self.root)
+
         # Container for all frames
         self.container = tk.Frame(self.root)
         self.container.pack(fill="both", expand=True)
-        
-        # Navigation bar
+
+        # Navigation bar (built once; theme changes recolor it in place)
         self.create_navigation()
-        
-        # Content area where frames will be displayed
-        colors = self.theme_manager.get_colors()
-        self.content_frame = tk.Frame(self.container, bg=colors['bg'])
+
+        # Content area; views are stacked in the same grid cell and raised
+        self.content_frame = tk.Frame(self.container)
+        self.theme_manager.register(self.content_frame, bg='bg')
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Dictionary to store frame instances
+        self.content_frame.grid_rowconfigure(0, weight=1)
+        self.content_frame.grid_columnconfigure(0, weight=1)
+
+        # View instances, created on first visit and kept alive
         self.frames = {}
-        
+        self.current_frame_name = None
+
+        startup_trace.mark("build window chrome")
+
         # Show dashboard by default
         self.show_frame("dashboard")
-    
+        startup_trace.mark("build dashboard")
+
+        # Reminders and change polling aren't needed for the first paint;
+        # they start once the event loop is idle
+        self.scheduler = NotificationScheduler(self.root, self.on_reminder,
+                                               dispatch=self.loader.on_tk_thread)
+        self.watcher = ChangeWatcher(self.root, self.loader)
+        self.watcher.subscribe(self.on_data_changed)
+        self.root.after_idle(self.start_services)
+
+        # Debug window for the SQL profiler, when it is enabled
+        self.query_panel = None
+        if query_profiler.enabled:
+            self.root.bind("<F9>", self.open_query_panel)
+
+    # View name -> (module, frame class). Modules are imported on first
+    # visit, so startup only pays for the dashboard.
+    VIEWS = {
+        "dashboard": ("ui.dashboard", "DashboardFrame"),
+        "course_form": ("ui.course_form", "CourseFormFrame"),
+        "assignment_form": ("ui.assignment_form", "AssignmentFormFrame"),
+        "settings": ("ui.settings_form", "SettingsFormFrame"),
+    }
+
+    # (label, view name, side, bold) for each navigation button
+    NAV_BUTTONS = [
+        ("Dashboard", "dashboard", "left", True),
+        ("Add Course", "course_form", "left", False),
+        ("Add Assignment", "assignment_form", "left", False),
+        ("Settings", "settings", "right", False),
+    ]
+
     def create_navigation(self):
         """Create the navigation bar with buttons to switch between views."""
-        colors = self.theme_manager.get_colors()
-
-        nav_frame = tk.Frame(self.container, bg=colors['nav_bg'], height=50)
-        nav_frame.pack(fill="x", side="top")
+        self.nav_frame = tk.Frame(self.container, height=50)
+        self.theme_manager.register(self.nav_frame, bg='nav_bg')
+        self.nav_frame.pack(fill="x", side="top")
 
         # Navigation buttons
-        btn_dashboard = tk.Button(
-            nav_frame,
-            text="Dashboard",
-            command=lambda: self.show_frame("dashboard"),
-            bg=colors['nav_btn_bg'],
-            fg=colors['nav_fg'],
-            font=("Arial", 10, "bold"),
-            padx=15,
-            pady=10,
-            relief="flat"
-        )
-        btn_dashboard.pack(side="left", padx=5, pady=5)
-
-        btn_add_course = tk.Button(
-            nav_frame,
-            text="Add Course",
-            command=lambda: self.show_frame("course_form"),
-            bg=colors['nav_btn_bg'],
-            fg=colors['nav_fg'],
-            font=("Arial", 10),
-            padx=15,
-            pady=10,
-            relief="flat"
-        )
-        btn_add_course.pack(side="left", padx=5, pady=5)
-
-        btn_add_assignment = tk.Button(
-            nav_frame,
-            text="Add Assignment",
-            command=lambda: self.show_frame("assignment_form"),
-            bg=colors['nav_btn_bg'],
-            fg=colors['nav_fg'],
-            font=("Arial", 10),
-            padx=15,
-            pady=10,
-            relief="flat"
-        )
-        btn_add_assignment.pack(side="left", padx=5, pady=5)
-
-        btn_settings = tk.Button(
-            nav_frame,
-            text="Settings",
-            command=lambda: self.show_frame("settings"),
-            bg=colors['nav_btn_bg'],
-            fg=colors['nav_fg'],
-            font=("Arial", 10),
-            padx=15,
-            pady=10,
-            relief="flat"
-        )
-        btn_settings.pack(side="right", padx=5, pady=5)
-    
+        self.nav_buttons = {}
+        for label, name, side, bold in self.NAV_BUTTONS:
+            button = tk.Button(
+                self.nav_frame,
+                text=label,
+                command=lambda name=name: self.show_frame(name),
+                font=self.theme_manager.fonts['small_bold' if bold else 'small'],
+                padx=15,
+                pady=10,
+                relief="flat"
+            )
+            self.theme_manager.register(button, bg='nav_btn_bg', fg='nav_fg')
+            button.pack(side=side, padx=5, pady=5)
+            self.nav_buttons[name] = button
+
+    def get_frame(self, frame_name):
+        """Get the cached view for frame_name, creating it on first use."""
+        frame = self.frames.get(frame_name)
+        if frame is None:
+            module_name, class_name = self.VIEWS[frame_name]
+            with ui_profiler.span(f"build {frame_name}"):
+                frame_class = getattr(importlib.import_module(module_name), class_name)
+                frame = frame_class(self.content_frame, self, self.theme_manager)
+                frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[frame_name] = frame
+        return frame
+
     def show_frame(self, frame_name):
         """Switch to the specified frame."""
-        # Destroy all existing widgets in content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Update content frame background color
-        colors = self.theme_manager.get_colors()
-        self.content_frame.config(bg=colors['bg'])
-
-        # Recreate navigation with updated theme colors
-        for widget in self.container.winfo_children():
-            if isinstance(widget, tk.Frame) and widget != self.content_frame:
-                widget.destroy()
-        self.create_navigation()
-        self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        if frame_name not in self.VIEWS:
+            frame_name = "dashboard"
+
+        with ui_profiler.span(f"show {frame_name}"):
+            previous = self.frames.get(self.current_frame_name)
+            frame = self.get_frame(frame_name)
+            if previous is not None and previous is not frame:
+                previous.on_hide()
+
+            self.current_frame_name = frame_name
+            frame.tkraise()
+            frame.on_show()
+
+    def start_services(self):
+        """Start the non-critical background work after the first paint."""
+        startup_trace.mark("first paint")
+
+        # Timed reminders; the pending assignments are read off the Tk thread
+        self.loader.submit(self, NotificationScheduler.load_pending, self.scheduler.start)
+
+        # Reload views when the database changes, including from other processes
+        self.watcher.start()
+        startup_trace.mark("start services")
+
+    def on_data_changed(self, tables, external):
+        """Pass database changes to the visible view and the reminder scheduler."""
+        frame = self.frames.get(self.current_frame_name)
+        if frame is not None:
+            frame.on_data_changed(tables)
+        # Writes made through the models are already scheduled incrementally;
+        # only other processes' writes need a reload (one indexed query)
+        if external & {'assignments', 'user_settings'}:
+            self.loader.submit(self, NotificationScheduler.load_pending, self.scheduler.reload)
+
+    def on_reminder(self, assignment_ids):
+        """Alert the user and refresh the dashboard banner when reminders fire."""
+        self.root.bell()
+        dashboard = self.frames.get("dashboard")
+        if dashboard is not None:
+            dashboard.refresh_dashboard()
+
+    def open_query_panel(self, event=None):
+        """Show the SQL profiler's report window."""
+        if self.query_panel is not None and self.query_panel.winfo_exists():
+            self.query_panel.lift()
+            self.query_panel.refresh()
+            return
+        from ui.query_panel import QueryProfilePanel
+        self.query_panel = QueryProfilePanel(self)
+
+    def shutdown(self):
+        """Stop background loads, close database connections and destroy the window."""
+        self.watcher.stop()
+        self.scheduler.stop()
+        self.loader.shutdown()
+        close_connections()
+        ui_profiler.stop()
+        ui_profiler.dump()
+        self.root.destroy()
 
-        # Create and display the requested frame
-        if frame_name == "dashboard":
-            frame = DashboardFrame(self.content_frame, self, self.theme_manager)
-        elif frame_name == "course_form":
-            frame = CourseFormFrame(self.content_frame, self, self.theme_manager)
-        elif frame_name == "assignment_form":
-            frame = AssignmentFormFrame(self.content_frame, self, self.theme_manager)
-        elif frame_name == "settings":
-            frame = SettingsFormFrame(self.content_frame, self, self.theme_manager)
-        else:
-            frame = DashboardFrame(self.content_frame, self, self.theme_manager)
-
-        frame.pack(fill="both", expand=True)
-    
     def run(self):
         """Start the Tkinter main loop."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            close_connections()
@@ -0,0 +1,171 @@
+"""
+Benchmark suite for the model and logic hot paths
+Times each path against seeded synthetic databases of increasing size and
+writes the results as JSON, so runs from different commits can be compared.
+Needs no display
+
+Usage:
+    python -m benchmarks.bench_hot_paths --sizes 1000,10000 -o before.json
+    python -m benchmarks.bench_hot_paths --sizes 1000,10000 --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from benchmarks.dataset import REFERENCE_DATE, create_database
+from db import database
+from db.migrations import migrate
+from logic.deadline import categorize_assignment, categorize_many, load_category, summarize
+from logic.notifications import NotificationManager
+from models.assignment import Assignment
+from models.cache import query_cache
+from models.settings import Settings
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Runs slower than the baseline by more than this fraction are flagged
+REGRESSION_THRESHOLD = 0.10
+
+
+def _get_all_uncached():
+    query_cache.invalidate('assignments')
+    return Assignment.get_all()
+
+
+def _settings_get_1000():
+    for _ in range(1000):
+        Settings.get('notification_days_before')
+
+
+def benchmarks(assignments, now):
+    """(name, function) pairs; assignments is a preloaded list for the pure-Python paths."""
+    return [
+        ("Assignment.get_all (uncached)", _get_all_uncached),
+        ("Assignment.get_all (cached)", Assignment.get_all),
+        ("Assignment.due_between (1 week)", lambda: Assignment.due_between(now, now + timedelta(days=7))),
+        ("Assignment.search", lambda: Assignment.search("lab report")),
+        ("categorize_assignment (every row)",
+         lambda: [categorize_assignment(a.due_datetime) for a in assignments]),
+        ("categorize_many", lambda: categorize_many(assignments, now)),
+        ("summarize", lambda: summarize(now)),
+        ("load_category (due_soon)", lambda: load_category('due_soon', now)),
+        ("NotificationManager.get_upcoming_assignments",
+         lambda: NotificationManager.get_upcoming_assignments(now)),
+        ("Settings.get (1000 calls)", _settings_get_1000),
+    ]
+
+
+def time_function(func, min_runs=3, max_runs=25, min_seconds=0.25):
+    """Run func at least min_runs times, and more until min_seconds have passed."""
+    func()  # Warm-up: statement cache, page cache, lazy imports
+    runs = []
+    while len(runs) < min_runs or (sum(runs) < min_seconds and len(runs) < max_runs):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def run_size(rows, data_dir, seed):
+    """Time every benchmark against a database of rows assignments."""
+    path = os.path.join(data_dir, f"bench-{rows}-seed{seed}.db")
+    if os.path.exists(path):
+        # Same seed, same data: reuse it (migrating in case the schema moved on)
+        database.connection_manager.configure(db_path=path)
+        migrate(database.get_connection())
+    else:
+        print(f"Generating {rows} assignments...", file=sys.stderr)
+        create_database(path, rows, seed=seed)
+
+    results = []
+    assignments = Assignment.get_all()
+    for name, func in benchmarks(assignments, REFERENCE_DATE):
+        runs = time_function(func)
+        results.append({
+            'benchmark': name,
+            'rows': rows,
+            'best': min(runs),
+            'median': statistics.median(runs),
+            'runs': len(runs),
+        })
+        print(f"{name:<48}{rows:>10}{min(runs) * 1000:>12.3f} ms", file=sys.stderr)
+    database.close_connections()
+    return results
+
+
+def metadata(seed):
+    """Where and on what the results were measured."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'date': datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'seed': seed,
+    }
+
+
+def compare(results, baseline):
+    """Print each benchmark's best time against a baseline run."""
+    before = {(r['benchmark'], r['rows']): r['best'] for r in baseline['results']}
+    print(f"{'benchmark':<48}{'rows':>10}{'baseline':>12}{'current':>12}{'change':>10}")
+    for r in results:
+        old = before.get((r['benchmark'], r['rows']))
+        if old is None:
+            continue
+        change = r['best'] / old - 1
+        flag = "  slower" if change > REGRESSION_THRESHOLD else ""
+        print(f"{r['benchmark']:<48}{r['rows']:>10}{old * 1000:>10.3f}ms"
+              f"{r['best'] * 1000:>10.3f}ms{change:>+10.1%}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PyHomework's model and logic hot paths.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated assignment counts (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", help="keep generated databases here and reuse them on later runs")
+    parser.add_argument("-o", "--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        results = []
+        for rows in sizes:
+            results.extend(run_size(rows, data_dir, args.seed))
+
+    report = {'meta': metadata(args.seed), 'results': results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Microbenchmark: loading assignment rows into model records
+Compares the original sqlite3.Row + __dict__ records against the slotted
+records built by the positional row factory
+
+Usage: python -m benchmarks.bench_records [--rows 100000]
+"""
+
+import argparse
+import gc
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from db import database
+from db.migrations import migrate
+from models.assignment import Assignment
+
+
+class LegacyAssignment:
+    """The pre-slots Assignment record, kept here for comparison."""
+
+    def __init__(self, id=None, course_id=None, title="", type="",
+                 due_datetime=None, status="Not Started", notes=""):
+        self.id = id
+        self.course_id = course_id
+        self.title = title
+        self.type = type
+        self.due_datetime = due_datetime
+        self.status = status
+        self.notes = notes
+
+
+def legacy_load(conn):
+    """Load rows the way Assignment.get_all() used to."""
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM assignments ORDER BY due_datetime")
+    assignments = []
+    for row in cursor.fetchall():
+        assignments.append(LegacyAssignment(
+            id=row["id"],
+            course_id=row["course_id"],
+            title=row["title"],
+            type=row["type"],
+            due_datetime=row["due_datetime"],
+            status=row["status"],
+            notes=row["notes"]
+        ))
+    return assignments
+
+
+def slotted_load(conn):
+    """Load rows through the current positional row factory."""
+    return Assignment._load_all()
+
+
+def seed(rows):
+    """Fill the current database with rows assignments."""
+    conn = database.get_connection()
+    conn.execute("INSERT INTO courses (name) VALUES ('Benchmark 101')")
+    start = datetime(2026, 1, 12)
+    Assignment.bulk_create(
+        (1, f"Assignment {i}", "Homework", start + timedelta(minutes=i), "Not Started", "")
+        for i in range(rows)
+    )
+
+
+def measure(load, conn, repeat=3):
+    """Best-of-repeat load time and the memory held by the loaded records."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        records = load(conn)
+        best = min(best, time.perf_counter() - start)
+        del records
+
+    gc.collect()
+    tracemalloc.start()
+    records = load(conn)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, held, len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark assignment record loading.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.connection_manager.configure(db_path=os.path.join(tmp, "bench.db"))
+        migrate(database.get_connection())
+        seed(args.rows)
+
+        legacy_conn = sqlite3.connect(database.connection_manager.db_path)
+        results = {
+            'legacy (Row + __dict__)': measure(legacy_load, legacy_conn),
+            'slotted (positional factory)': measure(slotted_load, None),
+        }
+        legacy_conn.close()
+        database.close_connections()
+
+    print(f"{'records':<30}{'rows':>10}{'best time':>12}{'memory':>12}{'bytes/row':>12}")
+    for name, (seconds, held, count) in results.items():
+        print(f"{name:<30}{count:>10}{seconds * 1000:>10.1f}ms"
+              f"{held / 1_048_576:>10.1f}MB{held / max(count, 1):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Tk rendering benchmark
+Builds the real app against a seeded database and measures, for startup,
+each view switch, theme preview, search and scrolling: wall time until the
+event loop is idle again with no background loads pending, Tk widgets
+created, and Tcl commands executed. Results are checked against a budgets
+file and the run exits with status 1 if any budget is exceeded or a
+scenario has no budget recorded.
+
+On Linux without a display the benchmark re-runs itself under xvfb-run.
+
+Usage:
+    python -m benchmarks.bench_ui --rows 10000
+    python -m benchmarks.bench_ui --write-budgets benchmarks/ui_budgets.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from benchmarks.dataset import create_database
+from db import database
+
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_budgets.json")
+
+# Set in the environment of the xvfb-run child, so it never re-executes again
+_XVFB_MARKER = "PYHOMEWORK_BENCH_UNDER_XVFB"
+
+# Headroom given to measured numbers by --write-budgets
+TIME_HEADROOM = 1.5
+COUNT_HEADROOM = 1.1
+
+IDLE_TIMEOUT_SECONDS = 30
+
+
+def ensure_display(argv):
+    """Re-run this benchmark under xvfb-run when there is no X display."""
+    if not sys.platform.startswith("linux") or os.environ.get("DISPLAY"):
+        return
+    if os.environ.get(_XVFB_MARKER) or shutil.which("xvfb-run") is None:
+        print("error: no display; install Xvfb (xvfb-run) or set DISPLAY", file=sys.stderr)
+        sys.exit(2)  # Status 1 means a budget was exceeded
+    os.environ[_XVFB_MARKER] = "1"
+    os.execvp("xvfb-run", ["xvfb-run", "-a", "-s", "-screen 0 1280x1024x24",
+                           sys.executable, "-m", "benchmarks.bench_ui", *argv])
+
+
+def count_widgets(widget):
+    """Number of widgets in the tree under (and including) widget."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def wait_idle(app):
+    """Run the event loop until no background load is pending and nothing is left to draw."""
+    deadline = time.perf_counter() + IDLE_TIMEOUT_SECONDS
+    while True:
+        app.root.update()
+        if not app.loader.pending():
+            return
+        if time.perf_counter() > deadline:
+            raise TimeoutError("background loads did not finish")
+        time.sleep(0.001)
+
+
+def measure(app, action):
+    """Run action() and wait for idle; returns (seconds, widgets created, Tcl commands)."""
+    tk = app.root.tk
+    widgets = count_widgets(app.root)
+    commands = int(tk.call("info", "cmdcount"))
+    start = time.perf_counter()
+    action()
+    wait_idle(app)
+    elapsed = time.perf_counter() - start
+    return (elapsed,
+            count_widgets(app.root) - widgets,
+            int(tk.call("info", "cmdcount")) - commands)
+
+
+def run_once():
+    """Time every scenario in a fresh app window; returns {scenario: (seconds, widgets, commands)}."""
+    from app import PyHomeworkApp
+
+    results = {}
+    start = time.perf_counter()
+    app = PyHomeworkApp()
+    wait_idle(app)
+    # The interpreter doesn't exist before startup, so its counts are absolute
+    results["startup"] = (time.perf_counter() - start, count_widgets(app.root),
+                          int(app.root.tk.call("info", "cmdcount")))
+
+    for name in ("course_form", "assignment_form", "settings"):
+        results[f"show {name}"] = measure(app, lambda: app.show_frame(name))
+    results["show dashboard (cached)"] = measure(app, lambda: app.show_frame("dashboard"))
+
+    dashboard = app.frames["dashboard"]
+    results["dashboard refresh"] = measure(app, dashboard.refresh_dashboard)
+    results["dashboard scroll"] = measure(app, lambda: dashboard.list_view.canvas.yview_moveto(0.5))
+
+    def search():
+        dashboard.search_var.set("lab report")
+        dashboard.run_search()  # Skip the typing debounce
+    results["dashboard search"] = measure(app, search)
+
+    theme = app.theme_manager
+    original = theme.get_theme_name()
+    other = 'dark' if original == 'light' else 'light'
+
+    def preview_theme():
+        theme.switch_theme(other)
+        theme.switch_theme(original)
+    results["theme preview"] = measure(app, preview_theme)
+
+    app.shutdown()
+    return results
+
+
+def run(rows, repeat, seed):
+    """Best time and largest counts per scenario over repeat fresh windows."""
+    with tempfile.TemporaryDirectory() as tmp:
+        create_database(os.path.join(tmp, "bench.db"), rows, seed=seed)
+        database.close_connections()
+        results = {}
+        for _ in range(repeat):
+            for scenario, (seconds, widgets, commands) in run_once().items():
+                best = results.setdefault(scenario, {'seconds': seconds, 'widgets': widgets,
+                                                     'tcl_commands': commands})
+                best['seconds'] = min(best['seconds'], seconds)
+                best['widgets'] = max(best['widgets'], widgets)
+                best['tcl_commands'] = max(best['tcl_commands'], commands)
+        database.close_connections()
+    return results
+
+
+def check_budgets(results, budgets, require=True):
+    """Print every measurement against its budget; returns the breaches."""
+    breaches = []
+    print(f"{'scenario':<28}{'seconds':>10}{'widgets':>10}{'tcl cmds':>12}")
+    for scenario, measured in results.items():
+        budget = budgets.get(scenario)
+        if budget is None:
+            # An unbudgeted scenario could regress without anyone noticing
+            if require:
+                breaches.append(f"{scenario}: no budget recorded")
+            budget = {}
+        marks = []
+        for metric in ('seconds', 'widgets', 'tcl_commands'):
+            limit = budget.get(metric)
+            over = limit is not None and measured[metric] > limit
+            marks.append("!" if over else " ")
+            if over:
+                breaches.append(f"{scenario}: {metric} {measured[metric]:g} > budget {limit:g}")
+        print(f"{scenario:<28}{measured['seconds']:>9.3f}{marks[0]}"
+              f"{measured['widgets']:>9}{marks[1]}{measured['tcl_commands']:>11}{marks[2]}")
+    return breaches
+
+
+def write_budgets(path, rows, results):
+    """Save the measured numbers, plus headroom, as the new budgets."""
+    budgets = {
+        scenario: {
+            'seconds': round(measured['seconds'] * TIME_HEADROOM, 3),
+            'widgets': int(measured['widgets'] * COUNT_HEADROOM) + 1,
+            'tcl_commands': int(measured['tcl_commands'] * COUNT_HEADROOM) + 1,
+        }
+        for scenario, measured in results.items()
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({'rows': rows, 'budgets': budgets}, f, indent=2)
+        f.write("\n")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="Benchmark PyHomework's Tk views against budgets.")
+    parser.add_argument("--rows", type=int, help="assignments in the test database (default: from budgets)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh app windows to measure (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budgets", default=BUDGETS_PATH, help="budgets file (default: %(default)s)")
+    parser.add_argument("--write-budgets", metavar="PATH", help="record this run as the budgets in PATH")
+    parser.add_argument("-o", "--output", help="also write the measurements as JSON")
+    args = parser.parse_args(argv)
+    ensure_display(argv)
+
+    config = {'rows': 10_000, 'budgets': {}}
+    if not args.write_budgets:
+        with open(args.budgets, encoding="utf-8") as f:
+            config = json.load(f)
+        if not config['budgets']:
+            print(f"error: {args.budgets} has no budgets yet; record them with --write-budgets "
+                  "on the machine that runs this check", file=sys.stderr)
+            sys.exit(2)
+    rows = args.rows or config['rows']
+
+    results = run(rows, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({'rows': rows, 'results': results}, f, indent=2)
+    if args.write_budgets:
+        check_budgets(results, {}, require=False)
+        write_budgets(args.write_budgets, rows, results)
+        print(f"Budgets written to {args.write_budgets}")
+        return
+
+    breaches = check_budgets(results, config['budgets'])
+    if breaches:
+        print("\nBudget exceeded:", *breaches, sep="\n  ", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Seeded synthetic dataset generator
+Produces the same courses and assignments for the same seed: due dates
+spread over the semester and a status mix that depends on whether the
+due date has passed, like a real term in progress
+
+Usage: python -m benchmarks.dataset --assignments 10000 -o bench.db
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import timedelta
+from db import database
+from db.migrations import migrate
+from logic.deadline import SEMESTER_START, SEMESTER_END
+from models.assignment import Assignment
+from models.course import Course
+
+
+# Assignments are generated as seen on this date, a few weeks into term
+REFERENCE_DATE = SEMESTER_START + timedelta(weeks=6)
+
+SUBJECTS = ("Calculus", "Chemistry", "Physics", "Biology", "History", "Literature",
+            "Economics", "Psychology", "Statistics", "Computer Science", "Spanish", "Art")
+COLORS = ("Blue", "Green", "Red", "Orange", "Purple", "Yellow")
+
+# (type, title pattern, weight)
+ASSIGNMENT_KINDS = (
+    ("Homework", "Problem Set {n}", 40),
+    ("Reading", "Chapter {n} Reading", 20),
+    ("Lab", "Lab {n} Report", 15),
+    ("Quiz", "Quiz {n}", 12),
+    ("Project", "Project Milestone {n}", 8),
+    ("Exam", "Exam {n}", 5),
+)
+
+# Status weights (Not Started, In Progress, Submitted) before and after the due date
+STATUSES = ("Not Started", "In Progress", "Submitted")
+STATUS_WEIGHTS_PAST = (5, 5, 90)
+STATUS_WEIGHTS_FUTURE = (70, 20, 10)
+
+NOTES = ("", "", "", "Bring calculator", "Submit on the course site", "Group work allowed",
+         "See lecture slides", "Office hours Tuesday", "Double-check units")
+
+
+def course_rows(count, rng):
+    """(name, color, instructor) tuples for count courses."""
+    for i in range(count):
+        subject = SUBJECTS[i % len(SUBJECTS)]
+        yield (f"{subject} {101 + i}", rng.choice(COLORS), f"Prof. {chr(65 + i % 26)}")
+
+
+def assignment_rows(count, course_ids, rng):
+    """(course_id, title, type, due, status, notes) tuples, generated lazily."""
+    kinds = [(type, title) for type, title, _ in ASSIGNMENT_KINDS]
+    weights = [weight for _, _, weight in ASSIGNMENT_KINDS]
+    span = int((SEMESTER_END - SEMESTER_START).total_seconds() // 60)
+    for i in range(count):
+        type, title = rng.choices(kinds, weights)[0]
+        # Due on the minute, mostly at common deadline times
+        due = SEMESTER_START + timedelta(minutes=rng.randrange(span))
+        due = due.replace(hour=rng.choice((9, 12, 17, 23)), minute=rng.choice((0, 30, 59)))
+        status_weights = STATUS_WEIGHTS_PAST if due < REFERENCE_DATE else STATUS_WEIGHTS_FUTURE
+        status = rng.choices(STATUSES, status_weights)[0]
+        yield (rng.choice(course_ids), title.format(n=i % 50 + 1), type, due, status, rng.choice(NOTES))
+
+
+def generate(assignments, courses=12, seed=0):
+    """
+    Fill the current database with a synthetic semester.
+
+    Returns (courses created, assignments created).
+    """
+    rng = random.Random(seed)
+    Course.bulk_create(course_rows(courses, rng))
+    course_ids = [c.id for c in Course.get_all()]
+    created = Assignment.bulk_create(assignment_rows(assignments, course_ids, rng))
+    return len(course_ids), created
+
+
+def create_database(path, assignments, courses=12, seed=0):
+    """Create (or replace) a database file at path holding a synthetic semester."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    database.connection_manager.configure(db_path=path)
+    migrate(database.get_connection())
+    return generate(assignments, courses, seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic PyHomework database.")
+    parser.add_argument("--assignments", type=int, default=10_000)
+    parser.add_argument("--courses", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True, help="database file to create (replaced if it exists)")
+    args = parser.parse_args(argv)
+
+    courses, assignments = create_database(args.output, args.assignments, args.courses, args.seed)
+    database.close_connections()
+    print(f"Created {assignments} assignments in {courses} courses at {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,62 +5,165 @@ SQLite database for Spring 2026 semester
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
+from db.profiler import query_profiler
 
 
 # Database file path
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "spring_2026.db")
 
+# Number of compiled statements each connection keeps around for reuse
+DEFAULT_STATEMENT_CACHE = int(os.environ.get("PYHOMEWORK_STATEMENT_CACHE", "128"))
+
+# Per-connection tuning applied to every connection the manager opens.
+# WAL lets readers and the writer proceed concurrently; with WAL,
+# synchronous=NORMAL is still crash-safe and avoids an fsync per commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",  # 256 MB of memory-mapped reads
+    "PRAGMA foreign_keys = ON",
+)
+
+
+class ConnectionManager:
+    """
+    Hands out one long-lived SQLite connection per thread.
+
+    Connections are opened lazily on first use and reused for every query on
+    that thread, so the cost of opening the file and compiling statements is
+    paid once instead of on every model call.
+    """
+
+    def __init__(self, db_path=DB_PATH, cached_statements=DEFAULT_STATEMENT_CACHE):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._transaction_listeners = []
+
+    def configure(self, db_path=None, cached_statements=None):
+        """Change the database file or statement cache size (closes open connections)."""
+        self.close_all()
+        if db_path is not None:
+            self.db_path = db_path
+        if cached_statements is not None:
+            self.cached_statements = cached_statements
+
+    def get(self):
+        """Get the connection for the calling thread, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def _connect(self):
+        """Open a new connection with the application's settings."""
+        # isolation_level=None puts sqlite3 in autocommit mode; multi-statement
+        # writes are grouped explicitly with transaction().
+        # check_same_thread is off only so close_all() can run at shutdown;
+        # each connection is still used by the thread that opened it.
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+            factory=query_profiler.connection_factory()  # Plain unless profiling
+        )
+        conn.row_factory = sqlite3.Row  # Access columns by name
+        query_profiler.instrument(conn)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of statements in a single transaction.
+
+        Nested transaction() blocks join the outermost one, which commits on
+        success and rolls back if an exception escapes. Transaction listeners
+        run after either outcome.
+        """
+        conn = self.get()
+        outermost = self._local.depth == 0
+        if outermost:
+            conn.execute("BEGIN")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if outermost:
+                try:
+                    conn.execute("ROLLBACK")
+                finally:
+                    self._notify_listeners()
+            raise
+        self._local.depth -= 1
+        if outermost:
+            conn.execute("COMMIT")
+            self._notify_listeners()
+
+    def add_transaction_listener(self, listener):
+        """Call listener() on the same thread after each transaction() commits or rolls back."""
+        self._transaction_listeners.append(listener)
+
+    def _notify_listeners(self):
+        for listener in self._transaction_listeners:
+            listener()
+
+    def close_all(self):
+        """Close every connection opened by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # A fresh thread-local store makes every thread reconnect on next use
+        self._local = threading.local()
+
+
+# Shared manager used by all models
+connection_manager = ConnectionManager()
+
 
 def get_connection():
-    """Get a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Access columns by name
-    return conn
+    """Get the calling thread's shared connection to the SQLite database."""
+    return connection_manager.get()
+
+
+def transaction():
+    """Context manager that groups writes into one transaction."""
+    return connection_manager.transaction()
+
+
+def close_connections():
+    """Close all open database connections (call on application shutdown)."""
+    connection_manager.close_all()
 
 
 def initialize_database():
-    """Create database tables if they don't exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # Create courses table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS courses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            color TEXT,
-            instructor TEXT
-        )
-    """)
-    
-    # Create assignments table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS assignments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            course_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
-            type TEXT,
-            due_datetime TEXT NOT NULL,
-            status TEXT DEFAULT 'Not Started',
-            notes TEXT,
-            FOREIGN KEY (course_id) REFERENCES courses (id)
-        )
-    """)
-
-    # Create user settings table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS user_settings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            setting_key TEXT UNIQUE NOT NULL,
-            setting_value TEXT NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    """
+    Apply any pending schema migrations and seed default settings.
+
+    When the schema is already current this costs a single PRAGMA: no DDL
+    runs and defaults aren't re-seeded (missing keys read as their defaults
+    anyway).
+    """
+    from db.migrations import migrate
+
+    applied = migrate(get_connection())
+    if not applied:
+        return
 
-    conn.commit()
-    conn.close()
-    print(f"Database initialized at: {DB_PATH}")
+    print(f"Database initialized at: {connection_manager.db_path} "
+          f"(schema v{applied[-1]})")
 
     # Initialize default settings
     from models.settings import Settings
@@ -0,0 +1,198 @@
+"""
+Versioned schema migrations
+The applied version is tracked in SQLite's PRAGMA user_version
+"""
+
+
+# Tables whose writes are counted in change_counters (migration 4)
+COUNTED_TABLES = ("assignments", "courses", "user_settings")
+
+
+def _change_counter_triggers(tables):
+    """One AFTER INSERT/UPDATE/DELETE trigger per table that bumps its counter."""
+    return [
+        f"""
+        CREATE TRIGGER {table}_count_{event.lower()} AFTER {event} ON {table}
+        BEGIN
+            UPDATE change_counters SET counter = counter + 1 WHERE table_name = '{table}';
+        END
+        """
+        for table in tables
+        for event in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+# Ordered (version, statements) pairs. Each migration runs in its own
+# transaction and bumps user_version, so a database only ever runs the
+# steps it hasn't seen yet.
+MIGRATIONS = [
+    # 1: Baseline schema. IF NOT EXISTS lets databases created before
+    #    migrations existed (user_version 0) adopt it without changes.
+    (1, [
+        """
+        CREATE TABLE IF NOT EXISTS courses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            color TEXT,
+            instructor TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS assignments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            course_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            type TEXT,
+            due_datetime TEXT NOT NULL,
+            status TEXT DEFAULT 'Not Started',
+            notes TEXT,
+            FOREIGN KEY (course_id) REFERENCES courses (id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS user_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            setting_key TEXT UNIQUE NOT NULL,
+            setting_value TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+    # 2: Indexes for the dashboard sort and per-course/per-status filters
+    (2, [
+        "CREATE INDEX IF NOT EXISTS idx_assignments_due ON assignments (due_datetime)",
+        "CREATE INDEX IF NOT EXISTS idx_assignments_course ON assignments (course_id)",
+        # Partial index: only unsubmitted work is ever looked up for reminders
+        """
+        CREATE INDEX IF NOT EXISTS idx_assignments_pending_due
+        ON assignments (due_datetime) WHERE status != 'Submitted'
+        """,
+    ]),
+    # 3: Integer due timestamps. due_ts holds the due time as epoch seconds
+    #    (naive local time read as UTC, i.e. strftime('%s', due_datetime)),
+    #    so range filters and sorting compare integers instead of parsing text.
+    (3, [
+        "ALTER TABLE assignments ADD COLUMN due_ts INTEGER",
+        "UPDATE assignments SET due_ts = CAST(strftime('%s', due_datetime) AS INTEGER)",
+        "DROP INDEX IF EXISTS idx_assignments_due",
+        "DROP INDEX IF EXISTS idx_assignments_pending_due",
+        "CREATE INDEX idx_assignments_due_ts ON assignments (due_ts)",
+        """
+        CREATE INDEX idx_assignments_pending_due_ts
+        ON assignments (due_ts) WHERE status != 'Submitted'
+        """,
+        # The models write due_ts themselves; these triggers only fire a
+        # corrective UPDATE for writers that don't (other tools, old code).
+        """
+        CREATE TRIGGER assignments_due_ts_insert AFTER INSERT ON assignments
+        WHEN NEW.due_ts IS NOT CAST(strftime('%s', NEW.due_datetime) AS INTEGER)
+        BEGIN
+            UPDATE assignments
+            SET due_ts = CAST(strftime('%s', NEW.due_datetime) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+        """,
+        """
+        CREATE TRIGGER assignments_due_ts_update AFTER UPDATE OF due_datetime, due_ts ON assignments
+        WHEN NEW.due_ts IS NOT CAST(strftime('%s', NEW.due_datetime) AS INTEGER)
+        BEGIN
+            UPDATE assignments
+            SET due_ts = CAST(strftime('%s', NEW.due_datetime) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+        """,
+    ]),
+    # 4: Per-table change counters. PRAGMA data_version only says that some
+    #    other connection committed; the counters say which tables it wrote,
+    #    so caches and views can reload just those.
+    (4, [
+        """
+        CREATE TABLE change_counters (
+            table_name TEXT PRIMARY KEY,
+            counter INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """,
+        "INSERT INTO change_counters (table_name) VALUES ('assignments'), ('courses'), ('user_settings')",
+        *_change_counter_triggers(COUNTED_TABLES),
+    ]),
+    # 5: Full-text search over assignment titles, notes and course names.
+    #    The FTS rowid is the assignment id; triggers keep it in sync.
+    (5, [
+        """
+        CREATE VIRTUAL TABLE assignments_fts USING fts5(
+            title, notes, course_name,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+        """,
+        """
+        INSERT INTO assignments_fts (rowid, title, notes, course_name)
+        SELECT a.id, a.title, a.notes, c.name
+        FROM assignments a LEFT JOIN courses c ON c.id = a.course_id
+        """,
+        """
+        CREATE TRIGGER assignments_fts_insert AFTER INSERT ON assignments
+        BEGIN
+            INSERT INTO assignments_fts (rowid, title, notes, course_name)
+            VALUES (NEW.id, NEW.title, NEW.notes,
+                    (SELECT name FROM courses WHERE id = NEW.course_id));
+        END
+        """,
+        """
+        CREATE TRIGGER assignments_fts_update AFTER UPDATE OF title, notes, course_id ON assignments
+        BEGIN
+            UPDATE assignments_fts
+            SET title = NEW.title, notes = NEW.notes,
+                course_name = (SELECT name FROM courses WHERE id = NEW.course_id)
+            WHERE rowid = OLD.id;
+        END
+        """,
+        """
+        CREATE TRIGGER assignments_fts_delete AFTER DELETE ON assignments
+        BEGIN
+            DELETE FROM assignments_fts WHERE rowid = OLD.id;
+        END
+        """,
+        """
+        CREATE TRIGGER courses_fts_rename AFTER UPDATE OF name ON courses
+        BEGIN
+            UPDATE assignments_fts SET course_name = NEW.name
+            WHERE rowid IN (SELECT id FROM assignments WHERE course_id = NEW.id);
+        END
+        """,
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """Get the schema version recorded in the database file."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """
+    Bring the schema up to SCHEMA_VERSION.
+
+    Returns the list of versions that were applied (empty when the schema
+    was already current, in which case no DDL runs at all).
+    """
+    current = get_schema_version(conn)
+    applied = []
+    for version, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            # PRAGMA doesn't accept bound parameters; version is an int constant
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        applied.append(version)
+    return applied
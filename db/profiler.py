@@ -0,0 +1,372 @@
+"""
+Opt-in SQL profiler
+Set PYHOMEWORK_PROFILE_SQL=1 (or pass --profile-sql to the command line)
+to time every statement run through the connection manager's connections.
+Statements are grouped by their SQL text, with execution counts, total and
+p95 latency (including fetching the rows) and the model functions that ran
+them. Executions slower than PYHOMEWORK_SLOW_QUERY_MS (default 50) go to a
+rotating slow-query log. The sqlite3 trace callback, which SQLite also
+calls for the statements that triggers and virtual tables (like the FTS
+index) run internally, counts the hidden work behind each write
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+
+ENABLED = os.environ.get("PYHOMEWORK_PROFILE_SQL", "") not in ("", "0")
+SLOW_QUERY_MS = float(os.environ.get("PYHOMEWORK_SLOW_QUERY_MS", "50"))
+SLOW_QUERY_LOG = os.environ.get(
+    "PYHOMEWORK_SLOW_QUERY_LOG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "slow_queries.log")
+)
+
+# Latency samples kept per statement for the p95
+SAMPLES_PER_STATEMENT = 1000
+
+
+def _normalize(sql):
+    """Collapse whitespace so the same statement always groups together."""
+    return " ".join(sql.split())
+
+
+# Modules whose frames are plumbing between a model method and its SQL
+_SKIPPED_MODULES = ("db", "sqlite3", "contextlib", "models.cache")
+
+# code object -> qualified name, for Pythons without co_qualname
+_qualnames = {}
+
+
+def _skipped(module, name):
+    """Whether a frame is plumbing rather than the method that wanted the data."""
+    if module in _SKIPPED_MODULES or module.startswith(tuple(m + "." for m in _SKIPPED_MODULES)):
+        return True
+    # Private model helpers (like Assignment._query) run SQL for public methods
+    return module.startswith("models.") and name.startswith("_") and not name.startswith("__")
+
+
+def _qualname(frame):
+    """Class-qualified function name of frame, e.g. Assignment.get_all."""
+    code = frame.f_code
+    qualname = getattr(code, "co_qualname", None)  # Python 3.11+
+    if qualname is None:
+        qualname = _qualnames.get(code)
+    if qualname is None:
+        qualname = _qualnames[code] = _class_qualname(frame)
+    return qualname
+
+
+def _class_qualname(frame):
+    """Work out a frame's class from self, or find its static method in the module."""
+    code = frame.f_code
+    instance = frame.f_locals.get("self")
+    if instance is not None:
+        return f"{type(instance).__name__}.{code.co_name}"
+    for value in list(frame.f_globals.values()):
+        if isinstance(value, type):
+            member = value.__dict__.get(code.co_name)
+            func = getattr(member, "__func__", member)  # staticmethod/classmethod
+            if getattr(func, "__code__", None) is code:
+                return f"{value.__name__}.{code.co_name}"
+    return code.co_name
+
+
+def _caller():
+    """The model method (or other code) that ran the statement."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not _skipped(module, frame.f_code.co_name):
+            return f"{module}.{_qualname(frame)}"
+        frame = frame.f_back
+    return "?"
+
+
+class StatementStats:
+    """Aggregated timings for one SQL statement."""
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLES_PER_STATEMENT)
+        self.callers = Counter()
+        self.nested = 0
+        self.parameters = ()  # Last bound values, reused for EXPLAIN QUERY PLAN
+
+    def p95(self):
+        """95th percentile of the sampled execution times, in seconds."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class _Execution:
+    """One run of a statement, timed from execute() until its rows are read."""
+
+    __slots__ = ("stats", "parameters", "seconds", "traced")
+
+    def __init__(self, stats, parameters, traced):
+        self.stats = stats
+        self.parameters = parameters
+        self.seconds = 0.0
+        self.traced = traced  # Trace callback count when execution began
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """Cursor that reports its statements' timings to the profiler."""
+
+    _execution = None
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        execution = query_profiler.begin(sql, parameters)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._execution = execution
+            query_profiler.executed(execution)
+            self._timed(start, done=self.description is None)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        execution = query_profiler.begin(sql, ())
+        rows = 0
+
+        def counted():
+            nonlocal rows
+            for parameters in seq_of_parameters:
+                rows += 1
+                yield parameters
+
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, counted())
+        finally:
+            self._execution = execution
+            query_profiler.executed(execution, runs=rows)
+            self._timed(start, done=True)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._timed(start, done=row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._timed(start, done=not rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._timed(start, done=True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._timed(start, done=True)
+            raise
+        self._timed(start, done=False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+    def _timed(self, start, done):
+        """Add the time since start to the current execution; done ends it."""
+        execution = self._execution
+        if execution is not None:
+            elapsed = time.perf_counter() - start
+            execution.seconds += elapsed
+            query_profiler.add_time(execution.stats, elapsed)
+            if done:
+                self._finish()
+
+    def _finish(self):
+        execution, self._execution = self._execution, None
+        if execution is not None:
+            query_profiler.end(execution)
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """Connection whose cursors, including the ones execute() creates, are profiled."""
+
+    def cursor(self, factory=ProfilingCursor):
+        return super().cursor(factory)
+
+    # The built-in shortcuts create plain cursors internally
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+class QueryProfiler:
+    """Collects per-statement statistics from profiled connections."""
+
+    def __init__(self, enabled=ENABLED, slow_query_ms=SLOW_QUERY_MS, log_path=SLOW_QUERY_LOG):
+        """
+        Args:
+            enabled: Whether connections opened from now on are profiled
+            slow_query_ms: Executions at least this slow are logged
+            log_path: Slow-query log file (rotated at 1 MB, 3 backups kept)
+        """
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._statements = {}
+        self._traced = threading.local()
+        self._logger = None
+
+    def enable(self):
+        """Profile connections opened from now on."""
+        self.enabled = True
+
+    def connection_factory(self):
+        """The sqlite3 connection class to open connections with."""
+        return ProfilingConnection if self.enabled else sqlite3.Connection
+
+    def instrument(self, conn):
+        """Trace the statements run on conn (a no-op unless profiling)."""
+        if self.enabled:
+            conn.set_trace_callback(self._trace)
+
+    def _trace(self, sql):
+        # Connections are per thread, so a per-thread count is per connection
+        self._traced.count = self._trace_count() + 1
+
+    def _trace_count(self):
+        return getattr(self._traced, "count", 0)
+
+    def begin(self, sql, parameters):
+        """Start timing a statement; returns its execution record."""
+        key = _normalize(sql)
+        caller = _caller()
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = StatementStats(key)
+            stats.count += 1
+            stats.callers[caller] += 1
+            stats.parameters = parameters
+        return _Execution(stats, parameters, self._trace_count())
+
+    def executed(self, execution, runs=1):
+        """Count the nested statements a statement ran, from its trace callbacks."""
+        # One callback per run of the statement itself (executemany runs it
+        # once per row), one more per nested statement
+        nested = self._trace_count() - execution.traced - runs
+        if nested > 0:
+            with self._lock:
+                execution.stats.nested += nested
+
+    def add_time(self, stats, seconds):
+        """Add time spent executing or fetching to a statement's total."""
+        with self._lock:
+            stats.total += seconds
+
+    def end(self, execution):
+        """Record a finished execution, logging it if it was slow."""
+        with self._lock:
+            execution.stats.samples.append(execution.seconds)
+        if execution.seconds * 1000 >= self.slow_query_ms:
+            self._slow_log().warning("%.1f ms  %s  params=%r  (%s)",
+                                     execution.seconds * 1000, execution.stats.sql,
+                                     execution.parameters, execution.stats.callers.most_common(1)[0][0])
+
+    def _slow_log(self):
+        if self._logger is None:
+            # Imported here so that loading the profiler, which happens on
+            # every start, doesn't pay for logging while profiling is off
+            import logging
+            from logging.handlers import RotatingFileHandler
+            logger = logging.getLogger("pyhomework.slow_queries")
+            logger.propagate = False
+            logger.setLevel(logging.WARNING)
+            handler = RotatingFileHandler(self.log_path, maxBytes=1_000_000, backupCount=3,
+                                          encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(threadName)s %(message)s"))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._statements = {}
+
+    def statements(self):
+        """Statement statistics, by total time spent, most first."""
+        with self._lock:
+            return sorted(self._statements.values(), key=lambda s: s.total, reverse=True)
+
+    @staticmethod
+    def explain(db_path, sql, parameters=()):
+        """EXPLAIN QUERY PLAN lines for sql, on a separate, unprofiled connection."""
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        except sqlite3.Error as e:
+            return [f"(no plan: {e})"]
+        finally:
+            conn.close()
+        return [row[-1] for row in rows]
+
+    def report(self, db_path=None, limit=20, explain=5):
+        """
+        Format the statistics as text.
+
+        Lists the limit statements with the most total time, then the query
+        plans of the explain worst of them (when db_path is given).
+        """
+        statements = self.statements()
+        lines = []
+        if not statements:
+            lines.append("No statements recorded"
+                         + ("" if self.enabled else " (set PYHOMEWORK_PROFILE_SQL=1 to profile)"))
+            return "\n".join(lines)
+
+        executions = sum(s.count for s in statements)
+        total_ms = sum(s.total for s in statements) * 1000
+        lines.append(f"{len(statements)} statements, {executions} executions, {total_ms:.1f} ms total")
+        lines.append("")
+        lines.append(f"{'count':>8}{'total ms':>11}{'p95 ms':>9}  statement")
+        for stats in statements[:limit]:
+            lines.append(f"{stats.count:>8}{stats.total * 1000:>11.1f}{stats.p95() * 1000:>9.2f}  "
+                         f"{stats.sql}")
+            for caller, count in stats.callers.most_common(3):
+                lines.append(f"{'':>30}{count:>6}x {caller}")
+            if stats.nested:
+                lines.append(f"{'':>30}{stats.nested:>6} nested statements (triggers, FTS index)")
+
+        if db_path is not None:
+            for stats in statements[:explain]:
+                # INSERT ... VALUES has no plan worth showing
+                if not stats.sql.upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE")):
+                    continue
+                lines.append("")
+                lines.append(f"Query plan: {stats.sql}")
+                lines.extend(f"    {step}" for step in self.explain(db_path, stats.sql, stats.parameters))
+        return "\n".join(lines)
+
+
+# Shared profiler used by the connection manager
+query_profiler = QueryProfiler()
@@ -4,12 +4,18 @@ Spring 2026 semester tracking
 """
 
 from datetime import datetime, timedelta
+from models.assignment import Assignment, to_epoch
 
 
 # Spring 2026 semester dates (configurable constants)
 SEMESTER_START = datetime(2026, 1, 12)  # Typical spring semester start
 SEMESTER_END = datetime(2026, 5, 15)    # Typical spring semester end
 
+# Window for the "due soon" category
+DUE_SOON_DAYS = 7
+
+CATEGORIES = ('overdue', 'due_today', 'due_soon', 'later')
+
 
 def parse_due_datetime(due_str):
     """Parse a due datetime string to datetime object."""
@@ -77,6 +83,123 @@ def categorize_assignment(due_datetime):
         return 'later'
 
 
+def category_ranges(now=None):
+    """
+    Get the inclusive due_ts range of each category for one clock reading.
+
+    Returns {category: (low, high)}, where None means unbounded. The ranges
+    match categorize_assignment(): overdue is due < now, due_today is the
+    rest of today, due_soon runs to DUE_SOON_DAYS from now, later is after.
+    """
+    if now is None:
+        now = datetime.now()
+    # due_ts has whole seconds; if now has a fraction, items due in the
+    # current second are already past
+    first_pending = to_epoch(now) + (1 if now.microsecond else 0)
+    tomorrow = to_epoch(datetime.combine(now.date() + timedelta(days=1), datetime.min.time()))
+    soon_end = to_epoch(now + timedelta(days=DUE_SOON_DAYS))
+    return {
+        'overdue': (None, first_pending - 1),
+        'due_today': (first_pending, tomorrow - 1),
+        'due_soon': (tomorrow, soon_end),
+        'later': (soon_end + 1, None),
+    }
+
+
+def _bisect_due(assignments, due_ts, lo, hi):
+    """Index in [lo, hi) after the last assignment due at or before due_ts."""
+    # bisect_right only takes a key function from Python 3.10
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if assignments[mid].due_ts <= due_ts:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def categorize_many(assignments, now=None):
+    """
+    Categorize a due-date-sorted list of assignments in one pass.
+
+    assignments must be ordered by due_ts with missing due dates either
+    first or last (as returned by Assignment.get_all()). All items are
+    judged against a single clock reading; the category boundaries are
+    found by binary search and each bucket is a slice, so buckets come back
+    already sorted by due date.
+
+    Returns a dict of category name -> list of assignments.
+    """
+    ranges = category_ranges(now)
+
+    # Items without a due date always land in 'later', after dated items
+    start, end = 0, len(assignments)
+    while start < end and assignments[start].due_ts is None:
+        start += 1
+    while end > start and assignments[end - 1].due_ts is None:
+        end -= 1
+    undated = assignments[:start] + assignments[end:]
+
+    overdue_end = _bisect_due(assignments, ranges['overdue'][1], start, end)
+    today_end = _bisect_due(assignments, ranges['due_today'][1], overdue_end, end)
+    soon_end = _bisect_due(assignments, ranges['due_soon'][1], today_end, end)
+
+    return {
+        'overdue': assignments[start:overdue_end],
+        'due_today': assignments[overdue_end:today_end],
+        'due_soon': assignments[today_end:soon_end],
+        'later': assignments[soon_end:end] + undated,
+    }
+
+
+def summarize(now=None):
+    """
+    Count assignments per category with a single aggregate query.
+
+    Returns a dict with:
+        'total': number of assignments
+        'categories': {category: count}
+        'by_course': {course_id: {category: count}}
+        'by_status': {status: {category: count}}
+        'after_semester': how many 'later' items fall after SEMESTER_END
+    """
+    ranges = category_ranges(now)
+    rows = Assignment.count_by_category(
+        ranges['overdue'][1],
+        ranges['due_today'][1],
+        ranges['due_soon'][1],
+        to_epoch(SEMESTER_END)
+    )
+
+    summary = {
+        'total': 0,
+        'categories': dict.fromkeys(CATEGORIES, 0),
+        'by_course': {},
+        'by_status': {},
+        'after_semester': 0,
+    }
+    for category, course_id, status, count in rows:
+        if category == 'after_semester':
+            # Still shown under 'later', like categorize_assignment() does
+            summary['after_semester'] += count
+            category = 'later'
+        summary['total'] += count
+        summary['categories'][category] += count
+        for group, key in (('by_course', course_id), ('by_status', status)):
+            counts = summary[group].setdefault(key, dict.fromkeys(CATEGORIES, 0))
+            counts[category] += count
+    return summary
+
+
+def load_category(category, now=None):
+    """Fetch one category's assignments, sorted by due date, with a range query."""
+    low, high = category_ranges(now)[category]
+    assignments = Assignment.due_between(low, high)
+    if category == 'later':
+        assignments += Assignment.without_due_date()
+    return assignments
+
+
 def format_due_datetime(due_datetime):
     """Format a datetime for display."""
     due_dt = parse_due_datetime(due_datetime)
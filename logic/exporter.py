@@ -0,0 +1,144 @@
+"""
+Streaming export of assignments to CSV, JSON Lines and iCalendar
+Rows are written as they come off the database cursor, so memory use
+stays constant regardless of table size
+
+Usage: python -m logic.exporter --format csv -o assignments.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from db.database import get_connection
+from db.migrations import migrate
+from models.assignment import Assignment, from_epoch
+
+
+# Rows are Assignment.iter_with_course() tuples; their trailing due_ts is
+# only used to format dates and isn't exported as a column
+EXPORT_COLUMNS = ('id', 'course', 'title', 'type', 'due_datetime', 'status', 'notes')
+
+FORMATS = ('csv', 'jsonl', 'ics')
+
+
+def write_csv(rows, out):
+    """Write rows as CSV with a header line."""
+    writer = csv.writer(out)
+    writer.writerow(EXPORT_COLUMNS)
+    width = len(EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row[:width])
+        count += 1
+    return count
+
+
+def write_jsonl(rows, out):
+    """Write rows as JSON Lines, one object per assignment."""
+    count = 0
+    for row in rows:
+        out.write(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _escape_ics_text(value):
+    """Apply iCalendar TEXT escaping."""
+    return (str(value or "").replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _fold_ics_line(line):
+    """Fold a content line to 75 octets as RFC 5545 requires."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        # Back off so a multi-byte character is never split
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # Continuation lines spend one octet on the leading space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def write_ics(rows, out):
+    """Write rows as an iCalendar file with one VEVENT per dated assignment."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//PyHomework//Spring 2026//EN\r\n")
+    count = 0
+    for id, course, title, type, due_datetime, status, notes, due_ts in rows:
+        if due_ts is None:
+            continue  # An event without a date isn't representable
+        due = from_epoch(due_ts).strftime("%Y%m%dT%H%M%S")
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:assignment-{id}@pyhomework",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{due}",
+            f"DTEND:{due}",
+            # Course in brackets matches the Canvas style the importer reads
+            f"SUMMARY:{_escape_ics_text(title)} [{_escape_ics_text(course or 'Unknown Course')}]",
+            f"CATEGORIES:{_escape_ics_text(course or 'Unknown Course')}",
+        ]
+        if notes:
+            lines.append(f"DESCRIPTION:{_escape_ics_text(notes)}")
+        lines.append(f"X-PYHOMEWORK-STATUS:{_escape_ics_text(status)}")
+        lines.append(f"X-PYHOMEWORK-TYPE:{_escape_ics_text(type)}")
+        lines.append("END:VEVENT")
+        out.write("".join(_fold_ics_line(line) for line in lines))
+        count += 1
+    out.write("END:VCALENDAR\r\n")
+    return count
+
+
+WRITERS = {
+    'csv': write_csv,
+    'jsonl': write_jsonl,
+    'ics': write_ics,
+}
+
+
+def export_assignments(out, format="csv"):
+    """Stream all assignments to an open text file; returns the row count."""
+    if format not in WRITERS:
+        raise ValueError(f"Unsupported export format: {format!r}")
+    return WRITERS[format](Assignment.iter_with_course(), out)
+
+
+def export_to_path(path, format=None):
+    """Export all assignments to a file, picking the format from its extension."""
+    if format is None:
+        format = os.path.splitext(path)[1].lstrip(".").lower() or "csv"
+    # newline="" keeps the csv module's and ICS's own CRLF line endings intact
+    with open(path, "w", newline="", encoding="utf-8") as out:
+        return export_assignments(out, format)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Export PyHomework assignments.")
+    parser.add_argument("--format", choices=FORMATS, help="output format (default: from file extension, else csv)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    # Make sure the tables exist without the GUI's startup side effects
+    migrate(get_connection())
+
+    if args.output:
+        count = export_to_path(args.output, args.format)
+    else:
+        count = export_assignments(sys.stdout, args.format or "csv")
+    print(f"Exported {count} assignments", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Bulk import of assignments from LMS exports (CSV and iCalendar)
+Files are parsed line by line and written in batches, so memory use
+stays flat no matter how large the export is
+"""
+
+import csv
+import os
+import re
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from db.database import transaction
+from models.assignment import Assignment, to_epoch
+from models.course import Course
+
+
+VALID_STATUSES = ("Not Started", "In Progress", "Submitted")
+
+# Header aliases seen in common LMS CSV exports, mapped to our field names
+CSV_COLUMNS = {
+    'course': ('course', 'course_name', 'class'),
+    'title': ('title', 'name', 'assignment', 'summary'),
+    'type': ('type', 'assignment_type', 'category'),
+    'due': ('due', 'due_datetime', 'due_date', 'due_at', 'deadline'),
+    'status': ('status',),
+    'notes': ('notes', 'description', 'details'),
+}
+
+# Date formats accepted for CSV due dates, after ISO 8601
+CSV_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y",
+)
+
+# Due time used when a file only gives a date (matches the assignment form)
+DEFAULT_DUE_TIME = (23, 59)
+
+# Canvas-style calendar titles end with the course in brackets
+ICS_COURSE_SUFFIX = re.compile(r"^(.*?)\s*\[([^\]]+)\]\s*$")
+
+# iCalendar TEXT escapes: \\ \; \, and \n (or \N) for a newline
+ICS_TEXT_ESCAPE = re.compile(r"\\([\\;,nN])")
+
+
+class ImportResult:
+    """Summary of a finished import."""
+
+    def __init__(self, imported=0, skipped=0, courses_created=0, seconds=0.0, duplicates=0):
+        self.imported = imported
+        self.skipped = skipped
+        self.courses_created = courses_created
+        self.seconds = seconds
+        self.duplicates = duplicates
+
+    @property
+    def rows_per_second(self):
+        """Import throughput in rows per second."""
+        if self.seconds <= 0:
+            return float(self.imported)
+        return self.imported / self.seconds
+
+    def __str__(self):
+        return (f"Imported {self.imported} assignments "
+                f"({self.skipped} skipped, {self.duplicates} duplicates, "
+                f"{self.courses_created} new courses) "
+                f"in {self.seconds:.2f}s - {self.rows_per_second:,.0f} rows/s")
+
+
+def parse_csv_due(value):
+    """Parse a CSV due date; returns None if the format isn't recognized."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        due = datetime.fromisoformat(value)
+        if len(value) == 10:  # Date only
+            due = due.replace(hour=DEFAULT_DUE_TIME[0], minute=DEFAULT_DUE_TIME[1])
+        return _to_local_naive(due)
+    except ValueError:
+        pass
+    for fmt in CSV_DATE_FORMATS:
+        try:
+            due = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if "%H" not in fmt and "%I" not in fmt:
+            due = due.replace(hour=DEFAULT_DUE_TIME[0], minute=DEFAULT_DUE_TIME[1])
+        return due
+    return None
+
+
+def parse_ics_due(value):
+    """Parse an iCalendar DATE or DATE-TIME value into a local naive datetime."""
+    value = value.strip()
+    try:
+        if len(value) == 8:  # DATE form: YYYYMMDD
+            due = datetime.strptime(value, "%Y%m%d")
+            return due.replace(hour=DEFAULT_DUE_TIME[0], minute=DEFAULT_DUE_TIME[1])
+        if value.endswith("Z"):  # UTC
+            due = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S")
+            return _to_local_naive(due.replace(tzinfo=timezone.utc))
+        return datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+
+
+def _to_local_naive(due):
+    """Convert an aware datetime to local time; naive values pass through."""
+    if due.tzinfo is None:
+        return due
+    return due.astimezone().replace(tzinfo=None)
+
+
+def iter_csv(path):
+    """Yield assignment records from a CSV file with a header row."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        normalized = [h.strip().lower().replace(" ", "_") for h in header]
+
+        # Resolve each field to a column position once, not per row
+        positions = {}
+        for field, aliases in CSV_COLUMNS.items():
+            for alias in aliases:
+                if alias in normalized:
+                    positions[field] = normalized.index(alias)
+                    break
+
+        for row in reader:
+            record = {}
+            for field, index in positions.items():
+                record[field] = row[index].strip() if index < len(row) else ""
+            record['due'] = parse_csv_due(record.get('due'))
+            yield record
+
+
+def _unfold_ics_lines(f):
+    """Join RFC 5545 folded lines (continuations start with a space or tab)."""
+    current = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def _unescape_ics_text(value):
+    """Undo iCalendar TEXT escaping."""
+    # One left-to-right pass: chained replaces would turn the exported
+    # C:\\new (for C:\new) into "C:" + newline + "ew"
+    return ICS_TEXT_ESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def iter_ics(path):
+    """Yield assignment records from the VEVENT/VTODO entries of an .ics file."""
+    with open(path, encoding="utf-8-sig") as f:
+        props = None
+        for line in _unfold_ics_lines(f):
+            if line in ("BEGIN:VEVENT", "BEGIN:VTODO"):
+                props = {}
+                continue
+            if line in ("END:VEVENT", "END:VTODO"):
+                if props is not None:
+                    yield _ics_record(props)
+                props = None
+                continue
+            if props is None or ":" not in line:
+                continue
+            name, value = line.split(":", 1)
+            # Drop parameters such as DTSTART;TZID=America/New_York
+            name = name.split(";", 1)[0].upper()
+            props.setdefault(name, value)
+
+
+def _ics_record(props):
+    """Build an assignment record from one calendar component's properties."""
+    title = _unescape_ics_text(props.get('SUMMARY', "")).strip()
+    course = _unescape_ics_text(props.get('CATEGORIES', "")).split(",")[0].strip()
+    match = ICS_COURSE_SUFFIX.match(title)
+    if match:
+        title = match.group(1)
+        course = course or match.group(2).strip()
+
+    due_value = props.get('DUE') or props.get('DTSTART') or ""
+    return {
+        'uid': props.get('UID', "").strip(),
+        'course': course,
+        'title': title,
+        # Written by our own exporter; other calendars leave them empty
+        'type': _unescape_ics_text(props.get('X-PYHOMEWORK-TYPE', "")).strip(),
+        'due': parse_ics_due(due_value) if due_value else None,
+        'status': _unescape_ics_text(props.get('X-PYHOMEWORK-STATUS', "")).strip(),
+        'notes': _unescape_ics_text(props.get('DESCRIPTION', "")).strip(),
+    }
+
+
+def iter_records(path, format=None):
+    """Yield records from path, picking the parser from format or the extension."""
+    if format is None:
+        format = os.path.splitext(path)[1].lstrip(".").lower()
+    if format == "csv":
+        return iter_csv(path)
+    if format in ("ics", "ical"):
+        return iter_ics(path)
+    raise ValueError(f"Unsupported import format: {format!r}")
+
+
+def _batched(iterable, size):
+    """Yield lists of up to size items."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _already_stored(rows):
+    """
+    Drop calendar events that are already stored, from (course_id, title, due) rows.
+
+    Only rows from records with a UID are checked: re-importing a calendar
+    (including one exported from PyHomework, into any database) then adds
+    nothing twice, while CSV rows are imported as given.
+    Returns (new rows, number dropped).
+    """
+    keys = {(course_id, record['title'], to_epoch(record['due']))
+            for course_id, record in rows if record.get('uid')}
+    if not keys:
+        return rows, 0
+    stored = {(a.course_id, a.title, a.due_ts) for a in Assignment.due_at({k[2] for k in keys})}
+    new_rows = [(course_id, record) for course_id, record in rows
+                if not (record.get('uid')
+                        and (course_id, record['title'], to_epoch(record['due'])) in stored)]
+    return new_rows, len(rows) - len(new_rows)
+
+
+def import_records(records, default_course="Imported", batch_size=1000):
+    """
+    Import an iterable of records in one transaction.
+
+    Records without a title or a parseable due date are skipped. Records with
+    a UID (calendar events) that repeat one seen earlier in the import, or
+    match a stored assignment's course, title and due date, are counted as
+    duplicates and not inserted. Courses are matched by name and created on
+    demand.
+    """
+    result = ImportResult()
+    start = time.perf_counter()
+    seen_uids = set()
+
+    with transaction():
+        course_ids = {c.name: c.id for c in Course.get_all()}
+
+        for batch in _batched(records, batch_size):
+            rows = []
+            for record in batch:
+                if not record.get('title') or record.get('due') is None:
+                    result.skipped += 1
+                    continue
+                uid = record.get('uid')
+                if uid:
+                    if uid in seen_uids:
+                        result.duplicates += 1
+                        continue
+                    seen_uids.add(uid)
+                rows.append(record)
+
+            # Create any courses this batch references for the first time
+            new_courses = {r.get('course') or default_course for r in rows} - course_ids.keys()
+            if new_courses:
+                Course.bulk_create((name, "", "") for name in sorted(new_courses))
+                result.courses_created += len(new_courses)
+                course_ids = {c.name: c.id for c in Course.get_all()}
+
+            rows, dropped = _already_stored(
+                [(course_ids[r.get('course') or default_course], r) for r in rows])
+            result.duplicates += dropped
+
+            result.imported += Assignment.bulk_create(
+                (
+                    course_id,
+                    r['title'],
+                    r.get('type') or "Other",
+                    r['due'],
+                    r.get('status') if r.get('status') in VALID_STATUSES else "Not Started",
+                    r.get('notes') or "",
+                )
+                for course_id, r in rows
+            )
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def import_file(path, format=None, default_course="Imported", batch_size=1000):
+    """Import assignments from a CSV or iCalendar file."""
+    return import_records(iter_records(path, format), default_course, batch_size)
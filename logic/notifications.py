@@ -2,53 +2,39 @@
 Notification logic for assignment reminders
 """
 
+import heapq
 from datetime import datetime, timedelta
-from models.assignment import Assignment
+from models.assignment import Assignment, SUBMITTED, to_epoch, from_epoch
 from models.course import Course
 from models.settings import Settings
-from logic.deadline import parse_due_datetime
 
 
 class NotificationManager:
     """Manages assignment due date notifications."""
 
     @staticmethod
-    def get_upcoming_assignments():
-        """Get assignments due within notification window."""
-        # Check if notifications are enabled
-        notifications_enabled = Settings.get('notifications_enabled', 'true') == 'true'
-        if not notifications_enabled:
+    def get_upcoming_assignments(now=None):
+        """Get assignments due within notification window (starting now, by default)."""
+        # Check if notifications are enabled (typed values, served from memory)
+        if not Settings.get_value('notifications_enabled'):
             return []
 
         # Get notification settings
-        days_before = int(Settings.get('notification_days_before', '1'))
+        days_before = Settings.get_value('notification_days_before')
 
-        # Get all assignments
-        assignments = Assignment.get_all()
-
-        # Filter assignments by due date
-        upcoming = []
-        now = datetime.now()
+        # Only the rows inside the window are read, via the due date index
+        now = now or datetime.now()
         notification_window = now + timedelta(days=days_before)
-
-        for assignment in assignments:
-            due_dt = parse_due_datetime(assignment.due_datetime)
-            if due_dt and now <= due_dt <= notification_window:
-                # Only notify for assignments not yet submitted
-                if assignment.status != "Submitted":
-                    upcoming.append(assignment)
-
-        return upcoming
+        return Assignment.due_between(now, notification_window, exclude_status=SUBMITTED)
 
     @staticmethod
     def should_show_notification():
         """Check if notifications are enabled and time is right."""
-        notifications_enabled = Settings.get('notifications_enabled', 'true') == 'true'
-        if not notifications_enabled:
+        if not Settings.get_value('notifications_enabled'):
             return False
 
-        # For in-app notifications, we'll always show if there are upcoming assignments
-        # The notification_time setting can be used for future desktop notifications
+        # The banner always shows upcoming assignments; notification_time
+        # only drives NotificationScheduler's timed reminders
         return True
 
     @staticmethod
@@ -77,7 +63,7 @@ class NotificationManager:
             course = courses.get(assignment.course_id)
             course_name = course.name if course else "Unknown Course"
 
-            due_dt = parse_due_datetime(assignment.due_datetime)
+            due_dt = assignment.due
             if due_dt:
                 due_str = due_dt.strftime("%b %d at %I:%M %p")
             else:
@@ -90,3 +76,194 @@ class NotificationManager:
             })
 
         return details
+
+
+class NotificationScheduler:
+    """
+    Fires assignment reminders on time without polling the database.
+
+    Each pending assignment gets a reminder at notification_time on the day
+    notification_days_before days ahead of its due date (or at the due time
+    itself if that comes first). Reminder times sit in a min-heap and a
+    single root.after timer is armed for the earliest one. Writes through
+    the Assignment model and settings changes update the heap in place.
+
+    Reminders whose time has already passed when they are scheduled are
+    skipped; the dashboard banner lists those assignments anyway.
+    """
+
+    # Longest single timer; waking up early just re-arms it, which keeps
+    # reminders on time across sleep/resume and clock changes
+    MAX_TIMER_SECONDS = 3600
+
+    def __init__(self, root, on_fire, clock=datetime.now, dispatch=None):
+        """
+        Args:
+            root: Object with Tk's after/after_cancel/after_idle (usually the Tk root)
+            on_fire: on_fire(assignment_ids) called when reminders come due
+            clock: Returns the current naive local datetime
+            dispatch: Wraps the model subscribers so that writes made on
+                worker threads reach them on the Tk thread (e.g.
+                BackgroundLoader.on_tk_thread); called directly when omitted
+        """
+        self.root = root
+        self.on_fire = on_fire
+        self.clock = clock
+        dispatch = dispatch or (lambda callback: callback)
+        self._on_assignments = dispatch(self.assignments_changed)
+        self._on_settings = dispatch(self.settings_changed)
+        self._due = {}        # assignment id -> due_ts of every pending assignment
+        self._fire_at = {}    # assignment id -> reminder due_ts still to fire
+        self._heap = []       # (fire_ts, id); entries not matching _fire_at are stale
+        self._timer = None
+        self._timer_ts = None
+        self._reload_pending = False
+        self._read_settings()
+
+    @staticmethod
+    def load_pending(now=None):
+        """Query the unsubmitted assignments that are not yet due (indexed range scan)."""
+        return Assignment.due_between(now or datetime.now(), None, exclude_status=SUBMITTED)
+
+    def start(self, pending=None):
+        """
+        Build the heap and begin listening for changes.
+
+        pending is the result of load_pending(), e.g. fetched on a worker
+        thread; it is queried here when omitted.
+        """
+        if pending is None:
+            pending = self.load_pending(self.clock())
+        self._due = {a.id: a.due_ts for a in pending}
+        Assignment.subscribe(self._on_assignments)
+        Settings.subscribe(self._on_settings)
+        self._rebuild()
+
+    def stop(self):
+        """Stop listening for changes and disarm the timer."""
+        Assignment.unsubscribe(self._on_assignments)
+        Settings.unsubscribe(self._on_settings)
+        self._cancel_timer()
+
+    def reload(self, pending=None):
+        """
+        Re-read the settings and every pending assignment.
+
+        Used after bulk writes and changes made by other processes; pending
+        is the result of load_pending() and is queried here when omitted.
+        """
+        self._reload_pending = False
+        if pending is None:
+            pending = self.load_pending(self.clock())
+        self._due = {a.id: a.due_ts for a in pending}
+        self._read_settings()
+        self._rebuild()
+
+    def assignments_changed(self, changes):
+        """Assignment model subscriber: reschedule only the written rows."""
+        if changes is None:
+            # Bulk writes come in batches; reload once they are done
+            if not self._reload_pending:
+                self._reload_pending = True
+                self.root.after_idle(self.reload)
+            return
+
+        now_ts = to_epoch(self.clock())
+        for assignment_id, assignment in changes.items():
+            if (assignment is None or assignment.status == SUBMITTED
+                    or assignment.due_ts is None or assignment.due_ts < now_ts):
+                self._due.pop(assignment_id, None)
+                self._fire_at.pop(assignment_id, None)
+            else:
+                self._due[assignment_id] = assignment.due_ts
+                self._schedule(assignment_id, assignment.due_ts, now_ts)
+        self._arm()
+
+    def settings_changed(self, changes):
+        """Settings subscriber: recompute every reminder time from the cached due times."""
+        keys = {'notifications_enabled', 'notification_days_before', 'notification_time'}
+        if keys & changes.keys():
+            self._read_settings()
+            self._rebuild()
+
+    def next_fire_time(self):
+        """The earliest scheduled reminder as a datetime, or None."""
+        fire_ts = self._peek()
+        return from_epoch(fire_ts) if fire_ts is not None else None
+
+    def _read_settings(self):
+        self.enabled = Settings.get_value('notifications_enabled')
+        self.days_before = Settings.get_value('notification_days_before')
+        self.notify_time = Settings.get_value('notification_time')
+
+    def _fire_time(self, due_ts):
+        """Reminder time (as due_ts seconds) for an assignment due at due_ts."""
+        due = from_epoch(due_ts)
+        fire = datetime.combine(due.date() - timedelta(days=self.days_before), self.notify_time)
+        return min(to_epoch(fire), due_ts)
+
+    def _schedule(self, assignment_id, due_ts, now_ts):
+        """Set one assignment's reminder; an older heap entry for it goes stale."""
+        fire_ts = self._fire_time(due_ts)
+        if fire_ts < now_ts:
+            self._fire_at.pop(assignment_id, None)
+        elif self._fire_at.get(assignment_id) != fire_ts:
+            self._fire_at[assignment_id] = fire_ts
+            heapq.heappush(self._heap, (fire_ts, assignment_id))
+
+    def _rebuild(self):
+        """Recompute every reminder and heapify them in one pass."""
+        now_ts = to_epoch(self.clock())
+        self._due = {i: due_ts for i, due_ts in self._due.items() if due_ts >= now_ts}
+        self._fire_at = {}
+        for assignment_id, due_ts in self._due.items():
+            fire_ts = self._fire_time(due_ts)
+            if fire_ts >= now_ts:
+                self._fire_at[assignment_id] = fire_ts
+        self._heap = [(fire_ts, i) for i, fire_ts in self._fire_at.items()]
+        heapq.heapify(self._heap)
+        self._arm()
+
+    def _peek(self):
+        """Earliest live fire time, dropping stale heap entries on the way."""
+        heap = self._heap
+        while heap and self._fire_at.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _arm(self):
+        """Make sure exactly one timer is set, for the earliest reminder."""
+        fire_ts = self._peek() if self.enabled else None
+        if fire_ts == self._timer_ts and (fire_ts is None or self._timer is not None):
+            return
+        self._cancel_timer()
+        if fire_ts is None:
+            return
+
+        delay = (from_epoch(fire_ts) - self.clock()).total_seconds()
+        delay = min(max(delay, 0), self.MAX_TIMER_SECONDS)
+        self._timer = self.root.after(int(delay * 1000), self._on_timer)
+        self._timer_ts = fire_ts
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        self._timer = None
+        self._timer_ts = None
+
+    def _on_timer(self):
+        """Fire every reminder that has come due, then re-arm for the next."""
+        self._timer = None
+        self._timer_ts = None
+        now_ts = to_epoch(self.clock())
+        fired = []
+        while True:
+            fire_ts = self._peek()
+            if fire_ts is None or fire_ts > now_ts:
+                break
+            _, assignment_id = heapq.heappop(self._heap)
+            del self._fire_at[assignment_id]
+            fired.append(assignment_id)
+        self._arm()
+        if fired:
+            self.on_fire(fired)
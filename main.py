@@ -4,8 +4,11 @@ Entry point for the application
 Spring 2026 Semester
 """
 
+import startup_trace
 from app import PyHomeworkApp
 
+startup_trace.mark("import app")
+
 
 def main():
     """Launch the PyHomework application."""
@@ -2,15 +2,68 @@
 Assignment model and database operations
 """
 
-from db.database import get_connection
-from datetime import datetime
+import re
+from db.database import get_connection, transaction
+from models.cache import query_cache
+from calendar import timegm
+from datetime import datetime, timedelta
+from sys import intern
+
+
+SUBMITTED = "Submitted"
+
+# due_ts holds "wall-clock" epoch seconds: the naive local due time read as
+# if it were UTC. That is exactly what SQLite's strftime('%s', due_datetime)
+# computes, so the schema triggers and Python agree without timezone lookups.
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value):
+    """Convert a datetime (or ISO string) to due_ts seconds; None if unparseable."""
+    if value is None or isinstance(value, int):
+        return value
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+    return timegm(value.utctimetuple())
+
+
+def from_epoch(ts):
+    """Convert due_ts seconds back to a naive datetime."""
+    return EPOCH + timedelta(seconds=ts)
+
+
+# Word characters only: FTS5 query syntax (quotes, operators, column
+# filters) in user input can't break the MATCH expression
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def _fts_query(text):
+    """Turn free text into an FTS5 query where every word must match as a prefix."""
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN.findall(text))
+
+
+def _to_db_datetime(value):
+    """Convert a datetime to the ISO string stored in due_datetime."""
+    return value.isoformat() if isinstance(value, datetime) else value
 
 
 class Assignment:
     """Represents an assignment in the Spring 2026 semester."""
+
+    # Slots keep each record compact (no per-instance __dict__); the order
+    # matches COLUMNS and __init__ so rows map onto records positionally.
+    __slots__ = ('id', 'course_id', 'title', 'type', 'due_datetime', 'status', 'notes', 'due_ts')
+    COLUMNS = "id, course_id, title, type, due_datetime, status, notes, due_ts"
+
+    # Callbacks notified after writes with {id: Assignment, or None if
+    # deleted}, or with None when a bulk write changed an unknown set of rows
+    _subscribers = []
     
     def __init__(self, id=None, course_id=None, title="", type="", 
-                 due_datetime=None, status="Not Started", notes=""):
+                 due_datetime=None, status="Not Started", notes="", due_ts=None):
         self.id = id
         self.course_id = course_id
         self.title = title
@@ -18,73 +71,265 @@ class Assignment:
         self.due_datetime = due_datetime
         self.status = status
         self.notes = notes
+        self.due_ts = due_ts if due_ts is not None else to_epoch(due_datetime)
+
+    @property
+    def row_version(self):
+        """Tuple of every stored field except id; changes whenever the row does."""
+        return (self.course_id, self.title, self.type, self.due_datetime, self.status, self.notes)
+
+    @property
+    def due(self):
+        """Due date as a datetime, derived from due_ts without string parsing."""
+        return from_epoch(self.due_ts) if self.due_ts is not None else None
     
     @staticmethod
     def create(course_id, title, type, due_datetime, status="Not Started", notes=""):
         """Create a new assignment in the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
+        cursor = get_connection().cursor()
         
         # Convert datetime to string for storage
-        due_str = due_datetime.isoformat() if isinstance(due_datetime, datetime) else due_datetime
+        due_str = _to_db_datetime(due_datetime)
         
         cursor.execute(
             """INSERT INTO assignments 
-               (course_id, title, type, due_datetime, status, notes) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (course_id, title, type, due_str, status, notes)
+               (course_id, title, type, due_datetime, status, notes, due_ts) 
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (course_id, title, type, due_str, status, notes, to_epoch(due_datetime))
         )
-        conn.commit()
+        query_cache.invalidate('assignments')
         assignment_id = cursor.lastrowid
-        conn.close()
+        Assignment._notify({
+            assignment_id: Assignment(assignment_id, course_id, title, type, due_str, status, notes)
+        })
         return assignment_id
     
     @staticmethod
-    def get_all():
-        """Retrieve all assignments from the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM assignments ORDER BY due_datetime")
-        rows = cursor.fetchall()
-        conn.close()
-        
-        assignments = []
-        for row in rows:
-            assignment = Assignment(
-                id=row["id"],
-                course_id=row["course_id"],
-                title=row["title"],
-                type=row["type"],
-                due_datetime=row["due_datetime"],
-                status=row["status"],
-                notes=row["notes"]
+    def bulk_create(rows):
+        """
+        Insert many assignments in a single transaction.
+
+        rows is any iterable of (course_id, title, type, due_datetime, status,
+        notes) tuples; it is consumed lazily, so generators stay streaming.
+        Returns the number of rows inserted.
+        """
+        def prepared():
+            for course_id, title, type, due_datetime, status, notes in rows:
+                yield (course_id, title, type, _to_db_datetime(due_datetime), status, notes,
+                       to_epoch(due_datetime))
+
+        with transaction() as conn:
+            cursor = conn.executemany(
+                """INSERT INTO assignments 
+                   (course_id, title, type, due_datetime, status, notes, due_ts) 
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                prepared()
             )
-            assignments.append(assignment)
-        return assignments
+            query_cache.invalidate('assignments')
+        Assignment._notify(None)
+        return cursor.rowcount
+    
+    @staticmethod
+    def get_all():
+        """Retrieve all assignments (served from the query cache when unchanged)."""
+        return list(query_cache.get('assignments', 'all', Assignment._load_all))
+    
+    @staticmethod
+    def _load_all():
+        """Read all assignments from the database."""
+        return Assignment._query(f"SELECT {Assignment.COLUMNS} FROM assignments ORDER BY due_ts, id")
+    
+    @staticmethod
+    def due_between(start, end, exclude_status=None, after_due=None, after_id=None, limit=None):
+        """
+        Retrieve assignments due in [start, end], ordered by due date then id.
+
+        Runs as a range scan on the due_ts index. Bounds may be datetimes,
+        due_ts seconds or None for an open end. For keyset pagination, pass
+        the due_ts and id of the last row of the previous page as
+        after_due/after_id together with limit.
+        """
+        clauses = ["due_ts IS NOT NULL"]
+        params = []
+        if start is not None:
+            clauses.append("due_ts >= ?")
+            params.append(to_epoch(start))
+        if end is not None:
+            clauses.append("due_ts <= ?")
+            params.append(to_epoch(end))
+
+        if exclude_status == SUBMITTED:
+            # Spelled as a literal so the planner can use the partial index
+            # on unsubmitted rows; a bound parameter would rule it out.
+            clauses.append("status != 'Submitted'")
+        elif exclude_status is not None:
+            clauses.append("status != ?")
+            params.append(exclude_status)
+
+        if after_due is not None:
+            if after_id is None:
+                clauses.append("due_ts > ?")
+                params.append(to_epoch(after_due))
+            else:
+                clauses.append("(due_ts, id) > (?, ?)")
+                params.extend((to_epoch(after_due), after_id))
+
+        sql = f"SELECT {Assignment.COLUMNS} FROM assignments WHERE {' AND '.join(clauses)} ORDER BY due_ts, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return Assignment._query(sql, params)
+    
+    @staticmethod
+    def search(query, limit=50):
+        """
+        Full-text search over titles, notes and course names.
+
+        Every word in query must match the start of a word in the
+        assignment. Results are ranked by bm25, weighting title matches
+        above course names and course names above notes.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+        columns = ", ".join(f"a.{column}" for column in Assignment.__slots__)
+        # Rank and cut inside the FTS table first, so only the top rows are
+        # joined back to assignments
+        return Assignment._query(
+            f"""SELECT {columns}
+                FROM (SELECT rowid, bm25(assignments_fts, 10.0, 1.0, 5.0) AS score
+                      FROM assignments_fts
+                      WHERE assignments_fts MATCH ?
+                      ORDER BY score
+                      LIMIT ?) f
+                JOIN assignments a ON a.id = f.rowid
+                ORDER BY f.score""",
+            (match, limit)
+        )
+
+    @staticmethod
+    def without_due_date():
+        """Retrieve assignments whose due date couldn't be parsed (due_ts is NULL)."""
+        return Assignment._query(
+            f"SELECT {Assignment.COLUMNS} FROM assignments WHERE due_ts IS NULL ORDER BY id"
+        )
+    
+    @staticmethod
+    def count_by_category(overdue_until, today_until, soon_until, semester_until):
+        """
+        Count assignments per urgency category, course and status in one query.
+
+        The arguments are the inclusive upper due_ts bound of each category.
+        Returns (category, course_id, status, count) tuples, where category
+        is 'overdue', 'due_today', 'due_soon', 'later' or 'after_semester'.
+        """
+        cursor = get_connection().cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            """SELECT CASE
+                          WHEN due_ts IS NULL THEN 'later'
+                          WHEN due_ts <= ? THEN 'overdue'
+                          WHEN due_ts <= ? THEN 'due_today'
+                          WHEN due_ts <= ? THEN 'due_soon'
+                          WHEN due_ts <= ? THEN 'later'
+                          ELSE 'after_semester'
+                      END AS category,
+                      course_id, status, COUNT(*)
+               FROM assignments
+               GROUP BY category, course_id, status""",
+            (overdue_until, today_until, soon_until, semester_until)
+        )
+        return cursor.fetchall()
+    
+    @staticmethod
+    def due_at(due_ts_values):
+        """Retrieve the assignments due at any of the given due_ts values (index lookups)."""
+        values = list(due_ts_values)
+        found = []
+        # Chunks stay under SQLite's default limit of 999 bound parameters
+        for i in range(0, len(values), 500):
+            chunk = values[i:i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            found.extend(Assignment._query(
+                f"SELECT {Assignment.COLUMNS} FROM assignments WHERE due_ts IN ({placeholders})", chunk))
+        return found
+
+    @staticmethod
+    def _query(sql, params=()):
+        """Run a SELECT of COLUMNS and return the rows as Assignment records."""
+        cursor = get_connection().cursor()
+        cursor.row_factory = Assignment._row_factory
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    
+    @staticmethod
+    def _row_factory(cursor, row):
+        """sqlite3 row factory that maps a COLUMNS tuple straight onto a record."""
+        id, course_id, title, type, due_datetime, status, notes, due_ts = row
+        # type and status repeat across nearly every row; interning lets all
+        # records share one string object per distinct value.
+        return Assignment(id, course_id, title, type and intern(type), due_datetime,
+                          status and intern(status), notes, due_ts)
+    
+    @staticmethod
+    def iter_with_course():
+        """
+        Stream every assignment joined with its course name, in due order.
+
+        Yields plain tuples of (id, course_name, title, type, due_datetime,
+        status, notes, due_ts) straight off the cursor, so callers can walk
+        the whole table in constant memory and format due dates from due_ts
+        without parsing the stored strings.
+        """
+        cursor = get_connection().cursor()
+        cursor.row_factory = None  # Plain tuples; no per-row Row objects
+        cursor.execute(
+            """SELECT a.id, c.name, a.title, a.type, a.due_datetime, a.status, a.notes, a.due_ts
+               FROM assignments a LEFT JOIN courses c ON c.id = a.course_id
+               ORDER BY a.due_ts, a.id"""
+        )
+        yield from cursor
     
     @staticmethod
     def update(assignment_id, course_id, title, type, due_datetime, status, notes):
         """Update an existing assignment."""
-        conn = get_connection()
-        cursor = conn.cursor()
+        cursor = get_connection().cursor()
         
         # Convert datetime to string for storage
-        due_str = due_datetime.isoformat() if isinstance(due_datetime, datetime) else due_datetime
+        due_str = _to_db_datetime(due_datetime)
         
         cursor.execute(
             """UPDATE assignments 
-               SET course_id=?, title=?, type=?, due_datetime=?, status=?, notes=?
+               SET course_id=?, title=?, type=?, due_datetime=?, status=?, notes=?, due_ts=?
                WHERE id=?""",
-            (course_id, title, type, due_str, status, notes, assignment_id)
+            (course_id, title, type, due_str, status, notes, to_epoch(due_datetime), assignment_id)
         )
-        conn.commit()
-        conn.close()
+        query_cache.invalidate('assignments')
+        Assignment._notify({
+            assignment_id: Assignment(assignment_id, course_id, title, type, due_str, status, notes)
+        })
     
     @staticmethod
     def delete(assignment_id):
         """Delete an assignment from the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM assignments WHERE id=?", (assignment_id,))
-        conn.commit()
-        conn.close()
+        get_connection().execute("DELETE FROM assignments WHERE id=?", (assignment_id,))
+        query_cache.invalidate('assignments')
+        Assignment._notify({assignment_id: None})
+
+    @staticmethod
+    def subscribe(callback):
+        """Call callback(changes) after every write made through this model."""
+        Assignment._subscribers.append(callback)
+
+    @staticmethod
+    def unsubscribe(callback):
+        """Stop notifying callback."""
+        if callback in Assignment._subscribers:
+            Assignment._subscribers.remove(callback)
+
+    @staticmethod
+    def _notify(changes):
+        """Tell subscribers which assignments were written."""
+        for callback in list(Assignment._subscribers):
+            callback(changes)
@@ -0,0 +1,175 @@
+"""
+Read-through cache for model queries
+Entries are dropped when the model API writes to a table, and when
+PRAGMA data_version shows another connection changed the database (only
+for the tables whose change counters moved). The app's own commits are
+taken into the counter baseline, so only other processes' writes count
+as external changes
+"""
+
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from db.database import connection_manager, get_connection
+
+
+class QueryCache:
+    """Caches query results per (table, key) until the table changes."""
+
+    def __init__(self, check_interval=0.5):
+        """
+        Args:
+            check_interval: Minimum seconds between PRAGMA data_version checks.
+                Within the interval, hits cost no SQL at all.
+        """
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._generations = defaultdict(int)
+        self._external_generations = defaultdict(int)
+        self._counters = None  # Last seen change_counters, shared by all threads
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        connection_manager.add_transaction_listener(self._flush_pending)
+
+    def get(self, table, key, loader):
+        """Return the cached result for (table, key), calling loader() on a miss."""
+        self._check_external_changes()
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generations[table]
+
+        value = loader()
+
+        with self._lock:
+            # Skip storing if a write landed while the loader was running
+            if self._generations[table] == generation:
+                self._entries[(table, key)] = value
+        return value
+
+    def invalidate(self, table, external=False):
+        """Drop every cached result for table (external: another process wrote it)."""
+        with self._lock:
+            self._generations[table] += 1
+            if external:
+                self._external_generations[table] += 1
+            for cache_key in [k for k in self._entries if k[0] == table]:
+                del self._entries[cache_key]
+        if external:
+            return
+
+        # Readers on other threads can't see uncommitted rows, so they may
+        # re-cache old data before this thread commits; this thread may cache
+        # rows a rollback then discards. Invalidate again when it ends.
+        conn = get_connection()
+        if conn.in_transaction:
+            pending = getattr(self._local, "pending", None)
+            if pending is None:
+                pending = self._local.pending = set()
+            pending.add(table)
+        else:
+            self._record_own_commit(conn, table)
+
+    def invalidate_all(self):
+        """Drop every cached result (counted as an external change to every table)."""
+        with self._lock:
+            tables = {k[0] for k in self._entries} | set(self._generations)
+            for table in tables:
+                self._generations[table] += 1
+                self._external_generations[table] += 1
+            self._entries.clear()
+
+    def generation(self, table, check=True):
+        """
+        Counter that increases every time table's cached results are dropped.
+
+        check=False skips looking for other processes' commits, so the call
+        runs no SQL (for the Tk thread).
+        """
+        if check:
+            self._check_external_changes()
+        with self._lock:
+            return self._generations[table]
+
+    def external_generation(self, table):
+        """Counter that increases only when another process changed table (no check of its own)."""
+        with self._lock:
+            return self._external_generations[table]
+
+    def stats(self):
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+    def _flush_pending(self):
+        """Re-invalidate tables written inside the transaction that just committed or rolled back."""
+        pending = getattr(self._local, "pending", None)
+        if pending:
+            self._local.pending = set()
+            for table in pending:
+                self.invalidate(table)
+
+    def _record_own_commit(self, conn, table):
+        """Take this process's committed write to table into the counter baseline."""
+        # Otherwise the next thread to see data_version move would report the
+        # write as another process's and invalidate the table a second time
+        if self._counters is None:
+            return  # No baseline yet; the first check records one
+        try:
+            row = conn.execute("SELECT counter FROM change_counters WHERE table_name = ?",
+                               (table,)).fetchone()
+        except sqlite3.OperationalError:
+            return
+        if row is not None:
+            with self._lock:
+                self._counters[table] = row[0]
+
+    def _check_external_changes(self):
+        """Drop the cached results of tables other connections wrote since the last check."""
+        now = time.monotonic()
+        if now - getattr(self._local, "checked_at", float("-inf")) < self.check_interval:
+            return
+        self._local.checked_at = now
+
+        # data_version is per connection and only moves for other
+        # connections' commits, so it is tracked per thread.
+        conn = get_connection()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        last = getattr(self._local, "data_version", None)
+        if last is None or getattr(self._local, "conn", None) is not conn:
+            if last is not None:
+                self.invalidate_all()  # New connection; nothing to compare against
+            if self._counters is None:
+                self._changed_tables(conn)  # Record the baseline
+        elif version != last:
+            changed = self._changed_tables(conn)
+            if changed is None:
+                self.invalidate_all()
+            for table in changed or ():
+                self.invalidate(table, external=True)
+        self._local.conn = conn
+        self._local.data_version = version
+
+    def _changed_tables(self, conn):
+        """
+        Tables whose change counter moved since any thread last looked.
+
+        Returns None when the database has no change_counters table.
+        """
+        try:
+            counters = dict(conn.execute("SELECT table_name, counter FROM change_counters"))
+        except sqlite3.OperationalError:
+            return None
+        with self._lock:
+            last, self._counters = self._counters or {}, counters
+        return [table for table, counter in counters.items() if last.get(table) != counter]
+
+
+# Shared cache used by the models
+query_cache = QueryCache()
@@ -2,11 +2,16 @@
 Course model and database operations
 """
 
-from db.database import get_connection
+from db.database import get_connection, transaction
+from models.cache import query_cache
 
 
 class Course:
     """Represents a course in the Spring 2026 semester."""
+
+    # Compact record; slot order matches COLUMNS for positional row mapping
+    __slots__ = ('id', 'name', 'color', 'instructor')
+    COLUMNS = "id, name, color, instructor"
     
     def __init__(self, id=None, name="", color="", instructor=""):
         self.id = id
@@ -17,51 +22,60 @@ class Course:
     @staticmethod
     def create(name, color="", instructor=""):
         """Create a new course in the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
+        cursor = get_connection().cursor()
         cursor.execute(
             "INSERT INTO courses (name, color, instructor) VALUES (?, ?, ?)",
             (name, color, instructor)
         )
-        conn.commit()
-        course_id = cursor.lastrowid
-        conn.close()
-        return course_id
+        query_cache.invalidate('courses')
+        return cursor.lastrowid
     
     @staticmethod
-    def get_all():
-        """Retrieve all courses from the database."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM courses ORDER BY name")
-        rows = cursor.fetchall()
-        conn.close()
-        
-        courses = []
-        for row in rows:
-            course = Course(
-                id=row["id"],
-                name=row["name"],
-                color=row["color"],
-                instructor=row["instructor"]
+    def bulk_create(rows):
+        """
+        Insert many courses in a single transaction.
+
+        rows is any iterable of (name, color, instructor) tuples.
+        Returns the number of rows inserted.
+        """
+        with transaction() as conn:
+            cursor = conn.executemany(
+                "INSERT INTO courses (name, color, instructor) VALUES (?, ?, ?)",
+                rows
             )
-            courses.append(course)
-        return courses
+            query_cache.invalidate('courses')
+            return cursor.rowcount
+    
+    @staticmethod
+    def get_all():
+        """Retrieve all courses (served from the query cache when unchanged)."""
+        return list(query_cache.get('courses', 'all', Course._load_all))
+    
+    @staticmethod
+    def _load_all():
+        """Read all courses from the database."""
+        return Course._query(f"SELECT {Course.COLUMNS} FROM courses ORDER BY name")
     
     @staticmethod
     def get_by_id(course_id):
         """Retrieve a specific course by ID."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM courses WHERE id = ?", (course_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            return Course(
-                id=row["id"],
-                name=row["name"],
-                color=row["color"],
-                instructor=row["instructor"]
-            )
-        return None
+        return query_cache.get('courses', ('id', course_id), lambda: Course._load_by_id(course_id))
+    
+    @staticmethod
+    def _load_by_id(course_id):
+        """Read a single course from the database."""
+        rows = Course._query(f"SELECT {Course.COLUMNS} FROM courses WHERE id = ?", (course_id,))
+        return rows[0] if rows else None
+    
+    @staticmethod
+    def _query(sql, params=()):
+        """Run a SELECT of COLUMNS and return the rows as Course records."""
+        cursor = get_connection().cursor()
+        cursor.row_factory = Course._row_factory
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    
+    @staticmethod
+    def _row_factory(cursor, row):
+        """sqlite3 row factory that maps a COLUMNS tuple straight onto a record."""
+        return Course(*row)
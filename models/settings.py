@@ -1,8 +1,31 @@
 """
 User settings model and database operations
+All settings are loaded once into an in-memory snapshot; reads are served
+from memory and writes are batched into a single transaction
 """
 
-from db.database import get_connection
+from datetime import datetime, time
+from db.database import get_connection, transaction
+from models.cache import query_cache
+
+
+def _parse_bool(value):
+    """Parse a stored 'true'/'false' flag."""
+    return value == 'true'
+
+
+def _parse_time(value):
+    """Parse a stored HH:MM time of day."""
+    return datetime.strptime(value, "%H:%M").time()
+
+
+def _format_value(value):
+    """Convert a typed value back to its stored string form."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    return str(value)
 
 
 class Settings:
@@ -16,53 +39,122 @@ class Settings:
         'notification_time': '09:00'
     }
 
+    # Parsers from stored strings to typed values; unknown keys stay strings
+    PARSERS = {
+        'notifications_enabled': _parse_bool,
+        'notification_days_before': int,
+        'notification_time': _parse_time,
+    }
+
+    # Callbacks notified with {key: typed_value} after values change
+    _subscribers = []
+
+    @staticmethod
+    def _snapshot():
+        """Get (raw strings, typed values, stored keys), loading them on first use."""
+        return query_cache.get('user_settings', 'snapshot', Settings._load)
+
+    @staticmethod
+    def _load():
+        """Read every setting row in one query and parse the typed values."""
+        cursor = get_connection().cursor()
+        cursor.execute("SELECT setting_key, setting_value FROM user_settings")
+
+        # Start with defaults and override with database values
+        raw = Settings.DEFAULTS.copy()
+        stored = set()
+        for row in cursor.fetchall():
+            raw[row["setting_key"]] = row["setting_value"]
+            stored.add(row["setting_key"])
+
+        typed = {key: Settings._parse(key, value) for key, value in raw.items()}
+        return raw, typed, stored
+
+    @staticmethod
+    def _parse(key, value):
+        """Parse a stored string, falling back to the default if it's malformed."""
+        parser = Settings.PARSERS.get(key)
+        if parser is None:
+            return value
+        try:
+            return parser(value)
+        except (ValueError, TypeError):
+            return parser(Settings.DEFAULTS[key])
+
     @staticmethod
     def get(key, default=None):
-        """Get a setting value by key."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT setting_value FROM user_settings WHERE setting_key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return row["setting_value"]
+        """Get a setting value by key, as its stored string."""
+        value = Settings._snapshot()[0].get(key)
+        if value is not None:
+            return value
         return default if default is not None else Settings.DEFAULTS.get(key)
 
+    @staticmethod
+    def get_value(key):
+        """Get a setting as a typed value (bool, int, datetime.time or str)."""
+        return Settings._snapshot()[1].get(key)
+
+    @staticmethod
+    def snapshot():
+        """Get all settings as typed values."""
+        return dict(Settings._snapshot()[1])
+
     @staticmethod
     def set(key, value):
         """Set a setting value (INSERT or UPDATE)."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO user_settings (setting_key, setting_value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
-            (key, str(value))
-        )
-        conn.commit()
-        conn.close()
+        Settings.set_many({key: value})
 
     @staticmethod
-    def get_all():
-        """Get all settings as a dictionary."""
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT setting_key, setting_value FROM user_settings")
-        rows = cursor.fetchall()
-        conn.close()
+    def set_many(values):
+        """
+        Write several settings in a single transaction.
 
-        # Start with defaults and override with database values
-        settings = Settings.DEFAULTS.copy()
-        for row in rows:
-            settings[row["setting_key"]] = row["setting_value"]
+        Values may be typed or strings. Only keys whose value actually changed
+        are written; subscribers are then told about those keys.
+        """
+        current, _, stored = Settings._snapshot()
+        changes = {}
+        for key, value in values.items():
+            value = _format_value(value)
+            if current.get(key) != value or key not in stored:
+                changes[key] = value
+        if not changes:
+            return
+
+        with transaction() as conn:
+            conn.executemany(
+                """INSERT INTO user_settings (setting_key, setting_value, updated_at)
+                   VALUES (?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT (setting_key) DO UPDATE
+                   SET setting_value = excluded.setting_value, updated_at = CURRENT_TIMESTAMP""",
+                changes.items()
+            )
+            query_cache.invalidate('user_settings')
 
-        return settings
+        changed = {key: Settings._parse(key, value) for key, value in changes.items()}
+        for callback in list(Settings._subscribers):
+            callback(changed)
+
+    @staticmethod
+    def subscribe(callback):
+        """Call callback({key: typed_value}) whenever settings change."""
+        Settings._subscribers.append(callback)
+
+    @staticmethod
+    def unsubscribe(callback):
+        """Stop notifying callback."""
+        if callback in Settings._subscribers:
+            Settings._subscribers.remove(callback)
+
+    @staticmethod
+    def get_all():
+        """Get all settings as a dictionary."""
+        return dict(Settings._snapshot()[0])
 
     @staticmethod
     def initialize_defaults():
         """Initialize default settings if they don't exist."""
-        existing_settings = Settings.get_all()
-
-        # Only insert defaults that don't already exist
-        for key, value in Settings.DEFAULTS.items():
-            if key not in existing_settings or existing_settings[key] is None:
-                Settings.set(key, value)
+        stored = Settings._snapshot()[2]
+        missing = {key: value for key, value in Settings.DEFAULTS.items() if key not in stored}
+        if missing:
+            Settings.set_many(missing)
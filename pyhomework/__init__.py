@@ -0,0 +1 @@
+# Command-line interface package
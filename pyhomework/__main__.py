@@ -0,0 +1,9 @@
+"""
+Entry point for python -m pyhomework
+"""
+
+from pyhomework.cli import main
+
+
+if __name__ == "__main__":
+    main()
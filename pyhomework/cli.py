@@ -0,0 +1,251 @@
+"""
+Headless command-line interface
+Works without a display server: only models/ and logic/ are used, never
+tkinter or ui/. Listing commands write each row as it is read
+
+Usage:
+    python -m pyhomework list [--course NAME] [--status STATUS] [--pending]
+    python -m pyhomework due --within 2d
+    python -m pyhomework add --course NAME --title TITLE --due "2026-03-01 23:59"
+    python -m pyhomework import FILE
+    python -m pyhomework export --format ics -o semester.ics
+    python -m pyhomework stats
+    python -m pyhomework --profile-sql stats   (SQL timings on stderr)
+"""
+
+import argparse
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from db.database import connection_manager, get_connection
+from db.migrations import migrate
+from db.profiler import query_profiler
+from models.assignment import Assignment, SUBMITTED, from_epoch
+from models.course import Course
+
+
+LIST_FORMATS = ('tsv', 'jsonl')
+
+# Assignment page size for streaming range queries
+PAGE_SIZE = 500
+
+_DURATION = re.compile(r"^(\d+)\s*([mhdw])$")
+_DURATION_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+
+def parse_duration(value):
+    """Parse a duration like 90m, 12h, 2d or 1w."""
+    match = _DURATION.match(value.strip().lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid duration {value!r} (use e.g. 12h, 2d, 1w)")
+    amount, unit = match.groups()
+    return timedelta(**{_DURATION_UNITS[unit]: int(amount)})
+
+
+def parse_due(value):
+    """Parse a due date given as 'YYYY-MM-DD HH:MM' or 'YYYY-MM-DD' (due 23:59)."""
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d"):
+        try:
+            due = datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+        return due.replace(hour=23, minute=59) if fmt == "%Y-%m-%d" else due
+    raise argparse.ArgumentTypeError(f"invalid due date {value!r} (use YYYY-MM-DD [HH:MM])")
+
+
+def _format_due(due_ts, due_datetime):
+    """Show a due date as 'YYYY-MM-DD HH:MM' (unparseable ones as stored)."""
+    if due_ts is None:
+        return due_datetime or ""
+    return from_epoch(due_ts).strftime("%Y-%m-%d %H:%M")
+
+
+def write_tsv(rows, out):
+    """Write (id, course, title, type, due_datetime, status, notes, due_ts) rows as tab-separated lines."""
+    count = 0
+    for id, course, title, type, due_datetime, status, _, due_ts in rows:
+        fields = (str(id), _format_due(due_ts, due_datetime), status or "", course or "", title, type or "")
+        # Tabs and newlines inside fields would break the line format
+        out.write("\t".join(f.replace("\t", " ").replace("\n", " ") for f in fields))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def write_rows(rows, out, format):
+    """Stream rows in the requested list format; returns the row count."""
+    if format == 'jsonl':
+        from logic.exporter import write_jsonl
+        return write_jsonl(rows, out)
+    return write_tsv(rows, out)
+
+
+def iter_due(start, end):
+    """Stream unsubmitted assignments due in [start, end] as export-shaped rows."""
+    courses = {c.id: c.name for c in Course.get_all()}
+    after_due = after_id = None
+    while True:
+        # Keyset pagination keeps memory flat however wide the window is
+        page = Assignment.due_between(start, end, exclude_status=SUBMITTED,
+                                      after_due=after_due, after_id=after_id, limit=PAGE_SIZE)
+        for a in page:
+            yield (a.id, courses.get(a.course_id), a.title, a.type, a.due_datetime, a.status, a.notes,
+                   a.due_ts)
+        if len(page) < PAGE_SIZE:
+            return
+        after_due, after_id = page[-1].due_ts, page[-1].id
+
+
+def cmd_list(args):
+    """List every assignment in due order."""
+    rows = Assignment.iter_with_course()
+    if args.course:
+        rows = (r for r in rows if r[1] == args.course)
+    if args.status:
+        rows = (r for r in rows if r[5] == args.status)
+    if args.pending:
+        rows = (r for r in rows if r[5] != SUBMITTED)
+    write_rows(rows, sys.stdout, args.format)
+    return 0
+
+
+def cmd_due(args):
+    """List unsubmitted assignments due within a time window."""
+    now = datetime.now()
+    start = None if args.overdue else now
+    write_rows(iter_due(start, now + args.within), sys.stdout, args.format)
+    return 0
+
+
+def cmd_add(args):
+    """Add one assignment."""
+    course_id = None
+    if args.course.isdigit() and Course.get_by_id(int(args.course)):
+        course_id = int(args.course)
+    else:
+        matches = [c.id for c in Course.get_all() if c.name == args.course]
+        if matches:
+            course_id = matches[0]
+        elif args.create_course:
+            course_id = Course.create(args.course, "", "")
+    if course_id is None:
+        print(f"error: no course named {args.course!r} (pass --create-course to add it)",
+              file=sys.stderr)
+        return 1
+
+    assignment_id = Assignment.create(course_id, args.title, args.type, args.due,
+                                      args.status, args.notes)
+    print(assignment_id)
+    return 0
+
+
+def cmd_import(args):
+    """Import assignments from a CSV or iCalendar file."""
+    from logic.importer import import_file
+    result = import_file(args.file, args.format, args.default_course, args.batch_size)
+    print(result, file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    """Export every assignment as CSV, JSON Lines or iCalendar."""
+    from logic.exporter import export_assignments, export_to_path
+    if args.output:
+        count = export_to_path(args.output, args.format)
+    else:
+        count = export_assignments(sys.stdout, args.format or "csv")
+    print(f"Exported {count} assignments", file=sys.stderr)
+    return 0
+
+
+def cmd_stats(args):
+    """Print assignment counts per urgency category, status and course."""
+    from logic.deadline import CATEGORIES, summarize
+    summary = summarize(datetime.now())
+    courses = {c.id: c.name for c in Course.get_all()}
+
+    out = sys.stdout
+    out.write(f"Total: {summary['total']}\n\n")
+    out.write("By category:\n")
+    for category in CATEGORIES:
+        out.write(f"  {category:<12} {summary['categories'][category]:>8}\n")
+    for title, group, label in (("By status", 'by_status', lambda key: key),
+                                ("By course", 'by_course', lambda key: courses.get(key, f"#{key}"))):
+        out.write(f"\n{title}:\n")
+        for key, counts in sorted(summary[group].items(), key=lambda item: str(label(item[0]))):
+            out.write(f"  {str(label(key)):<30} {sum(counts.values()):>8}\n")
+    return 0
+
+
+def build_parser():
+    """Build the argument parser for every subcommand."""
+    parser = argparse.ArgumentParser(prog="pyhomework", description="PyHomework from the command line.")
+    parser.add_argument("--db", help="database file (default: the app's database)")
+    parser.add_argument("--profile-sql", action="store_true",
+                        help="print per-statement SQL timings to stderr afterwards")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("list", help="list assignments in due order")
+    p.add_argument("--course", help="only this course (exact name)")
+    p.add_argument("--status", help="only this status")
+    p.add_argument("--pending", action="store_true", help="skip submitted assignments")
+    p.add_argument("--format", choices=LIST_FORMATS, default="tsv")
+    p.set_defaults(func=cmd_list)
+
+    p = commands.add_parser("due", help="list unsubmitted assignments due soon")
+    p.add_argument("--within", type=parse_duration, default=timedelta(days=7),
+                   help="time window such as 12h, 2d or 1w (default: 7d)")
+    p.add_argument("--overdue", action="store_true", help="include assignments already past due")
+    p.add_argument("--format", choices=LIST_FORMATS, default="tsv")
+    p.set_defaults(func=cmd_due)
+
+    p = commands.add_parser("add", help="add an assignment")
+    p.add_argument("--course", required=True, help="course name or id")
+    p.add_argument("--create-course", action="store_true", help="create the course if it doesn't exist")
+    p.add_argument("--title", required=True)
+    p.add_argument("--due", required=True, type=parse_due, help="YYYY-MM-DD [HH:MM]")
+    p.add_argument("--type", default="Homework")
+    p.add_argument("--status", default="Not Started")
+    p.add_argument("--notes", default="")
+    p.set_defaults(func=cmd_add)
+
+    p = commands.add_parser("import", help="import assignments from CSV or iCalendar")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("csv", "ics"), help="default: from the file extension")
+    p.add_argument("--default-course", default="Imported", help="course for rows without one")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.set_defaults(func=cmd_import)
+
+    p = commands.add_parser("export", help="export all assignments")
+    p.add_argument("--format", choices=("csv", "jsonl", "ics"),
+                   help="default: from the output file extension, else csv")
+    p.add_argument("-o", "--output", help="output file (default: stdout)")
+    p.set_defaults(func=cmd_export)
+
+    p = commands.add_parser("stats", help="show assignment counts")
+    p.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+    if args.profile_sql:
+        query_profiler.enable()  # Before the first connection is opened
+    if args.db:
+        connection_manager.configure(db_path=args.db)
+
+    # Make sure the tables exist without the GUI's startup side effects
+    migrate(get_connection())
+
+    try:
+        status = args.func(args)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; silence the flush at exit too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        status = 0
+    if args.profile_sql:
+        print(query_profiler.report(connection_manager.db_path), file=sys.stderr)
+    sys.exit(status)
@@ -0,0 +1,33 @@
+"""
+Startup timing instrumentation
+Set PYHOMEWORK_STARTUP_TRACE=1 to print how long each startup phase took
+"""
+
+import os
+import sys
+import time
+
+
+ENABLED = os.environ.get("PYHOMEWORK_STARTUP_TRACE", "") not in ("", "0")
+
+_start = time.perf_counter()
+_last = _start
+_seen = set()
+
+
+def mark(phase):
+    """
+    Record that phase just finished.
+
+    Prints the phase's own duration and the total since startup to stderr.
+    Each phase is reported once, so marks on code paths that run again
+    later (like a dashboard reload) are ignored.
+    """
+    global _last
+    if not ENABLED or phase in _seen:
+        return
+    _seen.add(phase)
+    now = time.perf_counter()
+    print(f"[startup] {(now - _last) * 1000:8.1f} ms  {(now - _start) * 1000:8.1f} ms total  {phase}",
+          file=sys.stderr)
+    _last = now
@@ -0,0 +1,26 @@
+"""
+Shared test fixtures
+Each test gets its own migrated database file
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database import connection_manager, get_connection  # noqa: E402
+from db.migrations import migrate  # noqa: E402
+from models.cache import query_cache  # noqa: E402
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Point the connection manager at a fresh, migrated database."""
+    connection_manager.configure(db_path=str(tmp_path / "test.db"))
+    migrate(get_connection())
+    query_cache.invalidate_all()
+    yield get_connection()
+    connection_manager.close_all()
+    query_cache.invalidate_all()
@@ -0,0 +1,39 @@
+"""
+Assignment query tests
+"""
+
+from datetime import datetime, timedelta
+
+from models.assignment import Assignment
+from models.course import Course
+
+
+def test_due_between_keyset_pages_skip_and_repeat_nothing(database):
+    course_id = Course.create("Math", "", "")
+    start = datetime(2026, 3, 1, 9, 0)
+    end = datetime(2026, 3, 3, 9, 0)
+    # Five rows share one due time, so every page boundary below falls among them
+    dues = ([start - timedelta(minutes=1), start, start]
+            + [start + timedelta(days=1)] * 5
+            + [end, end + timedelta(minutes=1)])
+    ids = {}
+    for i, due in enumerate(dues):
+        ids[Assignment.create(course_id, f"Task {i}", "Homework", due, "Not Started", "")] = due
+    expected = [i for i, due in sorted(ids.items(), key=lambda item: (item[1], item[0]))
+                if start <= due <= end]
+
+    for page_size in (1, 2, 3, 4):
+        seen = []
+        after_due = after_id = None
+        for _ in range(len(dues) + 1):  # A stuck cursor fails instead of looping
+            page = Assignment.due_between(start, end, after_due=after_due, after_id=after_id,
+                                          limit=page_size)
+            seen.extend(a.id for a in page)
+            if len(page) < page_size:
+                break
+            after_due, after_id = page[-1].due_ts, page[-1].id
+        assert seen == expected, f"page size {page_size}"
+
+    # Both bounds are inclusive
+    assert [a.id for a in Assignment.due_between(start, end)] == expected
+    assert len(expected) == 8
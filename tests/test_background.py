@@ -0,0 +1,60 @@
+"""
+Background loader tests
+A fake root stands in for Tk: after() callbacks are run by pump()
+"""
+
+import threading
+import time
+
+from ui.background import BackgroundLoader
+
+
+class FakeRoot:
+    """Just enough of Tk's scheduling API for the loader."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def pump(self, loader, timeout=5):
+        """Run scheduled callbacks until the loader has nothing pending."""
+        deadline = time.monotonic() + timeout
+        while loader.pending():
+            assert time.monotonic() < deadline, "tasks did not finish"
+            for after_id in list(self.callbacks):
+                self.callbacks.pop(after_id)()
+            time.sleep(0.001)
+
+
+def test_calls_from_a_worker_arrive_on_the_tk_thread_before_on_done():
+    root = FakeRoot()
+    loader = BackgroundLoader(root)
+    events = []
+    notify = loader.on_tk_thread(lambda changes: events.append(("notified", changes, threading.get_ident())))
+
+    def write():
+        notify({1: "row"})
+        return 1
+
+    loader.submit(None, write, lambda result: events.append(("done", result, threading.get_ident())))
+    root.pump(loader)
+    loader.shutdown()
+
+    tk_thread = threading.get_ident()
+    assert events == [("notified", {1: "row"}, tk_thread), ("done", 1, tk_thread)]
+
+
+def test_calls_on_the_tk_thread_run_immediately():
+    loader = BackgroundLoader(FakeRoot())
+    calls = []
+    loader.on_tk_thread(calls.append)("now")
+    assert calls == ["now"]
+    loader.shutdown()
@@ -0,0 +1,68 @@
+"""
+UI budget gate tests
+The measurements need a display; the gate that judges them doesn't
+"""
+
+import json
+
+import pytest
+
+from benchmarks import bench_ui
+
+
+MEASURED = {
+    "startup": {'seconds': 0.4, 'widgets': 120, 'tcl_commands': 9000},
+    "dashboard scroll": {'seconds': 0.02, 'widgets': 0, 'tcl_commands': 300},
+}
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    """Budgets written from MEASURED by --write-budgets; returns a main() runner."""
+    monkeypatch.setattr(bench_ui, "ensure_display", lambda argv: None)
+    results = {'value': MEASURED}
+    monkeypatch.setattr(bench_ui, "run", lambda rows, repeat, seed: results['value'])
+    path = str(tmp_path / "budgets.json")
+    bench_ui.main(["--write-budgets", path])
+
+    def check(measured):
+        results['value'] = measured
+        bench_ui.main(["--budgets", path])
+    check.path = path
+    return check
+
+
+def test_written_budgets_pass_the_run_they_were_measured_from(recorded):
+    with open(recorded.path, encoding="utf-8") as f:
+        config = json.load(f)
+    assert set(config['budgets']) == set(MEASURED)
+    recorded(MEASURED)  # No SystemExit
+
+
+def test_injected_regression_fails_the_check(recorded):
+    slower = dict(MEASURED, startup=dict(MEASURED["startup"], seconds=MEASURED["startup"]['seconds'] * 2))
+    with pytest.raises(SystemExit) as exit_info:
+        recorded(slower)
+    assert exit_info.value.code == 1
+
+
+def test_extra_widgets_fail_the_check(recorded):
+    leaky = dict(MEASURED, **{"dashboard scroll": dict(MEASURED["dashboard scroll"], widgets=50)})
+    with pytest.raises(SystemExit) as exit_info:
+        recorded(leaky)
+    assert exit_info.value.code == 1
+
+
+def test_unbudgeted_scenario_fails_the_check(recorded):
+    with pytest.raises(SystemExit) as exit_info:
+        recorded(dict(MEASURED, **{"new view": MEASURED["startup"]}))
+    assert exit_info.value.code == 1
+
+
+def test_empty_budgets_file_is_refused(tmp_path, monkeypatch):
+    monkeypatch.setattr(bench_ui, "ensure_display", lambda argv: None)
+    path = tmp_path / "budgets.json"
+    path.write_text(json.dumps({'rows': 10000, 'budgets': {}}), encoding="utf-8")
+    with pytest.raises(SystemExit) as exit_info:
+        bench_ui.main(["--budgets", str(path)])
+    assert exit_info.value.code == 2
@@ -0,0 +1,77 @@
+"""
+Query cache consistency tests
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from logic.importer import import_records
+from models.assignment import Assignment
+from models.cache import query_cache
+from models.course import Course
+
+
+def test_rollback_drops_rows_cached_inside_the_transaction(database):
+    def records():
+        yield {'course': "Ghost", 'title': "Essay", 'due': datetime(2026, 3, 1, 23, 59)}
+        raise RuntimeError("bad input")
+
+    with pytest.raises(RuntimeError):
+        import_records(records(), batch_size=1)
+
+    assert database.execute("SELECT count(*) FROM courses").fetchone()[0] == 0
+    assert Course.get_all() == []
+
+
+def test_cache_is_usable_after_a_rollback(database):
+    def records():
+        yield {'course': "Ghost", 'title': "Essay", 'due': datetime(2026, 3, 1, 23, 59)}
+        raise RuntimeError("bad input")
+
+    with pytest.raises(RuntimeError):
+        import_records(records(), batch_size=1)
+
+    course_id = Course.create("Real", "", "")
+    assert [c.name for c in Course.get_all()] == ["Real"]
+    Assignment.create(course_id, "Essay", "Homework", datetime(2026, 3, 1, 23, 59), "Not Started", "")
+    assert len(Assignment.get_all()) == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        Assignment.create(course_id + 1, "Orphan", "Homework", datetime(2026, 3, 1), "Not Started", "")
+
+
+def _check_on(worker):
+    """Run the cache's change check on the worker thread."""
+    return worker.submit(query_cache.generation, 'assignments').result()
+
+
+def test_own_write_is_not_reported_again_by_another_thread(database, monkeypatch):
+    monkeypatch.setattr(query_cache, "check_interval", 0)
+    course_id = Course.create("Math", "", "")
+    with ThreadPoolExecutor(1) as worker:
+        _check_on(worker)  # The worker's connection records its data_version
+        before = query_cache.generation('assignments')
+        external = query_cache.external_generation('assignments')
+        Assignment.create(course_id, "Essay", "Homework", datetime(2026, 3, 1, 23, 59), "Not Started", "")
+        assert query_cache.generation('assignments') == before + 1
+        assert _check_on(worker) == before + 1
+    assert query_cache.external_generation('assignments') == external
+
+
+def test_other_process_write_is_reported_as_external(database, monkeypatch, tmp_path):
+    monkeypatch.setattr(query_cache, "check_interval", 0)
+    course_id = Course.create("Math", "", "")
+    with ThreadPoolExecutor(1) as worker:
+        _check_on(worker)
+        before = query_cache.generation('assignments')
+        external = {table: query_cache.external_generation(table) for table in ('assignments', 'courses')}
+        other = sqlite3.connect(str(tmp_path / "test.db"))
+        with other:
+            other.execute("INSERT INTO assignments (course_id, title, due_datetime) VALUES (?, 'Lab', "
+                          "'2026-03-02T10:00:00')", (course_id,))
+        other.close()
+        assert _check_on(worker) == before + 1
+    assert query_cache.external_generation('assignments') == external['assignments'] + 1
+    assert query_cache.external_generation('courses') == external['courses']
@@ -0,0 +1,26 @@
+"""
+Deadline categorization tests
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from logic.deadline import categorize_many
+from models.assignment import to_epoch
+
+
+def test_categorize_many_splits_sorted_assignments():
+    now = datetime(2026, 3, 2, 12, 0)
+    due_dates = [now - timedelta(days=1), now + timedelta(hours=2),
+                 now + timedelta(days=3), now + timedelta(days=30)]
+    items = [SimpleNamespace(due_ts=to_epoch(due)) for due in due_dates]
+    undated = SimpleNamespace(due_ts=None)
+
+    buckets = categorize_many(items + [undated], now)
+
+    assert buckets == {
+        'overdue': [items[0]],
+        'due_today': [items[1]],
+        'due_soon': [items[2]],
+        'later': [items[3], undated],
+    }
@@ -0,0 +1,54 @@
+"""
+Export/import round-trip tests
+"""
+
+from datetime import datetime
+
+from logic.exporter import export_to_path
+from logic.importer import import_file
+from models.assignment import Assignment
+from models.cache import query_cache
+from models.course import Course
+
+
+def test_ics_export_round_trips_status_and_type(database, tmp_path):
+    course_id = Course.create("Chemistry 101", "Blue", "")
+    Assignment.create(course_id, "Lab 3 Report", "Lab", datetime(2026, 3, 2, 17, 0), "Submitted", "")
+    Assignment.create(course_id, "Quiz 1", "Quiz", datetime(2026, 3, 5, 9, 0), "In Progress", "Ch. 1-2")
+    path = str(tmp_path / "semester.ics")
+    export_to_path(path)
+
+    # Into the same database: everything is already there
+    result = import_file(path)
+    assert (result.imported, result.duplicates) == (0, 2)
+
+    # Into an empty database: fields survive the trip
+    database.execute("DELETE FROM assignments")
+    database.execute("DELETE FROM courses")
+    query_cache.invalidate_all()  # Raw deletes bypass the models
+    result = import_file(path)
+    assert result.imported == 2
+    rows = {a.title: (a.type, a.status, a.notes) for a in Assignment.get_all()}
+    assert rows == {"Lab 3 Report": ("Lab", "Submitted", ""),
+                    "Quiz 1": ("Quiz", "In Progress", "Ch. 1-2")}
+    assert [c.name for c in Course.get_all()] == ["Chemistry 101"]
+
+    # Importing the same calendar again adds nothing
+    result = import_file(path)
+    assert (result.imported, result.duplicates) == (0, 2)
+
+
+def test_ics_export_round_trips_backslashes_and_separators(database, tmp_path):
+    course_id = Course.create("Computing", "", "")
+    notes = "Save to C:\\new folder\\nested;\nthen zip it, twice \\\\ ok"
+    Assignment.create(course_id, "Paths; commas, and C:\\temp", "Project",
+                      datetime(2026, 4, 1, 12, 0), "Not Started", notes)
+    path = str(tmp_path / "semester.ics")
+    export_to_path(path)
+
+    database.execute("DELETE FROM assignments")
+    query_cache.invalidate_all()
+    assert import_file(path).imported == 1
+    [assignment] = Assignment.get_all()
+    assert assignment.title == "Paths; commas, and C:\\temp"
+    assert assignment.notes == notes
@@ -0,0 +1,126 @@
+"""
+Reminder scheduler tests
+A fake root records after() timers and a fake clock stands in for the wall clock
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from logic.notifications import NotificationScheduler
+from models.assignment import Assignment
+from models.course import Course
+from models.settings import Settings
+
+
+class FakeRoot:
+    """Records the timers the scheduler arms instead of running a Tk loop."""
+
+    def __init__(self):
+        self.timers = {}
+        self.idle = []
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        self.timers[self._next_id] = (ms, callback)
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def only_timer(self):
+        """The single armed timer as (ms, callback)."""
+        assert len(self.timers) == 1
+        return next(iter(self.timers.values()))
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+NOW = datetime(2026, 3, 1, 8, 0)
+
+
+@pytest.fixture
+def scheduler(database):
+    """A started scheduler at NOW with the default settings (1 day before, 09:00)."""
+    root = FakeRoot()
+    clock = FakeClock(NOW)
+    fired = []
+    scheduler = NotificationScheduler(root, fired.extend, clock=clock)
+    scheduler.start([])
+    scheduler.fake_clock, scheduler.fired = clock, fired
+    scheduler.course_id = Course.create("Math", "", "")
+    yield scheduler
+    scheduler.stop()
+
+
+def add(scheduler, due, title="Homework"):
+    return Assignment.create(scheduler.course_id, title, "Homework", due, "Not Started", "")
+
+
+def test_adding_an_assignment_schedules_its_reminder(scheduler):
+    add(scheduler, datetime(2026, 3, 3, 23, 59))
+    assert scheduler.next_fire_time() == datetime(2026, 3, 2, 9, 0)
+
+
+def test_reminder_never_comes_after_the_due_time(scheduler):
+    Settings.set('notification_days_before', 0)
+    add(scheduler, datetime(2026, 3, 2, 7, 0))
+    assert scheduler.next_fire_time() == datetime(2026, 3, 2, 7, 0)
+
+
+def test_submitting_or_deleting_removes_the_reminder(scheduler):
+    due = datetime(2026, 3, 3, 23, 59)
+    first = add(scheduler, due, "First")
+    second = add(scheduler, due, "Second")
+    Assignment.update(first, scheduler.course_id, "First", "Homework", due, "Submitted", "")
+    assert scheduler.next_fire_time() is not None
+    Assignment.delete(second)
+    assert scheduler.next_fire_time() is None
+    assert scheduler.root.timers == {}
+
+
+def test_changing_the_reminder_lead_rebuilds_every_reminder(scheduler):
+    add(scheduler, datetime(2026, 3, 4, 12, 0), "Later")
+    add(scheduler, datetime(2026, 3, 3, 12, 0), "Sooner")
+    Settings.set('notification_days_before', 2)
+    assert scheduler.next_fire_time() == datetime(2026, 3, 1, 9, 0)
+    Settings.set('notification_time', "07:30")  # Now in the past for the sooner one
+    assert scheduler.next_fire_time() == datetime(2026, 3, 2, 7, 30)
+
+
+def test_timer_fires_due_reminders_and_rearms_for_the_next(scheduler):
+    Settings.set('notification_days_before', 0)  # Remind at the due time itself
+    sooner = add(scheduler, datetime(2026, 3, 1, 8, 30), "Sooner")
+    add(scheduler, datetime(2026, 3, 1, 8, 45), "Later")
+    ms, callback = scheduler.root.only_timer()
+    assert ms == 30 * 60 * 1000
+
+    scheduler.fake_clock.now = datetime(2026, 3, 1, 8, 30)
+    scheduler.root.timers.clear()
+    callback()
+    assert scheduler.fired == [sooner]
+    assert scheduler.root.only_timer()[0] == 15 * 60 * 1000
+    assert scheduler.next_fire_time() == datetime(2026, 3, 1, 8, 45)
+
+
+def test_long_waits_are_capped_and_rearmed_without_firing(scheduler):
+    add(scheduler, datetime(2026, 3, 3, 23, 59))
+    ms, callback = scheduler.root.only_timer()
+    assert ms == NotificationScheduler.MAX_TIMER_SECONDS * 1000
+
+    scheduler.fake_clock.now = NOW + timedelta(seconds=NotificationScheduler.MAX_TIMER_SECONDS)
+    scheduler.root.timers.clear()
+    callback()
+    assert scheduler.fired == []
+    assert scheduler.root.only_timer()[0] == NotificationScheduler.MAX_TIMER_SECONDS * 1000
+    assert scheduler.next_fire_time() == datetime(2026, 3, 2, 9, 0)
@@ -0,0 +1,66 @@
+"""
+SQL profiler tests
+"""
+
+import sys
+
+import pytest
+
+from db.database import connection_manager, get_connection
+from db.profiler import _class_qualname, query_profiler
+from models.assignment import Assignment
+from models.course import Course
+
+
+class Model:
+    @staticmethod
+    def static_method():
+        return sys._getframe()
+
+    def method(self):
+        return sys._getframe()
+
+
+def test_class_qualname_without_co_qualname():
+    assert _class_qualname(Model.static_method()) == "Model.static_method"
+    assert _class_qualname(Model().method()) == "Model.method"
+
+
+@pytest.fixture
+def profiled(database):
+    query_profiler.enable()
+    query_profiler.reset()
+    connection_manager.close_all()  # Reopen through the profiling connection class
+    yield query_profiler
+    query_profiler.enabled = False
+    query_profiler.reset()
+    connection_manager.close_all()
+
+
+def test_statements_are_credited_to_the_public_model_method(profiled):
+    Course.create("Calculus", "", "")
+    Course.get_all()
+    Assignment.get_all()
+
+    callers = {caller for stats in profiled.statements() for caller in stats.callers}
+    assert "models.course.Course.get_all" in callers
+    assert "models.assignment.Assignment.get_all" in callers
+    assert not any(caller.split(".")[-1].startswith("_") for caller in callers)
+    assert not any(caller.startswith("contextlib") for caller in callers)
+
+
+
+def test_executemany_counts_nested_statements_for_every_row(profiled):
+    conn = get_connection()
+    conn.execute("CREATE TABLE audit (value INTEGER)")
+    conn.execute("CREATE TABLE scratch (value INTEGER)")
+    conn.execute("CREATE TRIGGER scratch_audit AFTER INSERT ON scratch "
+                 "BEGIN INSERT INTO audit VALUES (NEW.value); END")
+    conn.execute("INSERT INTO scratch VALUES (0)")
+    [single] = [s for s in profiled.statements() if s.sql == "INSERT INTO scratch VALUES (0)"]
+    assert single.nested > 0
+
+    conn.executemany("INSERT INTO scratch VALUES (?)", ((i,) for i in range(100)))
+    [bulk] = [s for s in profiled.statements() if s.sql == "INSERT INTO scratch VALUES (?)"]
+    assert bulk.count == 1
+    assert bulk.nested == single.nested * 100
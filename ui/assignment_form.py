@@ -7,81 +7,75 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 from models.assignment import Assignment
 from models.course import Course
+from ui.view import ViewFrame
 
 
-class AssignmentFormFrame(tk.Frame):
+class AssignmentFormFrame(ViewFrame):
     """Frame for adding and managing assignments."""
 
     def __init__(self, parent, app, theme_manager):
-        self.app = app
-        self.theme_manager = theme_manager
-        colors = theme_manager.get_colors()
-        super().__init__(parent, bg=colors['bg'])
+        super().__init__(parent, app, theme_manager)
         self.create_widgets()
     
     def create_widgets(self):
         """Create the assignment form layout."""
-        colors = self.theme_manager.get_colors()
-
         # Title
         title = tk.Label(
             self,
             text="Add Assignment",
-            font=("Arial", 18, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['title']
         )
+        self.theme_manager.register(title, bg='bg', fg='fg')
         title.pack(pady=10)
 
         # Form frame
-        form_frame = tk.Frame(self, bg=colors['bg'])
+        form_frame = tk.Frame(self)
+        self.theme_manager.register(form_frame, bg='bg')
         form_frame.pack(pady=20, padx=50, fill="x")
 
         # Assignment title
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Assignment Title:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=0, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=0, column=0, sticky="w", pady=5)
         self.title_entry = tk.Entry(
             form_frame,
-            font=("Arial", 11),
-            width=40,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            font=self.theme_manager.fonts['body'],
+            width=40
         )
+        self.theme_manager.register(self.title_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.title_entry.grid(row=0, column=1, pady=5, padx=10)
         
         # Course selection
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Course:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=1, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=1, column=0, sticky="w", pady=5)
         self.course_var = tk.StringVar()
         self.course_dropdown = ttk.Combobox(
             form_frame,
             textvariable=self.course_var,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.course_dropdown.grid(row=1, column=1, pady=5, padx=10)
         self.load_courses()
 
         # Assignment type
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Type:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=2, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=2, column=0, sticky="w", pady=5)
         self.type_var = tk.StringVar(value="Homework")
         type_options = ["Homework", "Project", "Exam", "Quiz", "Lab", "Reading", "Other"]
         self.type_dropdown = ttk.Combobox(
@@ -89,57 +83,53 @@ class AssignmentFormFrame(tk.Frame):
             textvariable=self.type_var,
             values=type_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.type_dropdown.grid(row=2, column=1, pady=5, padx=10)
 
         # Due date
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Due Date (YYYY-MM-DD):",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=3, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=3, column=0, sticky="w", pady=5)
         self.date_entry = tk.Entry(
             form_frame,
-            font=("Arial", 11),
-            width=40,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            font=self.theme_manager.fonts['body'],
+            width=40
         )
+        self.theme_manager.register(self.date_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.date_entry.grid(row=3, column=1, pady=5, padx=10)
         self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
 
         # Due time
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Due Time (HH:MM):",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=4, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=4, column=0, sticky="w", pady=5)
         self.time_entry = tk.Entry(
             form_frame,
-            font=("Arial", 11),
-            width=40,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            font=self.theme_manager.fonts['body'],
+            width=40
         )
+        self.theme_manager.register(self.time_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.time_entry.grid(row=4, column=1, pady=5, padx=10)
         self.time_entry.insert(0, "23:59")
 
         # Status
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Status:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=5, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=5, column=0, sticky="w", pady=5)
         self.status_var = tk.StringVar(value="Not Started")
         status_options = ["Not Started", "In Progress", "Submitted"]
         self.status_dropdown = ttk.Combobox(
@@ -147,28 +137,26 @@ class AssignmentFormFrame(tk.Frame):
             textvariable=self.status_var,
             values=status_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.status_dropdown.grid(row=5, column=1, pady=5, padx=10)
 
         # Notes
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Notes (optional):",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=6, column=0, sticky="nw", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=6, column=0, sticky="nw", pady=5)
         self.notes_text = tk.Text(
             form_frame,
-            font=("Arial", 10),
+            font=self.theme_manager.fonts['small'],
             width=40,
-            height=4,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            height=4
         )
+        self.theme_manager.register(self.notes_text, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.notes_text.grid(row=6, column=1, pady=5, padx=10)
 
         # Submit button
@@ -176,18 +164,27 @@ class AssignmentFormFrame(tk.Frame):
             form_frame,
             text="Add Assignment",
             command=self.add_assignment,
-            bg=colors['button_primary'],
-            fg=colors['button_fg'],
-            font=("Arial", 11, "bold"),
+            font=self.theme_manager.fonts['body_bold'],
             padx=20,
             pady=8,
             relief="flat"
         )
+        self.theme_manager.register(submit_btn, bg='button_primary', fg='button_fg')
         submit_btn.grid(row=7, column=0, columnspan=2, pady=20)
     
+    def on_show(self):
+        """Reload the course dropdown only if courses changed since it was filled."""
+        if self.needs_reload or self.data_changed('courses'):
+            self.load_courses()
+
     def load_courses(self):
         """Load available courses into the dropdown."""
-        courses = Course.get_all()
+        self.data_changed('courses')  # Mark the current data as seen
+        self.needs_reload = False
+        self.run_in_background(Course.get_all, self.show_courses)
+
+    def show_courses(self, courses):
+        """Fill the dropdown with the loaded courses."""
         if courses:
             course_names = [f"{c.id}: {c.name}" for c in courses]
             self.course_dropdown["values"] = course_names
@@ -230,19 +227,23 @@ class AssignmentFormFrame(tk.Frame):
             messagebox.showerror("Input Error", "Invalid date or time format.\nUse YYYY-MM-DD for date and HH:MM for time.")
             return
         
-        # Save to database
-        try:
-            Assignment.create(course_id, title, type_val, due_datetime, status, notes)
-            messagebox.showinfo("Success", f"Assignment '{title}' added successfully!")
-            
-            # Clear form
-            self.title_entry.delete(0, tk.END)
-            self.date_entry.delete(0, tk.END)
-            self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
-            self.time_entry.delete(0, tk.END)
-            self.time_entry.insert(0, "23:59")
-            self.notes_text.delete("1.0", tk.END)
-            self.status_var.set("Not Started")
-            self.type_var.set("Homework")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add assignment: {str(e)}")
+        # Save on a worker; a locked database must not freeze the window
+        self.save_in_background(
+            lambda: Assignment.create(course_id, title, type_val, due_datetime, status, notes),
+            lambda assignment_id: self.assignment_added(title),
+            "add assignment"
+        )
+
+    def assignment_added(self, title):
+        """Confirm the new assignment and clear the form."""
+        messagebox.showinfo("Success", f"Assignment '{title}' added successfully!")
+
+        # Clear form
+        self.title_entry.delete(0, tk.END)
+        self.date_entry.delete(0, tk.END)
+        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.time_entry.delete(0, tk.END)
+        self.time_entry.insert(0, "23:59")
+        self.notes_text.delete("1.0", tk.END)
+        self.status_var.set("Not Started")
+        self.type_var.set("Homework")
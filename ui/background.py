@@ -0,0 +1,132 @@
+"""
+Background data loading
+Model queries run on a small pool of worker threads (each gets its own
+SQLite connection from the connection manager) and their results are
+handed back to the Tk thread by polling with root.after, so the event
+loop never waits on the database. Writes go through the same pool, and
+model notifications they raise are replayed on the Tk thread
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ui.profiler import ui_profiler
+
+
+class Task:
+    """A submitted load; cancelling it guarantees its callbacks never run."""
+
+    def __init__(self, owner, on_done, on_error):
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        # Profiler span name: the callback that renders the result
+        self.name = getattr(on_done, "__qualname__", "task")
+        self.future = None
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the result; the query is skipped if it hasn't started yet."""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class BackgroundLoader:
+    """Runs functions on worker threads and calls back on the Tk thread."""
+
+    def __init__(self, root, max_workers=2, poll_interval=15):
+        """
+        Args:
+            root: The Tkinter root window, used to schedule result delivery
+            max_workers: Number of worker threads (and database connections)
+            poll_interval: Milliseconds between checks for finished work
+                while any task is pending
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pyhomework-loader")
+        self._results = queue.SimpleQueue()
+        self._pending = set()
+        self._poll_id = None
+        self._tk_thread = threading.get_ident()
+
+    def submit(self, owner, func, on_done, on_error=None):
+        """
+        Run func() on a worker thread.
+
+        on_done(result) or on_error(exception) is later called on the Tk
+        thread, unless the task or its owner is cancelled first.
+        Returns the Task.
+        """
+        task = Task(owner, on_done, on_error)
+        task.future = self._executor.submit(ui_profiler.wrap(f"{task.name} (query)", func))
+        task.future.add_done_callback(lambda future: self._results.put(task))
+        self._pending.add(task)
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+        return task
+
+    def cancel(self, owner):
+        """Cancel every pending task submitted by owner; returns how many there were."""
+        tasks = [t for t in self._pending if t.owner is owner]
+        for task in tasks:
+            task.cancel()
+            self._pending.discard(task)
+        return len(tasks)
+
+    def on_tk_thread(self, callback):
+        """
+        Wrap callback so that calls from worker threads run on the Tk thread.
+
+        Calls made by a submitted function (e.g. model subscribers notified
+        of its write) are delivered before that task's on_done.
+        """
+        def dispatch(*args):
+            if threading.get_ident() == self._tk_thread:
+                callback(*args)
+            else:
+                self._results.put(lambda: callback(*args))
+        return dispatch
+
+    def pending(self):
+        """Number of submitted tasks whose callbacks haven't run yet."""
+        return len(self._pending)
+
+    def _poll(self):
+        """Deliver finished results; keep polling only while work is pending."""
+        self._poll_id = None
+        try:
+            while True:
+                try:
+                    task = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                if not isinstance(task, Task):
+                    task()  # Call queued by on_tk_thread
+                    continue
+                self._pending.discard(task)
+                if task.cancelled or task.future.cancelled():
+                    continue
+                error = task.future.exception()
+                if error is None:
+                    with ui_profiler.span(task.name):
+                        task.on_done(task.future.result())
+                elif task.on_error is not None:
+                    task.on_error(error)
+        finally:
+            # A failing callback must not stop delivery of the other results
+            if self._pending and self._poll_id is None:
+                self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def shutdown(self):
+        """Cancel queued work and wait for running queries to finish."""
+        # Cancelling each task's future drops queued work (like the 3.9+
+        # cancel_futures flag, but available on 3.8)
+        for task in self._pending:
+            task.cancel()
+        self._pending.clear()
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=True)
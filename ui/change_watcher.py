@@ -0,0 +1,90 @@
+"""
+Change notifications for the views
+Polls the query cache's per-table generations, which move on the app's own
+writes and, via PRAGMA data_version and the change_counters table, on
+commits from other processes. The check runs on a background worker, so
+the Tk thread only receives the sets of changed tables. Each poll costs
+one PRAGMA unless something actually changed
+"""
+
+from models.cache import query_cache
+
+
+class ChangeWatcher:
+    """Publishes the set of tables that changed since the previous poll."""
+
+    def __init__(self, root, loader, tables=("assignments", "courses", "user_settings"), interval=1000):
+        """
+        Args:
+            root: The Tkinter root window, used to schedule polls
+            loader: BackgroundLoader the checks run on
+            tables: Tables to watch
+            interval: Milliseconds between polls
+        """
+        self.root = root
+        self.loader = loader
+        self.tables = tables
+        self.interval = interval
+        self._subscribers = []
+        self._generations = {}
+        self._poll_id = None
+
+    def subscribe(self, callback):
+        """
+        Call callback(tables, external) with the sets of changed table names.
+
+        external holds the tables another process changed; the rest were
+        written by this app.
+        """
+        self._subscribers.append(callback)
+
+    def start(self):
+        """Record the current state and begin polling."""
+        self._generations = {table: self._seen(table, check=False) for table in self.tables}
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.interval, self._poll)
+
+    def stop(self):
+        """Stop polling."""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.loader.cancel(self)
+
+    @staticmethod
+    def _seen(table, check=True):
+        return query_cache.generation(table, check), query_cache.external_generation(table)
+
+    def _poll(self):
+        self._poll_id = None
+        self.loader.submit(self, self._check, self._publish, self._check_failed)
+
+    def _check(self):
+        """Compare generations on a worker; returns (changed, external) table sets."""
+        changed, external = set(), set()
+        for table in self.tables:
+            seen = self._seen(table)
+            last = self._generations.get(table)
+            if last != seen:
+                self._generations[table] = seen
+                changed.add(table)
+                if last is None or last[1] != seen[1]:
+                    external.add(table)
+        return changed, external
+
+    def _publish(self, result):
+        changed, external = result
+        try:
+            if changed:
+                for callback in list(self._subscribers):
+                    callback(changed, external)
+        finally:
+            self._schedule()
+
+    def _check_failed(self, error):
+        # A locked or briefly unavailable database is retried on the next poll
+        self._schedule()
+
+    def _schedule(self):
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.interval, self._poll)
@@ -5,80 +5,72 @@ Course form view - add and list courses
 import tkinter as tk
 from tkinter import ttk, messagebox
 from models.course import Course
+from ui.view import ViewFrame
 
 
-class CourseFormFrame(tk.Frame):
+class CourseFormFrame(ViewFrame):
     """Frame for adding courses and viewing the course list."""
 
     def __init__(self, parent, app, theme_manager):
-        self.app = app
-        self.theme_manager = theme_manager
-        colors = theme_manager.get_colors()
-        super().__init__(parent, bg=colors['bg'])
+        super().__init__(parent, app, theme_manager)
         self.create_widgets()
     
     def create_widgets(self):
         """Create the course form layout."""
-        colors = self.theme_manager.get_colors()
-
         # Title
         title = tk.Label(
             self,
             text="Add Course",
-            font=("Arial", 18, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['title']
         )
+        self.theme_manager.register(title, bg='bg', fg='fg')
         title.pack(pady=10)
 
         # Form frame
-        form_frame = tk.Frame(self, bg=colors['bg'])
+        form_frame = tk.Frame(self)
+        self.theme_manager.register(form_frame, bg='bg')
         form_frame.pack(pady=20, padx=50, fill="x")
 
         # Course name
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Course Name:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=0, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=0, column=0, sticky="w", pady=5)
         self.name_entry = tk.Entry(
             form_frame,
-            font=("Arial", 11),
-            width=40,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            font=self.theme_manager.fonts['body'],
+            width=40
         )
+        self.theme_manager.register(self.name_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.name_entry.grid(row=0, column=1, pady=5, padx=10)
 
         # Instructor
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Instructor:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=1, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=1, column=0, sticky="w", pady=5)
         self.instructor_entry = tk.Entry(
             form_frame,
-            font=("Arial", 11),
-            width=40,
-            bg=colors['card_bg'],
-            fg=colors['card_fg'],
-            insertbackground=colors['fg']
+            font=self.theme_manager.fonts['body'],
+            width=40
         )
+        self.theme_manager.register(self.instructor_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
         self.instructor_entry.grid(row=1, column=1, pady=5, padx=10)
 
         # Color (optional visual indicator)
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Color Tag:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=2, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=2, column=0, sticky="w", pady=5)
         self.color_var = tk.StringVar(value="Blue")
         color_options = ["Blue", "Green", "Red", "Orange", "Purple", "Yellow"]
         self.color_dropdown = ttk.Combobox(
@@ -86,7 +78,7 @@ class CourseFormFrame(tk.Frame):
             textvariable=self.color_var,
             values=color_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.color_dropdown.grid(row=2, column=1, pady=5, padx=10)
@@ -96,13 +88,12 @@ class CourseFormFrame(tk.Frame):
             form_frame,
             text="Add Course",
             command=self.add_course,
-            bg=colors['button_success'],
-            fg=colors['button_fg'],
-            font=("Arial", 11, "bold"),
+            font=self.theme_manager.fonts['body_bold'],
             padx=20,
             pady=8,
             relief="flat"
         )
+        self.theme_manager.register(submit_btn, bg='button_success', fg='button_fg')
         submit_btn.grid(row=3, column=0, columnspan=2, pady=20)
 
         # Divider
@@ -112,14 +103,14 @@ class CourseFormFrame(tk.Frame):
         courses_title = tk.Label(
             self,
             text="Existing Courses",
-            font=("Arial", 14, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['heading']
         )
+        self.theme_manager.register(courses_title, bg='bg', fg='fg')
         courses_title.pack(pady=10)
 
         # Scrollable course list
-        self.courses_frame = tk.Frame(self, bg=colors['bg'])
+        self.courses_frame = tk.Frame(self)
+        self.theme_manager.register(self.courses_frame, bg='bg')
         self.courses_frame.pack(fill="both", expand=True, padx=50, pady=10)
 
         self.load_courses()
@@ -134,49 +125,65 @@ class CourseFormFrame(tk.Frame):
             messagebox.showwarning("Input Error", "Please enter a course name.")
             return
         
-        try:
-            Course.create(name, color, instructor)
-            messagebox.showinfo("Success", f"Course '{name}' added successfully!")
-            
-            # Clear form
-            self.name_entry.delete(0, tk.END)
-            self.instructor_entry.delete(0, tk.END)
-            self.color_var.set("Blue")
-            
-            # Refresh course list
-            self.load_courses()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add course: {str(e)}")
+        # Save on a worker; a locked database must not freeze the window
+        self.save_in_background(lambda: Course.create(name, color, instructor),
+                                lambda course_id: self.course_added(name), "add course")
+
+    def course_added(self, name):
+        """Confirm the new course, clear the form and refresh the list."""
+        messagebox.showinfo("Success", f"Course '{name}' added successfully!")
+
+        # Clear form
+        self.name_entry.delete(0, tk.END)
+        self.instructor_entry.delete(0, tk.END)
+        self.color_var.set("Blue")
+
+        # Refresh course list
+        self.load_courses()
     
+    def on_show(self):
+        """Reload the course list only if courses changed since it was built."""
+        if self.needs_reload or self.data_changed('courses'):
+            self.load_courses()
+
     def load_courses(self):
         """Load and display all courses."""
-        colors = self.theme_manager.get_colors()
-
-        # Clear existing course widgets
+        self.data_changed('courses')  # Mark the current data as seen
+        self.needs_reload = False
+        if not self.courses_frame.winfo_children():
+            self.show_message("Loading courses...")
+        self.run_in_background(Course.get_all, self.show_courses)
+
+    def show_message(self, text):
+        """Replace the course list with a muted message."""
         for widget in self.courses_frame.winfo_children():
             widget.destroy()
+        msg = tk.Label(
+            self.courses_frame,
+            text=text,
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(msg, bg='bg', fg='text_muted')
+        msg.pack(pady=20)
 
-        courses = Course.get_all()
-
+    def show_courses(self, courses):
+        """Display the loaded courses."""
         if not courses:
-            msg = tk.Label(
-                self.courses_frame,
-                text="No courses yet.",
-                font=("Arial", 11),
-                bg=colors['bg'],
-                fg=colors['text_muted']
-            )
-            msg.pack(pady=20)
+            self.show_message("No courses yet.")
             return
 
+        # Clear existing course widgets
+        for widget in self.courses_frame.winfo_children():
+            widget.destroy()
+
         # Display each course
         for course in courses:
             course_card = tk.Frame(
                 self.courses_frame,
-                bg=colors['card_bg'],
                 relief="solid",
                 borderwidth=1
             )
+            self.theme_manager.register(course_card, bg='card_bg')
             course_card.pack(fill="x", pady=5)
 
             # Course info
@@ -188,9 +195,8 @@ class CourseFormFrame(tk.Frame):
             course_label = tk.Label(
                 course_card,
                 text=info_text,
-                font=("Arial", 11),
-                bg=colors['card_bg'],
-                fg=colors['card_fg'],
+                font=self.theme_manager.fonts['body'],
                 anchor="w"
             )
+            self.theme_manager.register(course_label, bg='card_bg', fg='card_fg')
             course_label.pack(fill="x", padx=10, pady=8)
@@ -3,261 +3,453 @@ Dashboard view - main screen showing all assignments grouped by urgency
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from models.assignment import Assignment
+import time
+from datetime import datetime
+import startup_trace
 from models.course import Course
-from logic.deadline import categorize_assignment, format_due_datetime, parse_due_datetime
+from models.assignment import Assignment
+from logic.deadline import summarize, load_category, format_due_datetime
 from logic.notifications import NotificationManager
+from ui.virtual_list import VirtualList, RowKind
+from ui.view import ViewFrame
+from ui.profiler import ui_profiler
+
+
+# Dashboard sections in display order; each key is also its theme color role
+CATEGORY_TITLES = (
+    ('overdue', "Overdue"),
+    ('due_today', "Due Today"),
+    ('due_soon', "Due Soon (Next 7 Days)"),
+    ('later', "Later This Semester"),
+)
 
+# Categories depend on the clock, so even unchanged data is reloaded on
+# show once it is this old
+STALE_AFTER_SECONDS = 60
 
-class DashboardFrame(tk.Frame):
+# Search runs once typing pauses for this long
+SEARCH_DEBOUNCE_MS = 250
+SEARCH_LIMIT = 50
+
+
+class DashboardFrame(ViewFrame):
     """Dashboard frame displaying assignments by urgency."""
 
     def __init__(self, parent, app, theme_manager):
-        self.app = app
-        self.theme_manager = theme_manager
-        colors = theme_manager.get_colors()
-        super().__init__(parent, bg=colors['bg'])
+        super().__init__(parent, app, theme_manager)
         self.create_widgets()
     
     def create_widgets(self):
         """Create the dashboard layout."""
-        colors = self.theme_manager.get_colors()
-
         # Title
-        title = tk.Label(
+        self.title_label = tk.Label(
             self,
             text="Assignment Dashboard - Spring 2026",
-            font=("Arial", 18, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['title']
         )
-        title.pack(pady=10)
+        self.theme_manager.register(self.title_label, bg='bg', fg='fg')
+        self.title_label.pack(pady=10)
 
-        # Notification banner
-        self.show_notification_banner()
+        # Notification banner (filled in once the dashboard data has loaded)
+        self.banner = None
 
         # Refresh button
         refresh_btn = tk.Button(
             self,
             text="Refresh",
             command=self.refresh_dashboard,
-            bg=colors['button_primary'],
-            fg=colors['button_fg'],
-            font=("Arial", 10),
+            font=self.theme_manager.fonts['small'],
             padx=10,
             pady=5,
             relief="flat"
         )
+        self.theme_manager.register(refresh_btn, bg='button_primary', fg='button_fg')
         refresh_btn.pack(pady=5)
 
-        # Scrollable frame for assignments
-        canvas = tk.Canvas(self, bg=colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = tk.Frame(canvas, bg=colors['bg'])
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Search box; results replace the categories while it has text
+        search_frame = tk.Frame(self)
+        self.theme_manager.register(search_frame, bg='bg')
+        search_frame.pack(fill="x", padx=20, pady=(0, 5))
+        search_label = tk.Label(
+            search_frame,
+            text="Search:",
+            font=self.theme_manager.fonts['body']
         )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.theme_manager.register(search_label, bg='bg', fg='fg')
+        search_label.pack(side="left")
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self.on_search_typed)
+        search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.search_var,
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(search_entry, bg='card_bg', fg='card_fg', insertbackground='fg')
+        search_entry.pack(side="left", fill="x", expand=True, padx=10)
+        self.search_after = None
+        self.search_task = None
+        self.search_results = None  # (query, assignments) while searching
+
+        # Virtualized list: widgets exist only for rows in view, so the
+        # widget count stays flat no matter how many assignments there are
+        self.collapsed = set()
+        self.now = None
+        self.summary = None
+        self.category_rows = {}
+        self.courses = {}
+        self.load_task = None
+        self.loaded_at = None
+        self.list_view = VirtualList(
+            self,
+            kinds={
+                'header': RowKind(56, self.create_header_row, self.bind_header_row, padx=10, pady=5),
+                'card': RowKind(104, self.create_card_row, self.bind_card_row, padx=20, pady=5,
+                                version=self.card_version),
+                'message': RowKind(130, self.create_message_row, self.bind_message_row, pady=40),
+                'caption': RowKind(32, self.create_caption_row, self.bind_message_row, padx=20),
+            }
+        )
+        self.theme_manager.register(self.list_view, bg='bg')
+        self.theme_manager.register(self.list_view.canvas, bg='bg')
+        self.list_view.pack(fill="both", expand=True)
         
         # Load assignments
         self.load_assignments()
     
     def load_assignments(self):
-        """Load and display all assignments grouped by category."""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Get all assignments and courses
-        assignments = Assignment.get_all()
+        """
+        Load category counts and the rows of every expanded category.
+
+        The queries run on a worker thread; until the first load finishes the
+        list shows a placeholder. The list diffs the new rows against what is
+        rendered by assignment id and row version, so only inserted, moved or
+        edited cards are touched and the scroll position is kept.
+        """
+        self.data_changed('assignments', 'courses', 'user_settings')  # Mark as seen
+        self.needs_reload = False
+        if self.load_task is not None:
+            self.load_task.cancel()  # Superseded by this load
+        if self.summary is None:
+            self.list_view.set_items([('message', 'loading', "Loading assignments...")])
+
+        now = datetime.now()
+        expanded = [category for category, _ in CATEGORY_TITLES if category not in self.collapsed]
+        self.load_task = self.run_in_background(
+            lambda: self.fetch_dashboard(now, expanded),
+            self.show_dashboard
+        )
+
+    @staticmethod
+    def fetch_dashboard(now, categories):
+        """Run every dashboard query; called on a worker thread."""
+        # Counts for every category come from one aggregate query; rows are
+        # then fetched per expanded category with a range query on due date
+        summary = summarize(now)
         courses = {c.id: c for c in Course.get_all()}
-        
-        # Categorize assignments
-        categories = {
-            'overdue': [],
-            'due_today': [],
-            'due_soon': [],
-            'later': []
+        category_rows = {
+            category: load_category(category, now)
+            for category in categories if summary['categories'][category]
         }
-        
-        for assignment in assignments:
-            category = categorize_assignment(assignment.due_datetime)
-            categories[category].append(assignment)
-        
-        # Sort each category by due date
-        for category in categories:
-            categories[category].sort(
-                key=lambda a: parse_due_datetime(a.due_datetime) or datetime.max
-            )
-        
-        # Display each category
-        colors = self.theme_manager.get_colors()
-        self.display_category("Overdue", categories['overdue'], courses, colors['overdue'])
-        self.display_category("Due Today", categories['due_today'], courses, colors['due_today'])
-        self.display_category("Due Soon (Next 7 Days)", categories['due_soon'], courses, colors['due_soon'])
-        self.display_category("Later This Semester", categories['later'], courses, colors['later'])
+
+        banner = None
+        if NotificationManager.should_show_notification():
+            upcoming = NotificationManager.get_upcoming_assignments()
+            if upcoming:
+                banner = (
+                    NotificationManager.format_notification_message(upcoming),
+                    NotificationManager.get_notification_details(upcoming),
+                    len(upcoming)
+                )
+        return now, summary, courses, category_rows, banner
+
+    def show_dashboard(self, result):
+        """Display the results of fetch_dashboard."""
+        self.load_task = None
+        self.loaded_at = time.monotonic()
+        self.now, self.summary, self.courses, self.category_rows, banner = result
+        startup_trace.mark("dashboard data")
+        with ui_profiler.span("dashboard banner"):
+            self.show_notification_banner(banner)
+        with ui_profiler.span("dashboard list"):
+            self.list_view.set_items(self.build_items())
+        if self.search_results is not None:
+            self.run_search()  # Results may have changed too
+
+        # Fetch categories that were expanded while this load was running
+        for category, _ in CATEGORY_TITLES:
+            if (category not in self.collapsed and category not in self.category_rows
+                    and self.summary['categories'][category]):
+                self.load_category_rows(category)
+    
+    def build_items(self):
+        """Build the list rows: a header per non-empty category, then its cards."""
+        if self.search_results is not None:
+            return self.build_search_items()
+
+        counts = self.summary['categories']
+        items = []
+        for category, title in CATEGORY_TITLES:
+            if not counts[category]:
+                continue  # Don't show empty categories
+            collapsed = category in self.collapsed
+            items.append(('header', category, (title, counts[category], collapsed)))
+            if collapsed:
+                continue  # Collapsed categories never load their rows
+            if category not in self.category_rows:
+                # Rows are still loading after the category was expanded
+                items.append(('message', category, "Loading..."))
+                continue
+            items.extend(('card', a.id, a) for a in self.category_rows[category])
         
         # Show message if no assignments
-        if not assignments:
-            colors = self.theme_manager.get_colors()
-            msg = tk.Label(
-                self.scrollable_frame,
-                text="No assignments yet. Add some using the navigation bar!",
-                font=("Arial", 12),
-                bg=colors['bg'],
-                fg=colors['text_muted']
-            )
-            msg.pack(pady=50)
+        if not self.summary['total']:
+            items.append(('message', None, "No assignments yet. Add some using the navigation bar!"))
+        return items
     
-    def display_category(self, title, assignments, courses, color):
-        """Display a category section with its assignments."""
-        if not assignments:
-            return  # Don't show empty categories
-        
-        # Category header
-        header_frame = tk.Frame(self.scrollable_frame, bg=color, height=40)
-        header_frame.pack(fill="x", pady=(10, 0), padx=10)
-        
-        header_label = tk.Label(
+    def build_search_items(self):
+        """Build the list rows for the current search results."""
+        query, results = self.search_results
+        if not results:
+            text = f"No assignments match “{query}”"
+        elif len(results) == SEARCH_LIMIT:
+            text = f"Best {SEARCH_LIMIT} matches for “{query}”"
+        else:
+            text = f"{len(results)} matches for “{query}”"
+        items = [('caption', 'search', text)]
+        items.extend(('card', a.id, a) for a in results)
+        return items
+
+    def on_search_typed(self, *args):
+        """Restart the debounce timer on every keystroke."""
+        if self.search_after is not None:
+            self.after_cancel(self.search_after)
+        self.search_after = self.after(SEARCH_DEBOUNCE_MS, self.run_search)
+
+    def run_search(self):
+        """Search in the background, or go back to the categories if the box is empty."""
+        self.search_after = None
+        if self.search_task is not None:
+            self.search_task.cancel()  # Superseded by this query
+            self.search_task = None
+
+        query = self.search_var.get().strip()
+        if not query:
+            self.search_results = None
+            if self.summary is not None:
+                self.list_view.set_items(self.build_items())
+            return
+
+        self.search_task = self.run_in_background(
+            lambda: Assignment.search(query, SEARCH_LIMIT),
+            lambda results: self.show_search_results(query, results)
+        )
+
+    def show_search_results(self, query, results):
+        """Display the results of a search."""
+        self.search_task = None
+        self.search_results = (query, results)
+        if self.summary is not None:  # Course names arrive with the first load
+            self.list_view.set_items(self.build_items())
+
+    def toggle_category(self, category):
+        """Collapse or expand a category section."""
+        if category in self.collapsed:
+            self.collapsed.discard(category)
+            if category not in self.category_rows:
+                self.load_category_rows(category)
+        else:
+            self.collapsed.add(category)
+        self.list_view.set_items(self.build_items())
+    
+    def create_header_row(self, parent):
+        """Create a reusable category header widget."""
+        header_frame = tk.Frame(parent, height=40, cursor="hand2")
+        header_frame.label = tk.Label(
             header_frame,
-            text=f"{title} ({len(assignments)})",
-            font=("Arial", 14, "bold"),
-            bg=color,
+            font=self.theme_manager.fonts['heading'],
             fg="white",
-            pady=8
+            pady=8,
+            cursor="hand2"
         )
-        header_label.pack(anchor="w", padx=10)
+        header_frame.label.pack(anchor="w", padx=10)
         
-        # Assignment cards
-        for assignment in assignments:
-            self.display_assignment_card(assignment, courses)
+        # Clicking the header toggles the category it is currently bound to
+        toggle = lambda e: self.toggle_category(header_frame.category)
+        header_frame.bind("<Button-1>", toggle)
+        header_frame.label.bind("<Button-1>", toggle)
+        return header_frame
     
-    def display_assignment_card(self, assignment, courses):
-        """Display a single assignment card."""
-        from datetime import datetime
-        colors = self.theme_manager.get_colors()
-
+    def bind_header_row(self, header_frame, item):
+        """Show a category's title, count and collapsed state in a header widget."""
+        _, category, (title, count, collapsed) = item
+        arrow = "▸" if collapsed else "▾"
+        header_frame.category = category
+        # Pooled headers change category, so their color role changes too
+        self.theme_manager.register(header_frame, bg=category)
+        self.theme_manager.register(header_frame.label, bg=category)
+        header_frame.label.config(text=f"{arrow} {title} ({count})")
+    
+    def create_card_row(self, parent):
+        """Create a reusable assignment card widget."""
         # Card frame
         card = tk.Frame(
-            self.scrollable_frame,
-            bg=colors['card_bg'],
+            parent,
             relief="solid",
             borderwidth=1
         )
-        card.pack(fill="x", pady=5, padx=20)
+        self.theme_manager.register(card, bg='card_bg')
 
         # Course name
-        course = courses.get(assignment.course_id)
-        course_name = course.name if course else "Unknown Course"
-
-        course_label = tk.Label(
+        card.course_label = tk.Label(
             card,
-            text=course_name,
-            font=("Arial", 10, "bold"),
-            bg=colors['card_bg'],
-            fg=colors['card_fg']
+            font=self.theme_manager.fonts['small_bold']
         )
-        course_label.pack(anchor="w", padx=10, pady=(5, 0))
+        self.theme_manager.register(card.course_label, bg='card_bg', fg='card_fg')
+        card.course_label.pack(anchor="w", padx=10, pady=(5, 0))
 
         # Assignment title
-        title_label = tk.Label(
+        card.title_label = tk.Label(
             card,
-            text=assignment.title,
-            font=("Arial", 12),
-            bg=colors['card_bg'],
-            fg=colors['card_fg']
+            font=self.theme_manager.fonts['large']
         )
-        title_label.pack(anchor="w", padx=10)
+        self.theme_manager.register(card.title_label, bg='card_bg', fg='card_fg')
+        card.title_label.pack(anchor="w", padx=10)
 
         # Type and due date
-        info_text = f"{assignment.type} • Due: {format_due_datetime(assignment.due_datetime)}"
-        info_label = tk.Label(
+        card.info_label = tk.Label(
             card,
-            text=info_text,
-            font=("Arial", 9),
-            bg=colors['card_bg'],
-            fg=colors['text_muted']
+            font=self.theme_manager.fonts['caption']
         )
-        info_label.pack(anchor="w", padx=10)
+        self.theme_manager.register(card.info_label, bg='card_bg', fg='text_muted')
+        card.info_label.pack(anchor="w", padx=10)
 
         # Status
-        status_label = tk.Label(
+        card.status_label = tk.Label(
             card,
-            text=f"Status: {assignment.status}",
-            font=("Arial", 9),
-            bg=colors['card_bg'],
-            fg=colors['status_color']
+            font=self.theme_manager.fonts['caption']
         )
-        status_label.pack(anchor="w", padx=10, pady=(0, 5))
+        self.theme_manager.register(card.status_label, bg='card_bg', fg='status_color')
+        card.status_label.pack(anchor="w", padx=10, pady=(0, 5))
+        return card
     
-    def show_notification_banner(self):
-        """Display notification banner if there are upcoming assignments."""
-        if not NotificationManager.should_show_notification():
-            return
+    def card_version(self, assignment):
+        """Everything a card displays, so refreshes can skip unchanged cards."""
+        course = self.courses.get(assignment.course_id)
+        return assignment.row_version, course.name if course else None
+    
+    def bind_card_row(self, card, item):
+        """Fill an assignment card widget with an assignment's details."""
+        _, _, assignment = item
+        course = self.courses.get(assignment.course_id)
+        course_name = course.name if course else "Unknown Course"
+        info_text = f"{assignment.type} • Due: {format_due_datetime(assignment.due or assignment.due_datetime)}"
 
-        upcoming = NotificationManager.get_upcoming_assignments()
-        if not upcoming:
-            return
+        card.course_label.config(text=course_name)
+        card.title_label.config(text=assignment.title)
+        card.info_label.config(text=info_text)
+        card.status_label.config(text=f"Status: {assignment.status}")
+    
+    def create_message_row(self, parent):
+        """Create the placeholder message widget."""
+        label = tk.Label(
+            parent,
+            font=self.theme_manager.fonts['large']
+        )
+        self.theme_manager.register(label, bg='bg', fg='text_muted')
+        return label
+    
+    def create_caption_row(self, parent):
+        """Create the one-line caption above search results."""
+        label = tk.Label(
+            parent,
+            font=self.theme_manager.fonts['body_bold'],
+            anchor="w"
+        )
+        self.theme_manager.register(label, bg='bg', fg='text_muted')
+        return label
 
-        colors = self.theme_manager.get_colors()
+    def bind_message_row(self, label, item):
+        """Show a placeholder message."""
+        label.config(text=item[2])
+    
+    def show_notification_banner(self, banner_data):
+        """
+        Display notification banner if there are upcoming assignments.
 
-        # Create notification banner
-        banner = tk.Frame(
+        Args:
+            banner_data: (message, details, upcoming count) from
+                fetch_dashboard, or None for no banner
+        """
+        # Replace any banner from an earlier refresh
+        if self.banner is not None:
+            self.banner.destroy()
+            self.banner = None
+
+        if banner_data is None:
+            return
+        message, details, count = banner_data
+
+        # Create notification banner (kept directly under the title)
+        banner = self.banner = tk.Frame(
             self,
-            bg=colors['notification_bg'],
             relief="solid",
             borderwidth=2,
-            highlightbackground=colors['notification_border'],
             highlightthickness=1
         )
-        banner.pack(fill="x", padx=20, pady=(0, 10))
+        self.theme_manager.register(banner, bg='notification_bg', highlightbackground='notification_border')
+        banner.pack(fill="x", padx=20, pady=(0, 10), after=self.title_label)
 
         # Notification icon and message
-        message = NotificationManager.format_notification_message(upcoming)
         msg_label = tk.Label(
             banner,
             text=f"⚠ {message}",
-            font=("Arial", 11, "bold"),
-            bg=colors['notification_bg'],
-            fg=colors['notification_fg'],
+            font=self.theme_manager.fonts['body_bold'],
             pady=10
         )
+        self.theme_manager.register(msg_label, bg='notification_bg', fg='notification_fg')
         msg_label.pack(anchor="w", padx=15)
 
         # Details
-        details = NotificationManager.get_notification_details(upcoming)
         for detail in details[:3]:  # Show max 3 assignments
             detail_text = f"  • {detail['course']}: {detail['title']} - Due {detail['due']}"
             detail_label = tk.Label(
                 banner,
                 text=detail_text,
-                font=("Arial", 9),
-                bg=colors['notification_bg'],
-                fg=colors['notification_fg'],
+                font=self.theme_manager.fonts['caption'],
                 anchor="w"
             )
+            self.theme_manager.register(detail_label, bg='notification_bg', fg='notification_fg')
             detail_label.pack(anchor="w", padx=15, pady=2)
 
-        if len(upcoming) > 3:
+        if count > 3:
             more_label = tk.Label(
                 banner,
-                text=f"  ... and {len(upcoming) - 3} more",
-                font=("Arial", 9, "italic"),
-                bg=colors['notification_bg'],
-                fg=colors['notification_fg'],
+                text=f"  ... and {count - 3} more",
+                font=self.theme_manager.fonts['caption_italic'],
                 anchor="w",
                 pady=5
             )
+            self.theme_manager.register(more_label, bg='notification_bg', fg='notification_fg')
             more_label.pack(anchor="w", padx=15)
 
     def refresh_dashboard(self):
         """Refresh the dashboard to show updated assignments."""
         self.load_assignments()
+
+    def load_category_rows(self, category):
+        """Fetch the rows of a category that was expanded after the last load."""
+        now = self.now
+
+        def show_rows(rows):
+            # A full reload since then has fetched (or will fetch) them anew
+            if self.now is now:
+                self.category_rows[category] = rows
+                self.list_view.set_items(self.build_items())
+
+        self.run_in_background(lambda: load_category(category, now), show_rows)
+
+    def on_show(self):
+        """Reload when the data changed or the urgency categories may have shifted."""
+        stale = self.loaded_at is not None and time.monotonic() - self.loaded_at > STALE_AFTER_SECONDS
+        if self.needs_reload or stale or self.data_changed('assignments', 'courses', 'user_settings'):
+            self.refresh_dashboard()
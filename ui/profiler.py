@@ -0,0 +1,235 @@
+"""
+UI responsiveness profiler
+Set PYHOMEWORK_PROFILE_UI=1 to measure how long the Tk event loop is kept
+busy. A heartbeat timer measures how late each of its after() callbacks
+runs (the lag the user feels as a hitch), and named spans time view
+construction, view switches, background queries and the callbacks that
+render their results. Timings go into histograms and the slowest spans
+and stalls of the session are kept. F10 toggles an overlay with the
+current numbers; the full report is written to ui_profile.json on exit
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from datetime import datetime
+
+
+ENABLED = os.environ.get("PYHOMEWORK_PROFILE_UI", "") not in ("", "0")
+DUMP_PATH = os.environ.get(
+    "PYHOMEWORK_PROFILE_UI_DUMP",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui_profile.json")
+)
+
+# Heartbeat period, and the lag at which the event loop counts as stalled
+HEARTBEAT_MS = 50
+STALL_MS = float(os.environ.get("PYHOMEWORK_UI_STALL_MS", "100"))
+
+# Slowest spans and stalls kept for the report
+SLOWEST_KEPT = 25
+
+OVERLAY_REFRESH_MS = 500
+
+
+class Histogram:
+    """Counts of durations in fixed millisecond buckets."""
+
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)  # Last bucket: over the top bound
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        """Record one duration."""
+        index = 0
+        while index < len(self.BOUNDS_MS) and ms > self.BOUNDS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (the max past the last bound)."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    def as_dict(self):
+        """JSON-ready summary."""
+        buckets = {f"<={bound}ms": count for bound, count in zip(self.BOUNDS_MS, self.counts) if count}
+        if self.counts[-1]:
+            buckets[f">{self.BOUNDS_MS[-1]}ms"] = self.counts[-1]
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 1),
+            'p50_ms': round(self.percentile(50), 1),
+            'p95_ms': round(self.percentile(95), 1),
+            'max_ms': round(self.max_ms, 1),
+            'buckets': buckets,
+        }
+
+
+class UIProfiler:
+    """Event-loop lag probe and span timings for the app."""
+
+    def __init__(self, enabled=ENABLED):
+        self.enabled = enabled
+        self.lag = Histogram()
+        self.spans = {}
+        self._slowest = []  # Min-heap of (ms, sequence, kind, name, when)
+        self._sequence = 0
+        self._lock = threading.Lock()  # Queries are timed on worker threads
+        self._tk_thread = threading.get_ident()
+        self._last_tk_span = None
+        self.root = None
+        self._beat_id = None
+        self._expected = None
+        self.overlay = None
+        self._overlay_id = None
+
+    @contextmanager
+    def _timed_span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    @contextmanager
+    def _no_span(self):
+        yield
+
+    def span(self, name):
+        """Context manager timing a block as name (does nothing unless enabled)."""
+        return self._timed_span(name) if self.enabled else self._no_span()
+
+    def wrap(self, name, func):
+        """func, timed as span name on every call (unchanged unless enabled)."""
+        if not self.enabled:
+            return func
+
+        def timed(*args, **kwargs):
+            with self._timed_span(name):
+                return func(*args, **kwargs)
+        return timed
+
+    def record(self, name, ms):
+        """Add one span duration."""
+        with self._lock:
+            histogram = self.spans.get(name)
+            if histogram is None:
+                histogram = self.spans[name] = Histogram()
+            histogram.add(ms)
+            if threading.get_ident() == self._tk_thread:
+                self._last_tk_span = name
+        self._keep_if_slow('span', name, ms)
+
+    def _keep_if_slow(self, kind, name, ms):
+        when = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            entry = (ms, self._sequence, kind, name, when)  # Sequence breaks ties
+            self._sequence += 1
+            if len(self._slowest) < SLOWEST_KEPT:
+                heapq.heappush(self._slowest, entry)
+            elif ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def start(self, root):
+        """Begin the heartbeat and bind F10 to the overlay (no-op unless enabled)."""
+        if not self.enabled:
+            return
+        self.root = root
+        self._tk_thread = threading.get_ident()
+        root.bind("<F10>", self.toggle_overlay, add="+")
+        self._schedule_beat()
+
+    def stop(self):
+        """Stop the heartbeat and the overlay."""
+        if self.root is None:
+            return
+        for after_id in (self._beat_id, self._overlay_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._beat_id = self._overlay_id = None
+
+    def _schedule_beat(self):
+        self._expected = time.perf_counter() + HEARTBEAT_MS / 1000
+        self._beat_id = self.root.after(HEARTBEAT_MS, self._beat)
+
+    def _beat(self):
+        # Anything that held the event loop delays this callback
+        lag_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.lag.add(lag_ms)
+        if lag_ms >= STALL_MS:
+            # The span that finished last on the Tk thread most likely caused it
+            self._keep_if_slow('stall', f"event loop stalled (after {self._last_tk_span or 'unknown'})",
+                               lag_ms)
+        self._schedule_beat()
+
+    def slowest(self):
+        """The slowest spans and stalls of the session, slowest first."""
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [{'ms': round(ms, 1), 'kind': kind, 'name': name, 'at': when}
+                for ms, _, kind, name, when in entries]
+
+    def report(self):
+        """The whole session's numbers, JSON-ready."""
+        with self._lock:
+            spans = {name: histogram.as_dict() for name, histogram in
+                     sorted(self.spans.items(), key=lambda item: item[1].total_ms, reverse=True)}
+        return {
+            'heartbeat_ms': HEARTBEAT_MS,
+            'stall_ms': STALL_MS,
+            'event_loop_lag': self.lag.as_dict(),
+            'spans': spans,
+            'slowest': self.slowest(),
+        }
+
+    def dump(self, path=DUMP_PATH):
+        """Write the report to path (no-op unless enabled)."""
+        if not self.enabled:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def toggle_overlay(self, event=None):
+        """Show or hide the overlay in the window's bottom right corner."""
+        if self.overlay is not None:
+            self.root.after_cancel(self._overlay_id)
+            self._overlay_id = None
+            self.overlay.destroy()
+            self.overlay = None
+            return
+        self.overlay = tk.Label(self.root, justify="left", anchor="w", font="TkFixedFont",
+                                bg="black", fg="#00ff00", padx=6, pady=4)
+        self.overlay.place(relx=1.0, rely=1.0, anchor="se")
+        self._refresh_overlay()
+
+    def _refresh_overlay(self):
+        lag = self.lag
+        lines = [f"lag p50 {lag.percentile(50):.0f} ms  p95 {lag.percentile(95):.0f} ms  "
+                 f"max {lag.max_ms:.0f} ms"]
+        for entry in self.slowest()[:5]:
+            lines.append(f"{entry['ms']:>7.1f} ms  {entry['name']}")
+        self.overlay.configure(text="\n".join(lines))
+        self.overlay.lift()
+        self._overlay_id = self.root.after(OVERLAY_REFRESH_MS, self._refresh_overlay)
+
+
+# Shared profiler used by the app and its views
+ui_profiler = UIProfiler()
@@ -0,0 +1,72 @@
+"""
+SQL profiler debug panel
+A window showing the query profiler's report for the running app. Opened
+with F9 when the app is started with PYHOMEWORK_PROFILE_SQL=1
+"""
+
+import tkinter as tk
+from db.database import connection_manager
+from db.profiler import query_profiler
+
+
+class QueryProfilePanel(tk.Toplevel):
+    """Debug window listing the statements the app has run and their timings."""
+
+    def __init__(self, app):
+        super().__init__(app.root)
+        self.app = app
+        self.theme_manager = app.theme_manager
+        self.title("PyHomework - SQL Profile")
+        self.geometry("1000x600")
+        self.theme_manager.register(self, bg='bg')
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Create the button bar and the report text."""
+        buttons_frame = tk.Frame(self)
+        self.theme_manager.register(buttons_frame, bg='bg')
+        buttons_frame.pack(fill="x", padx=10, pady=5)
+
+        for text, command, role in (("Refresh", self.refresh, 'button_primary'),
+                                    ("Reset", self.reset, 'text_muted')):
+            button = tk.Button(
+                buttons_frame,
+                text=text,
+                command=command,
+                font=self.theme_manager.fonts['body'],
+                padx=15,
+                relief="flat"
+            )
+            self.theme_manager.register(button, bg=role, fg='button_fg')
+            button.pack(side="left", padx=5)
+
+        self.text = tk.Text(self, wrap="none", font="TkFixedFont", relief="flat")
+        self.theme_manager.register(self.text, bg='card_bg', fg='card_fg')
+        scrollbar = tk.Scrollbar(self, command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+    def refresh(self):
+        """Rebuild the report; query plans are explained off the Tk thread."""
+        self.app.loader.submit(self, lambda: query_profiler.report(connection_manager.db_path),
+                               self.show_report)
+
+    def show_report(self, report):
+        """Replace the text with report."""
+        if not self.winfo_exists():
+            return
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", report)
+        self.text.configure(state="disabled")
+
+    def reset(self):
+        """Clear the recorded statistics."""
+        query_profiler.reset()
+        self.refresh()
+
+    def destroy(self):
+        self.app.loader.cancel(self)
+        super().destroy()
@@ -5,54 +5,49 @@ Settings form view - user preferences and configuration
 import tkinter as tk
 from tkinter import ttk, messagebox
 from models.settings import Settings
+from ui.view import ViewFrame
 
 
-class SettingsFormFrame(tk.Frame):
+class SettingsFormFrame(ViewFrame):
     """Frame for managing user settings."""
 
     def __init__(self, parent, app, theme_manager):
-        self.app = app
-        self.theme_manager = theme_manager
-        colors = theme_manager.get_colors()
-        super().__init__(parent, bg=colors['bg'])
+        super().__init__(parent, app, theme_manager)
         self.create_widgets()
 
     def create_widgets(self):
         """Create the settings form layout."""
-        colors = self.theme_manager.get_colors()
-
         # Title
         title = tk.Label(
             self,
             text="Settings",
-            font=("Arial", 18, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['title']
         )
+        self.theme_manager.register(title, bg='bg', fg='fg')
         title.pack(pady=10)
 
         # Form frame
-        form_frame = tk.Frame(self, bg=colors['bg'])
+        form_frame = tk.Frame(self)
+        self.theme_manager.register(form_frame, bg='bg')
         form_frame.pack(pady=20, padx=50, fill="x")
 
         # Appearance Section
         appearance_label = tk.Label(
             form_frame,
             text="Appearance",
-            font=("Arial", 14, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['heading']
         )
+        self.theme_manager.register(appearance_label, bg='bg', fg='fg')
         appearance_label.grid(row=0, column=0, columnspan=2, sticky="w", pady=(10, 5))
 
         # Theme selection
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Theme:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=1, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=1, column=0, sticky="w", pady=5)
 
         self.theme_var = tk.StringVar()
         theme_options = ["light", "dark"]
@@ -61,7 +56,7 @@ class SettingsFormFrame(tk.Frame):
             textvariable=self.theme_var,
             values=theme_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.theme_dropdown.grid(row=1, column=1, pady=5, padx=10)
@@ -76,41 +71,39 @@ class SettingsFormFrame(tk.Frame):
         notifications_label = tk.Label(
             form_frame,
             text="Notifications",
-            font=("Arial", 14, "bold"),
-            bg=colors['bg'],
-            fg=colors['fg']
+            font=self.theme_manager.fonts['heading']
         )
+        self.theme_manager.register(notifications_label, bg='bg', fg='fg')
         notifications_label.grid(row=3, column=0, columnspan=2, sticky="w", pady=(10, 5))
 
         # Enable notifications
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Enable Notifications:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=4, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=4, column=0, sticky="w", pady=5)
 
         self.notifications_var = tk.BooleanVar()
         self.notifications_check = tk.Checkbutton(
             form_frame,
-            variable=self.notifications_var,
-            bg=colors['bg'],
-            fg=colors['fg'],
-            activebackground=colors['bg'],
-            activeforeground=colors['fg'],
-            selectcolor=colors['card_bg']
+            variable=self.notifications_var
+        )
+        self.theme_manager.register(
+            self.notifications_check,
+            bg='bg', fg='fg', activebackground='bg', activeforeground='fg', selectcolor='card_bg'
         )
         self.notifications_check.grid(row=4, column=1, sticky="w", pady=5, padx=10)
 
         # Days before due date
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Notify Days Before Due:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=5, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=5, column=0, sticky="w", pady=5)
 
         self.days_var = tk.StringVar()
         days_options = ["1", "2", "3", "5", "7"]
@@ -119,19 +112,19 @@ class SettingsFormFrame(tk.Frame):
             textvariable=self.days_var,
             values=days_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.days_dropdown.grid(row=5, column=1, pady=5, padx=10)
 
         # Notification time
-        tk.Label(
+        label = tk.Label(
             form_frame,
             text="Notification Time:",
-            font=("Arial", 11),
-            bg=colors['bg'],
-            fg=colors['fg']
-        ).grid(row=6, column=0, sticky="w", pady=5)
+            font=self.theme_manager.fonts['body']
+        )
+        self.theme_manager.register(label, bg='bg', fg='fg')
+        label.grid(row=6, column=0, sticky="w", pady=5)
 
         self.time_var = tk.StringVar()
         time_options = ["08:00", "09:00", "10:00", "12:00", "14:00", "16:00", "18:00", "20:00"]
@@ -140,13 +133,14 @@ class SettingsFormFrame(tk.Frame):
             textvariable=self.time_var,
             values=time_options,
             state="readonly",
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             width=37
         )
         self.time_dropdown.grid(row=6, column=1, pady=5, padx=10)
 
         # Buttons frame
-        buttons_frame = tk.Frame(form_frame, bg=colors['bg'])
+        buttons_frame = tk.Frame(form_frame)
+        self.theme_manager.register(buttons_frame, bg='bg')
         buttons_frame.grid(row=7, column=0, columnspan=2, pady=20)
 
         # Save button
@@ -154,13 +148,12 @@ class SettingsFormFrame(tk.Frame):
             buttons_frame,
             text="Save Settings",
             command=self.save_settings,
-            bg=colors['button_success'],
-            fg=colors['button_fg'],
-            font=("Arial", 11, "bold"),
+            font=self.theme_manager.fonts['body_bold'],
             padx=20,
             pady=8,
             relief="flat"
         )
+        self.theme_manager.register(save_btn, bg='button_success', fg='button_fg')
         save_btn.pack(side="left", padx=5)
 
         # Reset button
@@ -168,18 +161,26 @@ class SettingsFormFrame(tk.Frame):
             buttons_frame,
             text="Reset to Defaults",
             command=self.reset_to_defaults,
-            bg=colors['text_muted'],
-            fg=colors['button_fg'],
-            font=("Arial", 11),
+            font=self.theme_manager.fonts['body'],
             padx=20,
             pady=8,
             relief="flat"
         )
+        self.theme_manager.register(reset_btn, bg='text_muted', fg='button_fg')
         reset_btn.pack(side="left", padx=5)
 
         # Load current settings
         self.load_current_settings()
 
+    def on_show(self):
+        """Show the saved settings (served from the in-memory snapshot)."""
+        self.load_current_settings()
+
+    def on_data_changed(self, tables):
+        """Only reload the form (discarding unsaved edits) if settings changed."""
+        if 'user_settings' in tables:
+            self.load_current_settings()
+
     def load_current_settings(self):
         """Load current settings from database."""
         settings = Settings.get_all()
@@ -200,36 +201,26 @@ class SettingsFormFrame(tk.Frame):
     def preview_theme(self, event=None):
         """Preview theme change without saving."""
         new_theme = self.theme_var.get()
+        # Recolors every view in place
         self.theme_manager.switch_theme(new_theme)
-        # Refresh current view to show theme change
-        self.app.show_frame("settings")
 
     def save_settings(self):
         """Save settings to database."""
-        try:
-            # Save theme
-            Settings.set('theme_mode', self.theme_var.get())
-
-            # Save notifications
-            notifications_enabled = 'true' if self.notifications_var.get() else 'false'
-            Settings.set('notifications_enabled', notifications_enabled)
-
-            # Save days before
-            Settings.set('notification_days_before', self.days_var.get())
-
-            # Save notification time
-            Settings.set('notification_time', self.time_var.get())
-
-            # Apply theme
-            self.theme_manager.switch_theme(self.theme_var.get())
-
-            messagebox.showinfo("Success", "Settings saved successfully!")
-
-            # Refresh current view
-            self.app.show_frame("settings")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
+        values = {
+            'theme_mode': self.theme_var.get(),
+            'notifications_enabled': self.notifications_var.get(),
+            'notification_days_before': self.days_var.get(),
+            'notification_time': self.time_var.get()
+        }
+        # All settings in a single transaction, on a worker
+        self.save_in_background(lambda: Settings.set_many(values),
+                                lambda result: self.settings_saved(values['theme_mode']),
+                                "save settings")
+
+    def settings_saved(self, theme):
+        """Apply the saved theme and confirm."""
+        self.theme_manager.switch_theme(theme)
+        messagebox.showinfo("Success", "Settings saved successfully!")
 
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
@@ -239,21 +230,15 @@ class SettingsFormFrame(tk.Frame):
         )
 
         if response:
-            try:
-                # Reset to defaults
-                for key, value in Settings.DEFAULTS.items():
-                    Settings.set(key, value)
-
-                # Reload settings
-                self.load_current_settings()
+            self.save_in_background(lambda: Settings.set_many(Settings.DEFAULTS),
+                                    self.settings_reset, "reset settings")
 
-                # Apply default theme
-                self.theme_manager.switch_theme('light')
-
-                messagebox.showinfo("Success", "Settings reset to defaults!")
+    def settings_reset(self, result):
+        """Show the defaults and apply the default theme."""
+        # Reload settings
+        self.load_current_settings()
 
-                # Refresh current view
-                self.app.show_frame("settings")
+        # Apply default theme
+        self.theme_manager.switch_theme('light')
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to reset settings: {str(e)}")
+        messagebox.showinfo("Success", "Settings reset to defaults!")
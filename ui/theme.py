@@ -4,7 +4,9 @@ Handles light/dark mode switching and color schemes
 """
 
 import tkinter as tk
-from tkinter import ttk
+import weakref
+from tkinter import ttk, font as tkfont
+from ui.profiler import ui_profiler
 
 
 class ThemeManager:
@@ -55,6 +57,19 @@ class ThemeManager:
         }
     }
 
+    # Shared named fonts; widgets reference these instead of font tuples
+    FONTS = {
+        'title': ("Arial", 18, "bold"),
+        'heading': ("Arial", 14, "bold"),
+        'large': ("Arial", 12),
+        'body': ("Arial", 11),
+        'body_bold': ("Arial", 11, "bold"),
+        'small': ("Arial", 10),
+        'small_bold': ("Arial", 10, "bold"),
+        'caption': ("Arial", 9),
+        'caption_italic': ("Arial", 9, "italic"),
+    }
+
     def __init__(self, root, initial_theme='light'):
         """
         Initialize the theme manager.
@@ -65,6 +80,18 @@ class ThemeManager:
         """
         self.root = root
         self.current_theme = initial_theme
+        # Themed widget -> {option: color role}; entries vanish with the widget
+        self._widgets = weakref.WeakKeyDictionary()
+        self.fonts = {
+            name: tkfont.Font(
+                root=root,
+                family=family,
+                size=size,
+                weight="bold" if "bold" in style else "normal",
+                slant="italic" if "italic" in style else "roman"
+            )
+            for name, (family, size, *style) in self.FONTS.items()
+        }
         self.configure_ttk_styles()
 
     def get_colors(self):
@@ -122,10 +149,39 @@ class ThemeManager:
         Args:
             new_theme: New theme name ('light' or 'dark')
         """
-        if new_theme in self.THEMES:
+        if new_theme not in self.THEMES or new_theme == self.current_theme:
+            return
+        with ui_profiler.span("switch theme"):
             self.current_theme = new_theme
             self.configure_ttk_styles()
 
+            # Recolor every live themed widget in place, one configure call each
+            colors = self.get_colors()
+            for widget, roles in list(self._widgets.items()):
+                self._apply(widget, roles, colors)
+
+    def register(self, widget, **roles):
+        """
+        Color a widget from theme roles, now and after every theme switch.
+
+        Args:
+            widget: Any Tk widget
+            **roles: Widget option -> color role, e.g. bg='card_bg', fg='text_muted'.
+                Registering a widget again replaces its roles.
+
+        Returns the widget.
+        """
+        self._widgets[widget] = roles
+        self._apply(widget, roles, self.get_colors())
+        return widget
+
+    def _apply(self, widget, roles, colors):
+        """Set a widget's color options; forget widgets that were destroyed."""
+        try:
+            widget.configure(**{option: colors[role] for option, role in roles.items()})
+        except tk.TclError:
+            self._widgets.pop(widget, None)
+
     def get_theme_name(self):
         """Get the current theme name."""
         return self.current_theme
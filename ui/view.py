@@ -0,0 +1,78 @@
+"""
+Base class for the app's top-level views
+Views are created once and kept alive; the app calls on_show/on_hide as
+the user switches between them
+"""
+
+import tkinter as tk
+from tkinter import messagebox
+from models.cache import query_cache
+
+
+class ViewFrame(tk.Frame):
+    """A cached top-level view with show/hide lifecycle hooks."""
+
+    def __init__(self, parent, app, theme_manager):
+        self.app = app
+        self.theme_manager = theme_manager
+        self._seen_generations = {}
+        self.needs_reload = False  # Set when a pending load was cancelled
+        super().__init__(parent)
+        theme_manager.register(self, bg='bg')
+
+    def on_show(self):
+        """Called every time the view is raised; refresh stale data here."""
+
+    def on_data_changed(self, tables):
+        """
+        Called while the view is showing when tables changed in the database.
+
+        By default this re-runs on_show, whose data_changed() checks decide
+        whether anything this view displays needs reloading.
+        """
+        self.on_show()
+
+    def on_hide(self):
+        """Called when another view replaces this one; drops its pending loads."""
+        if self.app.loader.cancel(self):
+            self.needs_reload = True
+
+    def run_in_background(self, func, on_done, on_error=None):
+        """
+        Run a model query off the Tk thread and pass its result to on_done.
+
+        The load is cancelled if the user navigates away before it finishes.
+        Returns the loader Task.
+        """
+        return self.app.loader.submit(self, func, on_done, on_error or self.show_load_error)
+
+    def save_in_background(self, func, on_done, action):
+        """
+        Run a model write off the Tk thread and pass its result to on_done.
+
+        Unlike loads, writes are never cancelled when the view is hidden.
+        A failure is reported as "Failed to <action>". Returns the loader Task.
+        """
+        def show_error(error):
+            messagebox.showerror("Error", f"Failed to {action}: {error}")
+        return self.app.loader.submit(self.app, func, on_done, show_error)
+
+    def show_load_error(self, error):
+        """Report a failed background load."""
+        messagebox.showerror("Error", f"Failed to load data: {error}")
+
+    def data_changed(self, *tables):
+        """
+        Check whether any of tables changed since the last call.
+
+        Always True the first time. Uses the query cache's per-table
+        generation counters without querying the database; other processes'
+        writes reach them through the app's ChangeWatcher.
+        """
+        changed = False
+        for table in tables:
+            generation = query_cache.generation(table, check=False)
+            if self._seen_generations.get(table) != generation:
+                self._seen_generations[table] = generation
+                changed = True
+        return changed
@@ -0,0 +1,225 @@
+"""
+Virtualized scrolling list
+Only the rows in (or near) the viewport have widgets; as the list scrolls,
+those widgets are moved and re-bound to other rows instead of creating
+new ones. Updates are diffed by row key so unchanged rows are left alone
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from bisect import bisect_right
+
+
+# Marks a pooled widget that isn't showing any row's data yet
+_UNBOUND = object()
+
+
+class RowKind:
+    """How to build and fill one kind of row (header, card, ...)."""
+
+    def __init__(self, height, create, bind, padx=0, pady=0, version=None):
+        """
+        Args:
+            height: Total row height in pixels, including vertical padding
+            create: create(parent) -> widget, called only when the pool is empty
+            bind: bind(widget, item) fills a pooled widget with an item's data
+            padx, pady: Space around the widget inside its row
+            version: version(data) -> comparable value that changes whenever
+                the row's displayed content would; defaults to data itself
+        """
+        self.height = height
+        self.create = create
+        self.bind = bind
+        self.padx = padx
+        self.pady = pady
+        self.version = version or (lambda data: data)
+
+
+class VirtualList(tk.Frame):
+    """
+    Scrollable list of fixed-height rows that recycles its row widgets.
+
+    Items are (kind, key, data) tuples; kind selects a RowKind and
+    (kind, key) identifies the row across updates. The number of live
+    widgets is bounded by the viewport height plus the overscan, no matter
+    how many items the list holds.
+    """
+
+    def __init__(self, parent, kinds, bg=None, overscan=3):
+        super().__init__(parent, bg=bg)
+        self.kinds = kinds
+        self.overscan = overscan
+        self.items = []
+        self._offsets = []       # y position of each item's row
+        self._total_height = 0
+        self._index = {}         # (kind, key) -> item index
+        self._versions = {}      # (kind, key) -> version of the item's data
+        self._visible = {}       # (kind, key) -> [widget, canvas window, bound version, y]
+        self._pools = {kind: [] for kind in kinds}
+        self._refresh_pending = False
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.bind_wheel(self.canvas)
+
+    def set_items(self, items):
+        """
+        Replace the list contents, touching only rows that changed.
+
+        Rows are matched by (kind, key). On screen, a row whose version is
+        unchanged keeps its widget and is at most moved; only new or changed
+        rows are re-bound. The scroll position stays anchored to the first
+        visible row when rows are inserted or removed above it.
+
+        Returns a dict counting inserted, removed, moved and changed rows.
+        """
+        anchor = self._scroll_anchor()
+        old_index, old_versions = self._index, self._versions
+
+        self.items = list(items)
+        self._index = {}
+        self._versions = {}
+        for index, (kind, key, data) in enumerate(self.items):
+            self._index[(kind, key)] = index
+            self._versions[(kind, key)] = self.kinds[kind].version(data)
+
+        stats = {'inserted': 0, 'removed': 0, 'moved': 0, 'changed': 0}
+        for row_key, index in self._index.items():
+            if row_key not in old_index:
+                stats['inserted'] += 1
+            elif old_versions[row_key] != self._versions[row_key]:
+                stats['changed'] += 1
+            elif old_index[row_key] != index:
+                stats['moved'] += 1
+        stats['removed'] = len(old_index.keys() - self._index.keys())
+
+        self._layout()
+        self._restore_anchor(anchor)
+        self._refresh()
+        return stats
+
+    def _layout(self):
+        """Compute each row's y offset and the scrollable height."""
+        self._offsets = []
+        y = 0
+        for kind, _, _ in self.items:
+            self._offsets.append(y)
+            y += self.kinds[kind].height
+        self._total_height = y
+        self.canvas.configure(scrollregion=(0, 0, 0, y))
+
+    def _scroll_anchor(self):
+        """The first row in view and how far the viewport top is into it."""
+        if not self.items:
+            return None
+        top = self.canvas.canvasy(0)
+        index = max(bisect_right(self._offsets, top) - 1, 0)
+        kind, key, _ = self.items[index]
+        return (kind, key), top - self._offsets[index]
+
+    def _restore_anchor(self, anchor):
+        """Scroll so the anchored row sits where it was before an update."""
+        if anchor is None or anchor[0] not in self._index or not self._total_height:
+            return
+        row_key, delta = anchor
+        top = self._offsets[self._index[row_key]] + delta
+        self.canvas.yview_moveto(top / self._total_height)
+
+    def _visible_range(self):
+        """Indexes of the items that should have widgets right now."""
+        if not self.items:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(bisect_right(self._offsets, top) - 1 - self.overscan, 0)
+        last = min(bisect_right(self._offsets, bottom) + self.overscan, len(self.items))
+        return range(first, last)
+
+    def _refresh(self):
+        """Attach pooled widgets to the rows now in view and detach the rest."""
+        self._refresh_pending = False
+        wanted = {}
+        for index in self._visible_range():
+            kind, key, _ = self.items[index]
+            wanted[(kind, key)] = index
+
+        for row_key in [k for k in self._visible if k not in wanted]:
+            self._release(row_key)
+
+        width = self.canvas.winfo_width()
+        for row_key, index in wanted.items():
+            kind_name = row_key[0]
+            kind = self.kinds[kind_name]
+            version = self._versions[row_key]
+            y = self._offsets[index] + kind.pady
+
+            entry = self._visible.get(row_key)
+            if entry is None:
+                if self._pools[kind_name]:
+                    widget, window = self._pools[kind_name].pop()
+                else:
+                    widget = kind.create(self.canvas)
+                    self.bind_wheel(widget)
+                    window = self.canvas.create_window(
+                        0, 0, anchor="nw", window=widget,
+                        height=kind.height - 2 * kind.pady
+                    )
+                    self.canvas.itemconfigure(window, width=max(width - 2 * kind.padx, 1))
+                entry = self._visible[row_key] = [widget, window, _UNBOUND, None]
+
+            # Only new or changed rows are re-bound; unchanged ones at most move
+            widget, window, bound_version, bound_y = entry
+            if bound_version is _UNBOUND or bound_version != version:
+                kind.bind(widget, self.items[index])
+                entry[2] = version
+            if bound_y != y:
+                self.canvas.coords(window, kind.padx, y)
+                entry[3] = y
+
+    def _release(self, row_key):
+        """Return a row's widget to its pool, parked outside the scroll region."""
+        widget, window, _, _ = self._visible.pop(row_key)
+        self.canvas.coords(window, 0, -10000)
+        self._pools[row_key[0]].append((widget, window))
+
+    def _schedule_refresh(self):
+        """Coalesce bursts of scroll events into one refresh."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_configure(self, event):
+        # Row widgets follow the canvas width
+        for row_key, (_, window, _, _) in self._visible.items():
+            padx = self.kinds[row_key[0]].padx
+            self.canvas.itemconfigure(window, width=max(event.width - 2 * padx, 1))
+        for kind_name, pool in self._pools.items():
+            padx = self.kinds[kind_name].padx
+            for _, window in pool:
+                self.canvas.itemconfigure(window, width=max(event.width - 2 * padx, 1))
+        self._schedule_refresh()
+
+    def bind_wheel(self, widget):
+        """Scroll the list with the mouse wheel while over widget or its children."""
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            self.bind_wheel(child)
+
+    def _on_wheel(self, event):
+        if self._total_height <= self.canvas.winfo_height():
+            return
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-3, "units")
+        else:
+            self.canvas.yview_scroll(3, "units")